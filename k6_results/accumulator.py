@@ -0,0 +1,177 @@
+import math
+from array import array
+
+import numpy as np
+
+from .sketch import LogHistogram
+
+DEFAULT_PERCENTILES = (50, 90, 95, 99, 99.9)
+
+
+class StreamingStats:
+    """Agregat berukuran tetap untuk satu metrik.
+
+    Menyimpan count/sum/min/max dan varians berjalan (Welford) serta
+    ``LogHistogram`` untuk kuantil, sehingga memori tidak bertambah
+    berapa pun jumlah titik dalam file hasil k6.
+    """
+
+    __slots__ = ("count", "total", "mean", "m2", "min", "max", "sketch")
+
+    def __init__(self, relative_accuracy=0.01):
+        self.count = 0
+        self.total = 0.0
+        self.mean = 0.0
+        self.m2 = 0.0
+        self.min = None
+        self.max = None
+        self.sketch = LogHistogram(relative_accuracy)
+
+    def __getstate__(self):
+        return {slot: getattr(self, slot) for slot in self.__slots__}
+
+    def __setstate__(self, state):
+        for slot, value in state.items():
+            setattr(self, slot, value)
+
+    def __len__(self):
+        return self.count
+
+    def to_dict(self):
+        state = {slot: getattr(self, slot) for slot in self.__slots__}
+        state['sketch'] = self.sketch.to_dict()
+        return state
+
+    @classmethod
+    def from_dict(cls, data):
+        stats = cls.__new__(cls)
+        for slot in cls.__slots__:
+            setattr(stats, slot, data[slot])
+        stats.sketch = LogHistogram.from_dict(data['sketch'])
+        return stats
+
+    def add(self, value):
+        self.count += 1
+        self.total += value
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self.m2 += delta * (value - self.mean)
+        if self.min is None or value < self.min:
+            self.min = value
+        if self.max is None or value > self.max:
+            self.max = value
+        self.sketch.add(value)
+
+    append = add
+
+    def extend(self, values):
+        values = np.asarray(values, dtype=np.float64)
+        if values.size == 0:
+            return
+        batch = StreamingStats.__new__(StreamingStats)
+        batch.count = int(values.size)
+        batch.total = float(values.sum())
+        batch.mean = batch.total / batch.count
+        batch.m2 = float(((values - batch.mean) ** 2).sum())
+        batch.min = float(values.min())
+        batch.max = float(values.max())
+        batch.sketch = LogHistogram(self.sketch.relative_accuracy)
+        batch.sketch.add_many(values)
+        self.merge(batch)
+
+    def merge(self, other):
+        if other.count == 0:
+            return self
+        if self.count == 0:
+            self.count = other.count
+            self.total = other.total
+            self.mean = other.mean
+            self.m2 = other.m2
+            self.min = other.min
+            self.max = other.max
+            self.sketch.merge(other.sketch)
+            return self
+        count = self.count + other.count
+        delta = other.mean - self.mean
+        self.mean += delta * other.count / count
+        self.m2 += other.m2 + delta * delta * self.count * other.count / count
+        self.count = count
+        self.total += other.total
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+        self.sketch.merge(other.sketch)
+        return self
+
+    @property
+    def variance(self):
+        return self.m2 / self.count if self.count else 0.0
+
+    @property
+    def std_dev(self):
+        return math.sqrt(self.variance)
+
+    def quantile(self, q):
+        value = self.sketch.quantile(q)
+        if value is None:
+            return None
+        return min(max(value, self.min), self.max)
+
+
+def new_sample_buffer():
+    return array('d')
+
+
+def extend_sample_buffer(buffer, values):
+    buffer.frombytes(np.ascontiguousarray(values, dtype=np.float64).tobytes())
+
+
+def as_ndarray(values):
+    if isinstance(values, array) and values.typecode == 'd':
+        return np.frombuffer(values, dtype=np.float64)
+    return np.asarray(values, dtype=np.float64)
+
+
+def summarize(values):
+    if isinstance(values, StreamingStats):
+        if not values.count:
+            return None
+        return values.mean, values.min, values.max, values.std_dev
+
+    if not len(values):
+        return None
+    samples = as_ndarray(values)
+    return float(samples.mean()), float(samples.min()), float(samples.max()), float(samples.std())
+
+
+def total_of(values):
+    if isinstance(values, StreamingStats):
+        return values.total
+    return float(as_ndarray(values).sum())
+
+
+def percentiles_of(values, percentiles):
+    if isinstance(values, StreamingStats):
+        return [values.quantile(p / 100) for p in percentiles]
+
+    if not len(values):
+        return [None for _ in percentiles]
+    return np.percentile(as_ndarray(values), percentiles).tolist()
+
+
+def combine_samples(parts):
+    parts = [samples for samples in parts if samples is not None and len(samples)]
+    if not parts:
+        return None
+    if len(parts) == 1:
+        return parts[0]
+
+    if isinstance(parts[0], StreamingStats):
+        combined = StreamingStats(parts[0].sketch.relative_accuracy)
+        for samples in parts:
+            combined.merge(samples)
+        return combined
+
+    combined = new_sample_buffer()
+    for samples in parts:
+        combined.extend(samples)
+    return combined
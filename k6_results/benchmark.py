@@ -0,0 +1,81 @@
+"""Membandingkan biaya per baris pembentukan kunci metrik.
+
+Jalankan dari root repositori::
+
+    python -m k6_results.benchmark [load-test-results.json]
+
+Tanpa argumen, pasangan (grup, metrik) sintetis dari kedua skenario dipakai.
+"""
+import re
+import sys
+import timeit
+
+from .compression import open_results
+from .decoder import PointFilter, iter_points
+from .interning import KeyInterner
+
+SAMPLE_GROUPS = [
+    "::Step 1: Get Categories",
+    "::Step 2: Get Units",
+    "::Step 3: Search Media Items",
+    "::Step 4: Get Media Item Detail",
+    "::Step 5: Increment View Count",
+    "::Step 1: SSO Login",
+    "::Step 1: SSO Login::Step 2: Upload Files",
+    "::Step 1: SSO Login::Step 2: Upload Files::Step 3: Create Media Item",
+    "",
+]
+SAMPLE_METRICS = ["http_req_duration", "http_req_failed", "http_reqs", "iterations"]
+
+
+def legacy_key(group, metric_name):
+    step_name = None
+    if group and '::Step ' in group:
+        step_match = re.search(r'::Step \d+: (.+)', group)
+        if step_match:
+            step_name = step_match.group(1)
+    return f"{step_name}_{metric_name}" if step_name else metric_name
+
+
+def synthetic_pairs(count):
+    combinations = [(group, metric) for group in SAMPLE_GROUPS for metric in SAMPLE_METRICS]
+    return [combinations[i % len(combinations)] for i in range(count)]
+
+
+def file_pairs(path, limit):
+    pairs = []
+    with open_results(path) as f:
+        for metric_name, point_data in iter_points(f, PointFilter(lambda name: True)):
+            tags = point_data.get('tags') or {}
+            pairs.append((tags.get('group', ''), metric_name))
+            if len(pairs) >= limit:
+                break
+    return pairs
+
+
+def measure(pairs, repeat=5):
+    legacy = min(timeit.repeat(lambda: [legacy_key(group, metric) for group, metric in pairs],
+                               number=1, repeat=repeat))
+
+    lookup = KeyInterner().lookup
+    interned = min(timeit.repeat(lambda: [lookup(group, metric) for group, metric in pairs],
+                                 number=1, repeat=repeat))
+    return legacy / len(pairs) * 1e9, interned / len(pairs) * 1e9
+
+
+def main():
+    if len(sys.argv) > 1:
+        pairs = file_pairs(sys.argv[1], 500000)
+        print(f"{len(pairs)} titik dibaca dari {sys.argv[1]}")
+    else:
+        pairs = synthetic_pairs(500000)
+        print(f"{len(pairs)} titik sintetis")
+
+    legacy_ns, interned_ns = measure(pairs)
+    print(f"regex + f-string : {legacy_ns:8.1f} ns/baris")
+    print(f"kunci ter-intern : {interned_ns:8.1f} ns/baris")
+    print(f"percepatan       : {legacy_ns / interned_ns:8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,253 @@
+import hashlib
+import json
+import os
+from array import array
+
+import numpy as np
+
+from .correlation import BYTES_TAG, CORRELATION_TAG
+from .decoder import PointFilter, iter_points
+from .timeline import parse_k6_time
+
+CACHE_VERSION = 3
+CACHE_SUFFIX = '.k6cache'
+FINGERPRINT_SAMPLE_SIZE = 1024 * 1024
+
+COLUMN_TYPES = {
+    'metric': ('H', np.uint16),
+    'tagset': ('I', np.uint32),
+    'time': ('d', np.float64),
+    'value': ('d', np.float64),
+    'vu': ('i', np.int32),
+    'iter': ('i', np.int32),
+    'ref': ('i', np.int32),
+    'bytes': ('d', np.float64),
+}
+METADATA_COLUMNS = frozenset(['vu', 'iter', CORRELATION_TAG, BYTES_TAG])
+
+
+def _every_metric(metric_name):
+    return True
+
+
+def _as_int(value):
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return -1
+
+
+def _as_float(value):
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return np.nan
+
+
+class ColumnBuilder:
+    """Mengumpulkan semua titik k6 ke kolom biner dengan nama metrik dan
+    kumpulan tag yang di-intern menjadi id bilangan bulat.
+
+    VU, iterasi, ``upload_ref``, dan ``chunk_bytes`` unik per titik/operasi,
+    sehingga disimpan sebagai kolom sendiri dan tidak memecah kumpulan tag.
+    """
+
+    def __init__(self):
+        self.metric_ids = {}
+        self.metric_names = []
+        self.tagset_ids = {}
+        self.tagsets = []
+        self.ref_ids = {}
+        self.refs = []
+        self.columns = {name: array(code) for name, (code, _) in COLUMN_TYPES.items()}
+        self.lines = 0
+
+    def consume(self, lines):
+        point_filter = PointFilter(_every_metric)
+        for metric_name, point_data in iter_points(lines, point_filter):
+            self.add_point(metric_name, point_data)
+        self.lines += point_filter.lines
+        return self
+
+    def add_point(self, metric_name, point_data):
+        metric_id = self.metric_ids.get(metric_name)
+        if metric_id is None:
+            metric_id = self.metric_ids[metric_name] = len(self.metric_names)
+            self.metric_names.append(metric_name)
+
+        tags = point_data.get('tags') or {}
+        metadata = point_data.get('metadata') or {}
+        vu = metadata.get('vu', tags.get('vu'))
+        iteration = metadata.get('iter', tags.get('iter'))
+        ref = metadata.get(CORRELATION_TAG, tags.get(CORRELATION_TAG))
+        chunk_bytes = metadata.get(BYTES_TAG, tags.get(BYTES_TAG))
+        if not METADATA_COLUMNS.isdisjoint(tags):
+            tags = {name: value for name, value in tags.items() if name not in METADATA_COLUMNS}
+
+        if ref is None:
+            ref_id = -1
+        else:
+            ref_id = self.ref_ids.get(ref)
+            if ref_id is None:
+                ref_id = self.ref_ids[ref] = len(self.refs)
+                self.refs.append(ref)
+
+        tag_key = tuple(sorted(tags.items()))
+        tagset_id = self.tagset_ids.get(tag_key)
+        if tagset_id is None:
+            tagset_id = self.tagset_ids[tag_key] = len(self.tagsets)
+            self.tagsets.append(dict(tags))
+
+        columns = self.columns
+        columns['metric'].append(metric_id)
+        columns['tagset'].append(tagset_id)
+        columns['time'].append(parse_k6_time(point_data['time']))
+        columns['value'].append(point_data['value'])
+        columns['vu'].append(_as_int(vu) if vu is not None else -1)
+        columns['iter'].append(_as_int(iteration) if iteration is not None else -1)
+        columns['ref'].append(ref_id)
+        columns['bytes'].append(_as_float(chunk_bytes) if chunk_bytes is not None else np.nan)
+
+    def to_columns(self):
+        arrays = {name: np.frombuffer(self.columns[name], dtype=dtype) if len(self.columns[name]) else np.empty(0, dtype)
+                  for name, (_, dtype) in COLUMN_TYPES.items()}
+        return PointColumns(self.metric_names, self.tagsets, arrays, self.lines, self.refs)
+
+
+class PointColumns:
+    def __init__(self, metric_names, tagsets, arrays, lines=0, refs=()):
+        self.metric_names = metric_names
+        self.tagsets = tagsets
+        self.arrays = arrays
+        self.lines = lines
+        self.refs = list(refs)
+
+    def __len__(self):
+        return len(self.arrays['time'])
+
+    def _tagset_groups(self):
+        # id kumpulan tag → id grup k6, beserta daftar nama grupnya
+        group_names, group_ids = [], {}
+        tagset_groups = np.empty(max(len(self.tagsets), 1), dtype=np.int64)
+        for tagset_id, tags in enumerate(self.tagsets):
+            group = tags.get('group', '')
+            group_id = group_ids.get(group)
+            if group_id is None:
+                group_id = group_ids[group] = len(group_names)
+                group_names.append(group)
+            tagset_groups[tagset_id] = group_id
+        return group_names, tagset_groups
+
+    def replay(self, aggregator):
+        """Memutar ulang titik ke ``aggregator`` per (metrik, grup k6).
+
+        Tag berkardinalitas tinggi seperti ``url`` tidak memecah batch; kumpulan
+        tag lengkap hanya diteruskan ke konsumen yang membutuhkannya (tabel
+        endpoint dan taksonomi error) lewat ``add_tagged_batch``.
+        """
+        relevant_ids = [metric_id for metric_id, name in enumerate(self.metric_names)
+                        if aggregator.is_relevant(name)]
+        metric = self.arrays['metric']
+        selected = np.flatnonzero(np.isin(metric, relevant_ids))
+
+        group_names, tagset_groups = self._tagset_groups()
+        tagset_ids = self.arrays['tagset'][selected]
+        combined = (metric[selected].astype(np.int64) << 32) | tagset_groups[tagset_ids]
+        order = np.argsort(combined, kind='stable')
+        selected = selected[order]
+        combined = combined[order]
+        tagset_ids = tagset_ids[order]
+        times = self.arrays['time'][selected]
+        values = self.arrays['value'][selected]
+
+        group_keys, starts = np.unique(combined, return_index=True)
+        ends = np.append(starts[1:], len(combined))
+        for group_key, start, end in zip(group_keys.tolist(), starts.tolist(), ends.tolist()):
+            metric_name = self.metric_names[group_key >> 32]
+            if aggregator.is_correlated(metric_name):
+                refs = self._refs(selected[start:end])
+                chunk_bytes = self.arrays['bytes'][selected[start:end]]
+            else:
+                refs = chunk_bytes = None
+            aggregator.add_batch(metric_name, group_names[group_key & 0xFFFFFFFF],
+                                 times[start:end], values[start:end], refs, chunk_bytes)
+            if aggregator.needs_tags(metric_name):
+                aggregator.add_tagged_batch(metric_name, self.tagsets, tagset_ids[start:end],
+                                            times[start:end], values[start:end])
+
+        aggregator.lines += self.lines
+        return aggregator
+
+    def _refs(self, indexes):
+        refs = self.refs
+        return [_ref_of(refs, ref_id, vu, iteration) for ref_id, vu, iteration in
+                zip(self.arrays['ref'][indexes].tolist(), self.arrays['vu'][indexes].tolist(),
+                    self.arrays['iter'][indexes].tolist())]
+
+
+def _ref_of(refs, ref_id, vu, iteration):
+    if ref_id >= 0:
+        return refs[ref_id]
+    if vu >= 0 and iteration >= 0:
+        return f"{vu}:{iteration}"
+    return None
+
+
+def cache_dir_for(path):
+    return path + CACHE_SUFFIX
+
+
+def fingerprint(path):
+    stat = os.stat(path)
+    digest = hashlib.blake2b(digest_size=16)
+    with open(path, 'rb') as f:
+        digest.update(f.read(FINGERPRINT_SAMPLE_SIZE))
+        if stat.st_size > FINGERPRINT_SAMPLE_SIZE:
+            f.seek(max(stat.st_size - FINGERPRINT_SAMPLE_SIZE, FINGERPRINT_SAMPLE_SIZE))
+            digest.update(f.read())
+    return {'size': stat.st_size, 'mtime_ns': stat.st_mtime_ns, 'hash': digest.hexdigest()}
+
+
+def load_cache(path):
+    cache_dir = cache_dir_for(path)
+    meta_file = os.path.join(cache_dir, 'meta.json')
+    if not os.path.exists(meta_file):
+        return None
+
+    try:
+        with open(meta_file, 'r') as f:
+            meta = json.load(f)
+        if meta.get('version') != CACHE_VERSION or meta.get('source') != fingerprint(path):
+            print("Cache kolumnar sudah usang, file sumber akan diproses ulang")
+            return None
+        arrays = {name: np.load(os.path.join(cache_dir, f"{name}.npy"), mmap_mode='r') for name in COLUMN_TYPES}
+    except (OSError, ValueError) as e:
+        print(f"Cache kolumnar tidak dapat dibaca: {e}")
+        return None
+
+    print(f"Memuat cache kolumnar: {cache_dir}")
+    return PointColumns(meta['metric_names'], meta['tagsets'], arrays, meta.get('lines', 0), meta.get('refs', []))
+
+
+def save_cache(path, columns):
+    cache_dir = cache_dir_for(path)
+    try:
+        os.makedirs(cache_dir, exist_ok=True)
+        for name in COLUMN_TYPES:
+            np.save(os.path.join(cache_dir, f"{name}.npy"), columns.arrays[name])
+        meta = {
+            'version': CACHE_VERSION,
+            'source': fingerprint(path),
+            'metric_names': columns.metric_names,
+            'tagsets': columns.tagsets,
+            'lines': columns.lines,
+            'refs': columns.refs,
+        }
+        # meta.json ditulis terakhir sehingga cache yang terputus di tengah
+        # tidak pernah dianggap valid.
+        with open(os.path.join(cache_dir, 'meta.json'), 'w') as f:
+            json.dump(meta, f)
+    except OSError as e:
+        print(f"Gagal menyimpan cache kolumnar: {e}")
+        return
+    print(f"Cache kolumnar disimpan ke {cache_dir}")
@@ -0,0 +1,340 @@
+import argparse
+import os
+import time
+from datetime import datetime
+
+from .accumulator import DEFAULT_PERCENTILES
+from .compare import (DEFAULT_ALPHA, DEFAULT_MIN_CHANGE, MIN_ERROR_CHANGE, load_run_summary, prepare_comparison_table,
+                      save_comparison, save_run_summary, summarize_run)
+from .compression import detect_compression
+from .decoder import JSON_BACKEND
+from .endpoints import prepare_endpoint_table, save_endpoint_table
+from .errors import prepare_error_table, prepare_error_timeline, save_errors
+from .follow import FileTail
+from .loader import load_results
+from .merge import merge_results, node_names, parse_clock_offset, prepare_node_table, resolve_clock_offsets, save_node_table
+from .parser import ResultAggregator, new_timeline
+from .phases import prepare_phase_table, save_phase_table
+from .report import add_percentile_argument, format_number_id
+from .scenario import (prepare_correlation_table, prepare_data_table, prepare_transfer_table, print_available_metrics,
+                       save_correlation_table, save_transfer_table)
+from .timeline import load_stages, prepare_rolling_table, prepare_stage_summary, prepare_timeline_table, save_timeline
+
+DEFAULT_DURATION_MINS = 20
+FOLLOW_POLL_SECONDS = 0.5
+FOLLOW_WINDOW_SECONDS = 5
+
+
+def parse_ndjson_k6_results(json_file, scenario, streaming=False, workers=1, timeline_window=None, use_cache=True,
+                            phases=False, endpoints=False):
+    print(f"Memproses file NDJSON: {json_file}")
+    if workers > 1:
+        print(f"Memproses paralel dengan {workers} proses")
+        streaming = True
+    if streaming and use_cache:
+        # Membangun dan memutar ulang cache memuat semua titik ke memori.
+        print("Mode streaming: cache kolumnar tidak digunakan agar memori tetap")
+        use_cache = False
+    if streaming:
+        print("Mode agregasi streaming aktif (memori tetap)")
+    
+    try:
+        aggregator = load_results(json_file, scenario.selection(phases, endpoints), streaming, workers, timeline_window, use_cache)
+    except Exception as e:
+        print(f"Error membaca file: {e}")
+        return None, None
+    
+    test_duration_mins = test_duration_of(aggregator)
+    
+    if aggregator.decoded:
+        print(f"Baris di-decode: {aggregator.decoded} dari {aggregator.lines} (decoder: {JSON_BACKEND})")
+    print(f"Durasi pengujian: {test_duration_mins:.2f} menit")
+    
+    return aggregator, test_duration_mins
+
+
+def test_duration_of(aggregator):
+    if aggregator.start_time is not None and aggregator.end_time is not None:
+        return (aggregator.end_time - aggregator.start_time) / 60
+    return DEFAULT_DURATION_MINS
+
+
+def save_results(df, prefix=""):
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    
+    csv_file = f"{prefix}load_test_results_{timestamp}.csv"
+    df.to_csv(csv_file, index=False)
+    print(f"Hasil disimpan ke {csv_file}")
+    
+    word_file = f"{prefix}load_test_results_word_{timestamp}.txt"
+    with open(word_file, 'w') as f:
+        f.write(df.to_string(index=False))
+    print(f"Format untuk Word disimpan ke {word_file}")
+
+
+def process_k6_results(scenario, json_file, streaming=False, workers=1, percentiles=DEFAULT_PERCENTILES,
+                       timeline_window=None, load_test_file=None, use_cache=True, phases=False, endpoints=False):
+    aggregator, test_duration_mins = parse_ndjson_k6_results(
+        json_file, scenario, streaming, workers, timeline_window, use_cache, phases, endpoints)
+    
+    if aggregator is None:
+        print("Gagal memproses file. Program dihentikan.")
+        return
+    
+    report_results(scenario, aggregator, test_duration_mins, percentiles, load_test_file)
+
+
+def report_results(scenario, aggregator, test_duration_mins, percentiles=DEFAULT_PERCENTILES, load_test_file=None):
+    if scenario.show_available_metrics:
+        print_available_metrics(aggregator)
+    
+    df = prepare_data_table(scenario, aggregator, test_duration_mins, percentiles)
+    
+    print(f"\n{scenario.title}:")
+    print("=" * scenario.separator_width)
+    print(df.to_string(index=False))
+    print("=" * scenario.separator_width)
+    
+    save_results(df, scenario.output_prefix)
+    
+    transfer_df = prepare_transfer_table(aggregator, test_duration_mins)
+    if len(transfer_df):
+        print("\nTransfer Data per Langkah k6 (data_sent/data_received):")
+        print(transfer_df.to_string(index=False))
+        save_transfer_table(transfer_df, scenario.output_prefix)
+    
+    if aggregator.errors.classes:
+        stages = load_stages(load_test_file) if load_test_file else []
+        error_df = prepare_error_table(aggregator.errors, aggregator.start_time, stages)
+        print(f"\nTaksonomi Error (urut waktu pertama muncul, jendela {aggregator.errors.window_seconds:g} detik):")
+        print(error_df.to_string(index=False))
+        save_errors(error_df, prepare_error_timeline(aggregator.errors, aggregator.start_time), scenario.output_prefix)
+    
+    if aggregator.endpoints is not None:
+        endpoint_df = prepare_endpoint_table(aggregator.endpoints, test_duration_mins)
+        print("\nLatensi per Endpoint (metode, template URL, kelas status):")
+        print(endpoint_df.to_string(index=False))
+        save_endpoint_table(endpoint_df, scenario.output_prefix)
+    
+    phase_df = prepare_phase_table(aggregator)
+    if len(phase_df):
+        print("\nRincian Fase Permintaan HTTP per Langkah k6:")
+        print(phase_df.to_string(index=False))
+        save_phase_table(phase_df, scenario.output_prefix)
+    
+    if aggregator.correlations:
+        correlation_df = prepare_correlation_table(aggregator)
+        print("\nUnggahan Bertahap per Operasi (latensi ujung-ke-ujung di tabel utama):")
+        print(correlation_df.to_string(index=False))
+        save_correlation_table(correlation_df, scenario.output_prefix)
+    
+    timeline = aggregator.timeline
+    if timeline is not None:
+        stages = load_stages(load_test_file) if load_test_file else []
+        stage_df = prepare_stage_summary(timeline, stages)
+        
+        print(f"\nRingkasan per Tahap (jendela {timeline.window_seconds:g} detik):")
+        print(stage_df.to_string(index=False))
+        
+        save_timeline(prepare_timeline_table(timeline, stages), stage_df, prefix=scenario.output_prefix)
+    
+    print("\nAnda dapat menyalin tabel ini dan menempelkannya ke aplikasi word processor atau spreadsheet.")
+
+
+def compare_k6_results(scenario, json_files, streaming=False, workers=1, use_cache=True,
+                       alpha=DEFAULT_ALPHA, min_change=DEFAULT_MIN_CHANGE):
+    runs = []
+    for json_file in json_files:
+        run = load_run_summary(json_file, scenario) if use_cache else None
+        if run is None:
+            aggregator, test_duration_mins = parse_ndjson_k6_results(
+                json_file, scenario, streaming, workers, use_cache=use_cache)
+            if aggregator is None:
+                print(f"Gagal memproses {json_file}, dilewati.")
+                continue
+            run = summarize_run(scenario, json_file, aggregator, test_duration_mins)
+            if use_cache:
+                save_run_summary(run, scenario)
+        runs.append(run)
+    
+    if len(runs) < 2:
+        print("Perbandingan membutuhkan minimal dua file hasil.")
+        return
+    
+    df = prepare_comparison_table(runs, alpha, min_change)
+    
+    width = scenario.separator_width
+    print(f"\n{scenario.title} - Perbandingan terhadap {runs[0].name}:")
+    print("=" * width)
+    print(df.to_string(index=False))
+    print("=" * width)
+    print(f"Regresi: uji signifikan (alpha {format_number_id(alpha, 3)}) dan P50/P95 naik minimal "
+          f"{format_number_id(min_change, 1)}% atau error naik minimal {format_number_id(MIN_ERROR_CHANGE, 1)} poin.")
+    
+    save_comparison(df, scenario.output_prefix)
+
+
+def merge_k6_results(scenario, json_files, streaming=False, workers=1, percentiles=DEFAULT_PERCENTILES,
+                     timeline_window=None, load_test_file=None, phases=False, endpoints=False,
+                     align_clocks=False, clock_offsets=()):
+    print(f"Menggabungkan {len(json_files)} file NDJSON sebagai satu pengujian:")
+    for node, json_file in zip(node_names(json_files), json_files):
+        print(f"  {node}: {json_file}")
+    if workers > 1:
+        print("Mode gabung membaca setiap file secara berurutan (--workers tidak digunakan)")
+    if streaming:
+        print("Mode agregasi streaming aktif (memori tetap)")
+    
+    try:
+        offsets = resolve_clock_offsets(json_files, align_clocks, clock_offsets)
+        for node, offset in zip(node_names(json_files), offsets):
+            if offset:
+                print(f"Koreksi jam {node}: {offset:+.3f} detik")
+        aggregator, nodes = merge_results(json_files, scenario.selection(phases, endpoints), streaming,
+                                          timeline_window, offsets)
+    except Exception as e:
+        print(f"Error membaca file: {e}")
+        print("Gagal memproses file. Program dihentikan.")
+        return
+    
+    test_duration_mins = test_duration_of(aggregator)
+    if aggregator.decoded:
+        print(f"Baris di-decode: {aggregator.decoded} dari {aggregator.lines} (decoder: {JSON_BACKEND})")
+    print(f"Durasi pengujian: {test_duration_mins:.2f} menit")
+    
+    report_results(scenario, aggregator, test_duration_mins, percentiles, load_test_file)
+    
+    node_df = prepare_node_table(nodes, aggregator.start_time, percentiles)
+    print("\nRingkasan per Node Generator Beban (http_req_duration/http_req_failed):")
+    print(node_df.to_string(index=False))
+    save_node_table(node_df, scenario.output_prefix)
+
+
+def follow_k6_results(scenario, json_file, refresh_seconds=5, rolling_seconds=30, idle_timeout=60,
+                      percentiles=DEFAULT_PERCENTILES, timeline_window=None, load_test_file=None):
+    if os.path.exists(json_file) and detect_compression(json_file):
+        print("Mode --follow hanya untuk file NDJSON yang tidak terkompresi.")
+        return
+    
+    print(f"Mengikuti file NDJSON: {json_file} (pembaruan setiap {refresh_seconds:g} detik, Ctrl+C untuk berhenti)")
+    stages = load_stages(load_test_file) if load_test_file else []
+    window = timeline_window or FOLLOW_WINDOW_SECONDS
+    
+    tail = FileTail(json_file)
+    aggregator = ResultAggregator(scenario.selection(), streaming=True, timeline=new_timeline(window))
+    last_data = last_refresh = time.monotonic()
+    
+    try:
+        while True:
+            lines = tail.read_lines()
+            if tail.restarted:
+                print("File hasil ditulis ulang dari awal, agregasi diulang.")
+                tail.restarted = False
+                aggregator = ResultAggregator(scenario.selection(), streaming=True, timeline=new_timeline(window))
+            
+            now = time.monotonic()
+            if lines:
+                aggregator.consume(lines)
+                last_data = now
+            
+            if now - last_refresh >= refresh_seconds:
+                print_rolling_table(aggregator, stages, rolling_seconds, percentiles)
+                last_refresh = now
+            
+            if idle_timeout and now - last_data >= idle_timeout:
+                print(f"\nTidak ada data baru selama {idle_timeout:g} detik, mode follow selesai.")
+                break
+            
+            if tail.at_end:
+                time.sleep(FOLLOW_POLL_SECONDS)
+    except KeyboardInterrupt:
+        print("\nMode follow dihentikan.")
+    
+    if aggregator.start_time is None:
+        print("Belum ada titik data yang terbaca.")
+        return
+    
+    report_results(scenario, aggregator, test_duration_of(aggregator), percentiles, load_test_file)
+
+
+def print_rolling_table(aggregator, stages, rolling_seconds, percentiles):
+    timeline = aggregator.timeline
+    if not timeline.windows:
+        print(f"[{datetime.now():%H:%M:%S}] Menunggu data...")
+        return
+    
+    elapsed = aggregator.end_time - aggregator.start_time
+    print(f"\n[{datetime.now():%H:%M:%S}] Detik ke-{elapsed:.0f} pengujian, {rolling_seconds:g} detik terakhir:")
+    print(prepare_rolling_table(timeline, stages, rolling_seconds, percentiles).to_string(index=False))
+
+
+def build_argument_parser(scenario, load_test_file=None):
+    arg_parser = argparse.ArgumentParser(description=f"Memproses hasil pengujian beban k6 {scenario.name}")
+    arg_parser.add_argument("json_file", nargs="?", help="path ke file hasil k6 (NDJSON)")
+    arg_parser.add_argument("--streaming", action="store_true",
+                            help="agregasi dengan memori tetap (tanpa menyimpan setiap sampel)")
+    arg_parser.add_argument("--workers", type=int, default=1,
+                            help="jumlah proses paralel untuk membaca file (mengaktifkan mode streaming)")
+    add_percentile_argument(arg_parser)
+    arg_parser.add_argument("--timeline", type=float, metavar="DETIK",
+                            help="kelompokkan titik ke jendela waktu (mis. 10) dan simpan timeline per langkah")
+    arg_parser.add_argument("--load-test", default=load_test_file,
+                            help="skrip k6 yang tahapan (options.stages)-nya dipetakan ke timeline")
+    arg_parser.add_argument("--no-cache", action="store_true",
+                            help="jangan membaca atau menulis cache kolumnar di samping file hasil")
+    arg_parser.add_argument("--phases", action="store_true",
+                            help="kumpulkan fase permintaan HTTP (blocked, connecting, TLS, sending, waiting, receiving)")
+    arg_parser.add_argument("--endpoints", action="store_true",
+                            help="kelompokkan latensi per metode + template URL ({id} untuk UUID/angka) + kelas status")
+    arg_parser.add_argument("--follow", action="store_true",
+                            help="ikuti file yang masih ditulis k6 dan tampilkan tabel bergulir secara berkala")
+    arg_parser.add_argument("--refresh", type=float, default=5, metavar="DETIK",
+                            help="interval pembaruan tabel pada mode --follow (default: 5)")
+    arg_parser.add_argument("--rolling", type=float, default=30, metavar="DETIK",
+                            help="rentang data terakhir yang diringkas pada mode --follow (default: 30)")
+    arg_parser.add_argument("--idle-timeout", type=float, default=60, metavar="DETIK",
+                            help="akhiri mode --follow jika tidak ada data baru selama ini (0 = tunggu Ctrl+C)")
+    arg_parser.add_argument("--compare", nargs="+", metavar="FILE",
+                            help="bandingkan file hasil ini terhadap json_file (atau file pertama) sebagai baseline")
+    arg_parser.add_argument("--merge", nargs="+", metavar="FILE",
+                            help="gabungkan file hasil beberapa node generator beban (bersama json_file) sebagai satu pengujian")
+    arg_parser.add_argument("--align-clocks", action="store_true",
+                            help="pada --merge, samakan awal pengujian setiap node dengan node pertama (koreksi selisih jam)")
+    arg_parser.add_argument("--clock-offset", type=parse_clock_offset, action="append", default=[], metavar="NODE=DETIK",
+                            help="pada --merge, tambahkan DETIK ke waktu titik dari NODE (nama file tanpa ekstensi)")
+    arg_parser.add_argument("--alpha", type=float, default=DEFAULT_ALPHA,
+                            help=f"tingkat signifikansi uji regresi (default: {DEFAULT_ALPHA})")
+    arg_parser.add_argument("--min-change", type=float, default=DEFAULT_MIN_CHANGE, metavar="PERSEN",
+                            help=f"perubahan P50/P95 minimal agar dianggap regresi (default: {DEFAULT_MIN_CHANGE:g})")
+    return arg_parser
+
+
+def main(scenario, load_test_file=None, argv=None):
+    args = build_argument_parser(scenario, load_test_file).parse_args(argv)
+    
+    if args.compare:
+        json_files = ([args.json_file] if args.json_file else []) + args.compare
+        compare_k6_results(scenario, json_files, streaming=args.streaming, workers=args.workers,
+                           use_cache=not args.no_cache, alpha=args.alpha, min_change=args.min_change)
+        return
+    
+    if args.merge:
+        json_files = ([args.json_file] if args.json_file else []) + args.merge
+        merge_k6_results(scenario, json_files, streaming=args.streaming, workers=args.workers,
+                         percentiles=args.percentiles, timeline_window=args.timeline,
+                         load_test_file=args.load_test, phases=args.phases, endpoints=args.endpoints,
+                         align_clocks=args.align_clocks, clock_offsets=args.clock_offset)
+        return
+    
+    json_file = args.json_file or input(f"Masukkan path ke file hasil k6 untuk {scenario.name} (NDJSON): ")
+    
+    if args.follow:
+        follow_k6_results(scenario, json_file, refresh_seconds=args.refresh, rolling_seconds=args.rolling,
+                          idle_timeout=args.idle_timeout, percentiles=args.percentiles,
+                          timeline_window=args.timeline, load_test_file=args.load_test)
+        return
+    
+    process_k6_results(scenario, json_file, streaming=args.streaming, workers=args.workers,
+                       percentiles=args.percentiles, timeline_window=args.timeline,
+                       load_test_file=args.load_test, use_cache=not args.no_cache, phases=args.phases,
+                       endpoints=args.endpoints)
@@ -0,0 +1,272 @@
+import json
+import math
+import os
+from datetime import datetime
+
+import pandas as pd
+
+from .accumulator import StreamingStats, as_ndarray
+from .cache import cache_dir_for, fingerprint
+from .report import format_change, format_number_id
+from .scenario import compute_step_results
+
+SUMMARY_VERSION = 1
+COMPARISON_PERCENTILES = (50, 95, 99)
+DEFAULT_ALPHA = 0.01
+DEFAULT_MIN_CHANGE = 5.0
+MIN_ERROR_CHANGE = 1.0
+
+
+class StepSummary:
+    """Agregat satu langkah dari satu run yang cukup untuk dibandingkan."""
+
+    def __init__(self, label, avg, latency, failed, attempts, throughput):
+        self.label = label
+        self.avg = avg
+        self.latency = latency
+        self.failed = failed
+        self.attempts = attempts
+        self.throughput = throughput
+
+    @property
+    def error_rate(self):
+        return self.failed / self.attempts * 100 if self.attempts else None
+
+    def quantile(self, percentile):
+        return self.latency.quantile(percentile / 100) if self.latency is not None else None
+
+    def to_dict(self):
+        return {
+            'label': self.label,
+            'avg': self.avg,
+            'latency': self.latency.to_dict() if self.latency is not None else None,
+            'failed': self.failed,
+            'attempts': self.attempts,
+            'throughput': self.throughput,
+        }
+
+    @classmethod
+    def from_dict(cls, data):
+        latency = StreamingStats.from_dict(data['latency']) if data['latency'] is not None else None
+        return cls(data['label'], data['avg'], latency, data['failed'], data['attempts'], data['throughput'])
+
+
+class RunSummary:
+    def __init__(self, path, test_duration_mins, steps):
+        self.path = path
+        self.test_duration_mins = test_duration_mins
+        self.steps = {step.label: step for step in steps}
+
+    @property
+    def name(self):
+        return os.path.basename(self.path)
+
+
+def _latency_stats(durations):
+    if durations is None or isinstance(durations, StreamingStats):
+        return durations
+    stats = StreamingStats()
+    stats.extend(as_ndarray(durations))
+    return stats
+
+
+def summarize_run(scenario, path, aggregator, test_duration_mins):
+    steps = []
+    for step, result in compute_step_results(scenario, aggregator, test_duration_mins):
+        if result is None:
+            continue
+        steps.append(StepSummary(step.label, result.avg, _latency_stats(result.durations),
+                                 result.failed, result.attempts, result.throughput))
+    return RunSummary(path, test_duration_mins, steps)
+
+
+def summary_file_for(path, scenario):
+    return os.path.join(cache_dir_for(path), f"summary_{scenario.key}.json")
+
+
+def load_run_summary(path, scenario):
+    summary_file = summary_file_for(path, scenario)
+    if not os.path.exists(summary_file):
+        return None
+    try:
+        with open(summary_file, 'r') as f:
+            data = json.load(f)
+        if data.get('version') != SUMMARY_VERSION or data.get('source') != fingerprint(path):
+            return None
+        steps = [StepSummary.from_dict(step) for step in data['steps']]
+    except (OSError, ValueError, KeyError) as e:
+        print(f"Ringkasan run tidak dapat dibaca: {e}")
+        return None
+    print(f"Memuat ringkasan run: {summary_file}")
+    return RunSummary(path, data['test_duration_mins'], steps)
+
+
+def save_run_summary(summary, scenario):
+    summary_file = summary_file_for(summary.path, scenario)
+    data = {
+        'version': SUMMARY_VERSION,
+        'source': fingerprint(summary.path),
+        'test_duration_mins': summary.test_duration_mins,
+        'steps': [step.to_dict() for step in summary.steps.values()],
+    }
+    try:
+        os.makedirs(os.path.dirname(summary_file), exist_ok=True)
+        with open(summary_file, 'w') as f:
+            json.dump(data, f)
+    except OSError as e:
+        print(f"Gagal menyimpan ringkasan run: {e}")
+
+
+def _bucket_counts(sketch):
+    counts = dict(sketch.bins)
+    if sketch.zero_count:
+        counts[-math.inf] = sketch.zero_count
+    return counts
+
+
+def mann_whitney(baseline, candidate):
+    """Uji Mann-Whitney U dua sisi langsung pada dua ``LogHistogram``.
+
+    Nilai dalam bucket yang sama dianggap seri, sehingga varians memakai
+    koreksi seri. Mengembalikan (P(kandidat > baseline), p-value).
+    """
+    n1, n2 = baseline.count, candidate.count
+    if not n1 or not n2:
+        return None, None
+    baseline_counts = _bucket_counts(baseline)
+    candidate_counts = _bucket_counts(candidate)
+
+    below = 0
+    u_candidate = 0.0
+    ties = 0.0
+    for index in sorted(set(baseline_counts) | set(candidate_counts)):
+        base_weight = baseline_counts.get(index, 0)
+        candidate_weight = candidate_counts.get(index, 0)
+        u_candidate += candidate_weight * (below + 0.5 * base_weight)
+        below += base_weight
+        tied = base_weight + candidate_weight
+        ties += float(tied) ** 3 - tied
+
+    n = n1 + n2
+    variance = n1 * n2 / 12 * ((n + 1) - ties / (n * (n - 1)))
+    probability = u_candidate / (n1 * n2)
+    if variance <= 0:
+        return probability, 1.0
+    z = (u_candidate - n1 * n2 / 2) / math.sqrt(variance)
+    return probability, math.erfc(abs(z) / math.sqrt(2))
+
+
+def two_proportion_test(failed_a, attempts_a, failed_b, attempts_b):
+    if not attempts_a or not attempts_b:
+        return None
+    pooled = (failed_a + failed_b) / (attempts_a + attempts_b)
+    standard_error = math.sqrt(pooled * (1 - pooled) * (1 / attempts_a + 1 / attempts_b))
+    if standard_error == 0:
+        return 1.0
+    z = (failed_b / attempts_b - failed_a / attempts_a) / standard_error
+    return math.erfc(abs(z) / math.sqrt(2))
+
+
+def _relative_change(baseline, candidate):
+    if baseline is None or candidate is None or baseline == 0:
+        return None
+    return (candidate - baseline) / baseline * 100
+
+
+def _format_p(p_value):
+    if p_value is None:
+        return "N/A"
+    return "<0,0001" if p_value < 0.0001 else format_number_id(p_value, 4)
+
+
+def compare_step(baseline, candidate, alpha=DEFAULT_ALPHA, min_change=DEFAULT_MIN_CHANGE):
+    """Perubahan satu langkah terhadap baseline beserta status regresinya.
+
+    Perubahan latensi dianggap nyata hanya jika uji Mann-Whitney signifikan
+    dan P50 atau P95 bergeser minimal ``min_change`` persen; pada jutaan
+    sampel, selisih yang tidak berarti pun hampir selalu signifikan.
+    """
+    changes = {p: _relative_change(baseline.quantile(p), candidate.quantile(p)) for p in COMPARISON_PERCENTILES}
+    if baseline.latency is not None and candidate.latency is not None:
+        slower, latency_p = mann_whitney(baseline.latency.sketch, candidate.latency.sketch)
+    else:
+        slower, latency_p = None, None
+    error_p = two_proportion_test(baseline.failed, baseline.attempts, candidate.failed, candidate.attempts)
+    error_change = None
+    if baseline.error_rate is not None and candidate.error_rate is not None:
+        error_change = candidate.error_rate - baseline.error_rate
+
+    shifts = [change for change in (changes[50], changes.get(95)) if change is not None]
+    regressions, improvements = [], []
+    if latency_p is not None and latency_p < alpha and shifts:
+        if slower > 0.5 and max(shifts) >= min_change:
+            regressions.append("latensi")
+        elif slower < 0.5 and min(shifts) <= -min_change:
+            improvements.append("latensi")
+    if error_p is not None and error_p < alpha and error_change is not None:
+        if error_change >= MIN_ERROR_CHANGE:
+            regressions.append("error")
+        elif error_change <= -MIN_ERROR_CHANGE:
+            improvements.append("error")
+
+    if regressions:
+        status = f"REGRESI ({', '.join(regressions)})"
+    elif improvements:
+        status = f"Membaik ({', '.join(improvements)})"
+    else:
+        status = "Tidak signifikan"
+    return changes, error_change, latency_p, error_p, status
+
+
+def prepare_comparison_table(runs, alpha=DEFAULT_ALPHA, min_change=DEFAULT_MIN_CHANGE):
+    baseline_run = runs[0]
+    labels = list(baseline_run.steps)
+    for run in runs[1:]:
+        labels.extend(label for label in run.steps if label not in labels)
+
+    columns = ["Langkah", "Run"]
+    for p in COMPARISON_PERCENTILES:
+        columns += [f"P{format_number_id(p, 0)} (ms)", f"Δ P{format_number_id(p, 0)}"]
+    columns += ["Throughput (/min)", "Δ Throughput", "Error (%)", "Δ Error (poin)",
+                "p Latensi", "p Error", "Status"]
+
+    records = []
+    for label in labels:
+        baseline = baseline_run.steps.get(label)
+        for run_index, run in enumerate(runs):
+            step = run.steps.get(label)
+            if step is None:
+                records.append([label, run.name] + ["N/A"] * (len(columns) - 2))
+                continue
+
+            record = [label, run.name]
+            if run_index == 0 or baseline is None:
+                for p in COMPARISON_PERCENTILES:
+                    record += [format_number_id(step.quantile(p)), "-"]
+                record += [format_number_id(step.throughput, 1), "-", format_number_id(step.error_rate, 1), "-",
+                           "-", "-", "Baseline" if run_index == 0 else "Tanpa baseline"]
+                records.append(record)
+                continue
+
+            changes, error_change, latency_p, error_p, status = compare_step(baseline, step, alpha, min_change)
+            for p in COMPARISON_PERCENTILES:
+                record += [format_number_id(step.quantile(p)), format_change(changes[p])]
+            record += [
+                format_number_id(step.throughput, 1),
+                format_change(_relative_change(baseline.throughput, step.throughput)),
+                format_number_id(step.error_rate, 1),
+                format_change(error_change, 2, ""),
+                _format_p(latency_p),
+                _format_p(error_p),
+                status,
+            ]
+            records.append(record)
+
+    return pd.DataFrame(records, columns=columns)
+
+
+def save_comparison(df, prefix=""):
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    comparison_file = f"{prefix}comparison_{timestamp}.csv"
+    df.to_csv(comparison_file, index=False)
+    print(f"Perbandingan disimpan ke {comparison_file}")
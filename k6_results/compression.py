@@ -0,0 +1,115 @@
+import gzip
+import lzma
+import queue
+import threading
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+DECOMPRESS_BLOCK_SIZE = 4 * 1024 * 1024
+QUEUE_BLOCKS = 8
+
+MAGIC_BYTES = (
+    (b'\x1f\x8b', 'gzip'),
+    (b'\x28\xb5\x2f\xfd', 'zstd'),
+    (b'\xfd7zXZ\x00', 'xz'),
+)
+
+
+def detect_compression(path):
+    """Format kompresi berdasarkan magic bytes (bukan ekstensi), atau None."""
+    with open(path, 'rb') as f:
+        head = f.read(6)
+    for magic, name in MAGIC_BYTES:
+        if head.startswith(magic):
+            return name
+    return None
+
+
+def open_decompressed(path, compression):
+    if compression == 'gzip':
+        return gzip.open(path, 'rb')
+    if compression == 'xz':
+        return lzma.open(path, 'rb')
+    if zstandard is None:
+        raise RuntimeError("File terkompresi zstd membutuhkan paket zstandard (pip install zstandard)")
+    return zstandard.ZstdDecompressor().stream_reader(open(path, 'rb'), closefd=True)
+
+
+class BackgroundLineReader:
+    """Iterasi baris dari file terkompresi dengan dekompresi di thread lain.
+
+    Modul gzip, lzma, dan zstandard melepas GIL saat mendekompresi blok,
+    sehingga dekompresi blok berikutnya berjalan bersamaan dengan parsing
+    blok sekarang. Antrean dibatasi agar memori tetap kecil.
+    """
+
+    def __init__(self, path, compression, block_size=DECOMPRESS_BLOCK_SIZE):
+        self.path = path
+        self.compression = compression
+        self.block_size = block_size
+        self._blocks = queue.Queue(maxsize=QUEUE_BLOCKS)
+        self._stop = threading.Event()
+        self._thread = None
+
+    def __enter__(self):
+        self._thread = threading.Thread(target=self._decompress, daemon=True)
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc_info):
+        self._stop.set()
+        while self._thread.is_alive():
+            try:
+                self._blocks.get(timeout=0.1)
+            except queue.Empty:
+                pass
+        self._thread.join()
+        return False
+
+    def _put(self, item):
+        while not self._stop.is_set():
+            try:
+                self._blocks.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                pass
+        return False
+
+    def _decompress(self):
+        try:
+            with open_decompressed(self.path, self.compression) as f:
+                while not self._stop.is_set():
+                    block = f.read(self.block_size)
+                    if not block:
+                        break
+                    if not self._put(block):
+                        return
+        except Exception as e:
+            self._put(e)
+            return
+        self._put(None)
+
+    def __iter__(self):
+        pending = b''
+        while True:
+            block = self._blocks.get()
+            if block is None:
+                break
+            if isinstance(block, Exception):
+                raise block
+            lines = (pending + block).split(b'\n')
+            pending = lines.pop()
+            yield from lines
+        if pending:
+            yield pending
+
+
+def open_results(path):
+    """Buka file hasil k6 untuk iterasi baris (bytes), terkompresi atau tidak."""
+    compression = detect_compression(path)
+    if compression is None:
+        return open(path, 'rb')
+    return BackgroundLineReader(path, compression)
@@ -0,0 +1,281 @@
+import numpy as np
+
+from .accumulator import StreamingStats, extend_sample_buffer, new_sample_buffer
+
+CORRELATION_TAG = 'upload_ref'
+BYTES_TAG = 'chunk_bytes'
+CHUNK_COUNT_TAG = 'chunk_count'
+# Operasi yang tidak menerima titik selama ini dianggap berhenti: k6 hanya
+# kira-kira mengurutkan titik menurut waktu, tetapi tidak selisih menit.
+STALE_OPERATION_SECONDS = 300
+
+
+def chunk_bytes_of(point_data, tags):
+    """Ukuran chunk sebuah titik dari metadata, atau dari tag pada hasil lama."""
+    metadata = point_data.get('metadata')
+    value = metadata.get(BYTES_TAG) if metadata else None
+    if value is None and tags:
+        value = tags.get(BYTES_TAG)
+    try:
+        return float(value) if value is not None else None
+    except (TypeError, ValueError):
+        return None
+
+
+def chunk_count_of(point_data, tags):
+    """Jumlah chunk yang diharapkan untuk operasi titik ini (``chunk_count``)."""
+    metadata = point_data.get('metadata')
+    value = metadata.get(CHUNK_COUNT_TAG) if metadata else None
+    if value is None and tags:
+        value = tags.get(CHUNK_COUNT_TAG)
+    try:
+        return int(value) if value is not None else None
+    except (TypeError, ValueError):
+        return None
+
+
+def correlation_id(point_data, tags):
+    """Id operasi sebuah titik: ``upload_ref`` dari metadata atau tag,
+    atau pasangan VU/iterasi jika k6 menyertakannya."""
+    metadata = point_data.get('metadata')
+    if metadata:
+        ref = metadata.get(CORRELATION_TAG)
+        if ref is not None:
+            return ref
+        if 'vu' in metadata and 'iter' in metadata:
+            return f"{metadata['vu']}:{metadata['iter']}"
+    if tags:
+        ref = tags.get(CORRELATION_TAG)
+        if ref is not None:
+            return ref
+        if 'vu' in tags and 'iter' in tags:
+            return f"{tags['vu']}:{tags['iter']}"
+    return None
+
+
+class Correlation:
+    """Operasi bertahap (mis. init → chunk → complete) yang digabung per id.
+
+    ``metrics`` berisi metrik durasi setiap tahap secara berurutan; satu
+    operasi dianggap lengkap jika tahap pertama dan terakhir tercatat.
+    ``bytes_metric`` adalah tahap yang ``chunk_bytes``-nya (metadata titik)
+    dipakai untuk menghitung throughput transfer (MB/s); ``chunk_count`` pada
+    metadata salah satu titik operasi menyatakan berapa titik tahap itu yang
+    harus ditunggu.
+    """
+
+    def __init__(self, label, metrics, bytes_metric=None):
+        self.label = label
+        self.metrics = tuple(metrics)
+        self.bytes_metric = bytes_metric
+
+    def collector(self, streaming=False):
+        return CorrelationCollector(self, streaming)
+
+
+class PendingOperation:
+    """Tahap-tahap satu operasi yang belum lengkap."""
+
+    __slots__ = ("stages", "chunks", "expected_chunks", "first_seen", "last_seen")
+
+    def __init__(self, stage_count):
+        self.stages = [None] * stage_count
+        self.chunks = 0
+        self.expected_chunks = None
+        self.first_seen = None
+        self.last_seen = None
+
+    @property
+    def is_finished(self):
+        """Tahap pertama dan terakhir sudah tercatat."""
+        return self.stages[0] is not None and self.stages[-1] is not None
+
+    def seen(self, timestamp):
+        if self.first_seen is None or timestamp < self.first_seen:
+            self.first_seen = timestamp
+        if self.last_seen is None or timestamp > self.last_seen:
+            self.last_seen = timestamp
+
+    def absorb(self, other):
+        for position, value in enumerate(other.stages):
+            if value is not None:
+                self.stages[position] = (self.stages[position] or 0.0) + value
+        self.chunks += other.chunks
+        if other.expected_chunks is not None:
+            self.expected_chunks = other.expected_chunks
+        for timestamp in (other.first_seen, other.last_seen):
+            if timestamp is not None:
+                self.seen(timestamp)
+
+
+class CorrelationCollector:
+    """Menggabungkan titik per id operasi.
+
+    Hanya operasi yang belum lengkap yang disimpan di ``operations``. Operasi
+    dilipat ke ``end_to_end`` begitu tahap pertama, tahap terakhir, dan
+    sebanyak ``chunk_count`` titik tahap bytes tercatat, sehingga chunk yang
+    tiba setelah tahap terakhir tetap ikut dihitung. Operasi yang tidak
+    menerima titik selama ``STALE_OPERATION_SECONDS`` dilipat jika tahap
+    terakhirnya ada, atau dibuang dan dihitung di ``incomplete`` jika tidak
+    (mis. unggahan yang gagal sebelum complete). Memori sebanding dengan
+    unggahan yang sedang berjalan, bukan dengan jumlah iterasi.
+
+    ``add_many`` (replay cache per metrik, tanpa urutan waktu) tidak melipat
+    apa pun; operasi tanpa ``chunk_count`` (hasil lama) dan sisa operasi
+    dilipat saat hasil dibaca lewat ``settle``.
+    """
+
+    def __init__(self, correlation, streaming=False):
+        self.correlation = correlation
+        self.streaming = streaming
+        self.positions = {name: position for position, name in enumerate(correlation.metrics)}
+        self.operations = {}
+        self.end_to_end = StreamingStats() if streaming else new_sample_buffer()
+        self.completed_chunks = 0
+        self.incomplete = 0
+        self.transfer_rates = StreamingStats() if streaming else new_sample_buffer()
+        self.transferred_bytes = 0.0
+        self.first_time = None
+        self.last_time = None
+        self.swept_at = None
+
+    def _operation(self, ref):
+        operation = self.operations.get(ref)
+        if operation is None:
+            operation = self.operations[ref] = PendingOperation(len(self.positions))
+        return operation
+
+    def _is_complete(self, operation):
+        if not operation.is_finished:
+            return False
+        if self.correlation.bytes_metric is None:
+            return True
+        return operation.expected_chunks is not None and operation.chunks >= operation.expected_chunks
+
+    def _fold(self, ref, operation):
+        del self.operations[ref]
+        self.end_to_end.append(sum(value for value in operation.stages if value is not None))
+        self.completed_chunks += operation.chunks
+
+    def _observe_time(self, timestamp):
+        if self.first_time is None or timestamp < self.first_time:
+            self.first_time = timestamp
+        if self.last_time is None or timestamp > self.last_time:
+            self.last_time = timestamp
+        if self.swept_at is None:
+            self.swept_at = timestamp
+
+    def evict_stale(self):
+        """Menutup operasi yang sudah ``STALE_OPERATION_SECONDS`` tidak menerima titik."""
+        if self.last_time is None:
+            return
+        cutoff = self.last_time - STALE_OPERATION_SECONDS
+        # Operasi yang dimulai dekat awal data dapat memiliki tahap di rentang
+        # byte sebelumnya; operasi itu baru ditutup setelah rentangnya digabung.
+        earliest = self.first_time + STALE_OPERATION_SECONDS
+        for ref, operation in list(self.operations.items()):
+            if operation.last_seen is None or operation.last_seen >= cutoff or operation.first_seen <= earliest:
+                continue
+            if operation.is_finished:
+                self._fold(ref, operation)
+            else:
+                del self.operations[ref]
+                self.incomplete += 1
+        self.swept_at = self.last_time
+
+    def settle(self):
+        """Melipat semua operasi yang tahap pertama dan terakhirnya tercatat."""
+        for ref, operation in list(self.operations.items()):
+            if operation.is_finished:
+                self._fold(ref, operation)
+
+    def _add_transfer(self, chunk_bytes, durations):
+        chunk_bytes = np.asarray(chunk_bytes, dtype=np.float64)
+        durations = np.asarray(durations, dtype=np.float64)
+        # Ukuran yang tidak diketahui tersimpan sebagai NaN dan ikut terbuang.
+        valid = (chunk_bytes > 0) & (durations > 0)
+        if not valid.any():
+            return
+        chunk_bytes, durations = chunk_bytes[valid], durations[valid]
+        self.transferred_bytes += float(chunk_bytes.sum())
+        rates = chunk_bytes / 1e6 / (durations / 1000)
+        if self.streaming:
+            self.transfer_rates.extend(rates)
+        else:
+            extend_sample_buffer(self.transfer_rates, rates)
+
+    def add(self, metric_name, ref, value, chunk_bytes=None, timestamp=None, expected_chunks=None):
+        position = self.positions[metric_name]
+        operation = self._operation(ref)
+        operation.stages[position] = (operation.stages[position] or 0.0) + value
+        if metric_name == self.correlation.bytes_metric:
+            operation.chunks += 1
+            if chunk_bytes is not None:
+                self._add_transfer([chunk_bytes], [value])
+        if expected_chunks is not None:
+            operation.expected_chunks = expected_chunks
+        if timestamp is not None:
+            operation.seen(timestamp)
+            self._observe_time(timestamp)
+        if self._is_complete(operation):
+            self._fold(ref, operation)
+        if timestamp is not None and self.last_time - self.swept_at >= STALE_OPERATION_SECONDS:
+            self.evict_stale()
+
+    def add_many(self, metric_name, refs, values, chunk_bytes=None):
+        position = self.positions[metric_name]
+        is_bytes_metric = metric_name == self.correlation.bytes_metric
+        for ref, value in zip(refs, values.tolist()):
+            if ref is None:
+                continue
+            operation = self._operation(ref)
+            operation.stages[position] = (operation.stages[position] or 0.0) + value
+            if is_bytes_metric:
+                operation.chunks += 1
+        if is_bytes_metric and chunk_bytes is not None:
+            self._add_transfer(chunk_bytes, values)
+
+    def merge(self, other):
+        # Operasi yang terpotong batas rentang byte baru lengkap setelah digabung.
+        for ref, theirs in other.operations.items():
+            own = self.operations.get(ref)
+            if own is None:
+                self.operations[ref] = own = theirs
+            else:
+                own.absorb(theirs)
+            if self._is_complete(own):
+                self._fold(ref, own)
+        if self.streaming:
+            self.end_to_end.merge(other.end_to_end)
+            self.transfer_rates.merge(other.transfer_rates)
+        else:
+            self.end_to_end.extend(other.end_to_end)
+            self.transfer_rates.extend(other.transfer_rates)
+        self.completed_chunks += other.completed_chunks
+        self.incomplete += other.incomplete
+        self.transferred_bytes += other.transferred_bytes
+        for timestamp in (other.first_time, other.last_time):
+            if timestamp is not None:
+                self._observe_time(timestamp)
+        self.evict_stale()
+        return self
+
+    def completed_count(self):
+        self.settle()
+        return len(self.end_to_end)
+
+    def incomplete_count(self):
+        """Operasi tanpa tahap terakhir: yang sudah dibuang ditambah yang masih tertunda."""
+        self.settle()
+        return self.incomplete + len(self.operations)
+
+    def durations(self):
+        """Latensi ujung-ke-ujung (jumlah durasi semua tahap) per operasi lengkap."""
+        self.settle()
+        return self.end_to_end
+
+    def mean_chunks(self):
+        completed = self.completed_count()
+        if not completed or self.correlation.bytes_metric is None:
+            return None
+        return self.completed_chunks / completed
@@ -0,0 +1,105 @@
+import json
+
+JSON_BACKENDS = ("orjson", "simdjson", "json")
+
+
+def json_loader(backend):
+    """Fungsi decode satu baris untuk ``backend``; ImportError jika modulnya
+    tidak terpasang."""
+    if backend == "orjson":
+        import orjson
+
+        return orjson.loads
+    if backend == "simdjson":
+        import simdjson
+
+        parser = simdjson.Parser()
+
+        def loads(raw):
+            parsed = parser.parse(raw)
+            # Hanya objek yang disalin ke dict; baris lain dilewati iter_points.
+            return parsed.as_dict() if isinstance(parsed, simdjson.Object) else parsed
+
+        return loads
+    return json.loads
+
+
+def _first_available_backend():
+    for backend in JSON_BACKENDS:
+        try:
+            return backend, json_loader(backend)
+        except ImportError:
+            continue
+
+
+JSON_BACKEND, loads = _first_available_backend()
+
+POINT_MARKER = b'"type":"Point"'
+METRIC_DECLARATION_MARKER = b'"type":"Metric"'
+METRIC_MARKER = b'"metric":"'
+
+
+class PointFilter:
+    """Menyaring baris NDJSON k6 sebelum di-decode.
+
+    Nama metrik dibaca langsung dari byte baris, lalu keputusan relevan/tidak
+    untuk setiap nama disimpan sehingga baris metrik yang tidak dipakai
+    laporan (``vus``, ``data_sent``, deklarasi ``Metric``, dst.) dilewati
+    tanpa ``json.loads``.
+    """
+
+    def __init__(self, is_relevant):
+        self.is_relevant = is_relevant
+        self._decisions = {}
+        self.lines = 0
+        self.decoded = 0
+
+    def metric_of(self, line):
+        start = line.rfind(METRIC_MARKER)
+        if start < 0:
+            return None
+        start += len(METRIC_MARKER)
+        end = line.find(b'"', start)
+        if end < 0:
+            return None
+        return line[start:end]
+
+    def wants(self, line):
+        # Nama metrik berada di akhir baris k6, jadi keputusan yang sudah
+        # di-cache diperiksa dulu sebelum memindai seluruh baris.
+        raw_name = self.metric_of(line)
+        if raw_name is None:
+            return bool(line.strip())
+
+        decision = self._decisions.get(raw_name)
+        if decision is None:
+            decision = bool(self.is_relevant(raw_name.decode()))
+            self._decisions[raw_name] = decision
+        if not decision:
+            return False
+        return POINT_MARKER in line or METRIC_DECLARATION_MARKER not in line
+
+
+def iter_points(lines, point_filter):
+    for line in lines:
+        point_filter.lines += 1
+        if not point_filter.wants(line):
+            continue
+
+        point_filter.decoded += 1
+        try:
+            data = loads(line)
+        except ValueError as e:
+            print(f"Kesalahan memproses baris JSON: {e}")
+            continue
+
+        # Baris yang valid sebagai JSON tetapi bukan objek Point k6 dilewati.
+        if not isinstance(data, dict) or data.get('type') != 'Point' or 'metric' not in data:
+            continue
+        point_data = data.get('data')
+        if not isinstance(point_data, dict):
+            continue
+        metric_name = data['metric']
+        if not point_filter.is_relevant(metric_name):
+            continue
+        yield metric_name, point_data
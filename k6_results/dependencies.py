@@ -0,0 +1,17 @@
+import subprocess
+import sys
+
+
+def ensure_pandas():
+    try:
+        import pandas
+    except ImportError:
+        print("Pandas tidak ditemukan. Mencoba menginstal...")
+        try:
+            subprocess.check_call([sys.executable, "-m", "pip", "install", "pandas"])
+            import pandas
+            print("Pandas berhasil diinstal.")
+        except Exception:
+            print("Gagal menginstal pandas. Silakan install secara manual dengan perintah:")
+            print("pip install pandas")
+            sys.exit(1)
@@ -0,0 +1,173 @@
+import re
+from datetime import datetime
+
+import pandas as pd
+
+from .accumulator import StreamingStats, extend_sample_buffer, new_sample_buffer, percentiles_of, summarize
+from .report import format_number_id, percentile_columns
+
+ENDPOINT_METRICS = frozenset(['http_req_duration', 'http_req_failed', 'http_reqs'])
+ID_SEGMENT = re.compile(
+    r'^(?:[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12}'
+    r'|\d+'
+    r'|[0-9a-fA-F]{24,})$'
+)
+MAX_CACHED_URLS = 100000
+
+
+class UrlNormalizer:
+    """Mengubah URL menjadi template path dengan UUID dan id numerik
+    diganti ``{id}``; query string diabaikan.
+
+    Hasil di-cache per URL. URL detail bersifat unik per item, sehingga
+    cache dikosongkan jika melebihi ``MAX_CACHED_URLS`` agar memori tetap
+    terbatas.
+    """
+
+    def __init__(self, max_size=MAX_CACHED_URLS):
+        self.max_size = max_size
+        self._templates = {}
+
+    def __call__(self, url):
+        template = self._templates.get(url)
+        if template is None:
+            if len(self._templates) >= self.max_size:
+                self._templates.clear()
+            template = self._templates[url] = normalize_url(url)
+        return template
+
+
+def normalize_url(url):
+    path = url.split('?', 1)[0].split('#', 1)[0]
+    scheme_end = path.find('://')
+    if scheme_end >= 0:
+        path_start = path.find('/', scheme_end + 3)
+        path = path[path_start:] if path_start >= 0 else '/'
+    segments = ['{id}' if ID_SEGMENT.match(segment) else segment for segment in path.split('/')]
+    return '/'.join(segments) or '/'
+
+
+def status_class(status):
+    if not status or status == '0':
+        return "0 (tanpa respons)"
+    return f"{status[0]}xx"
+
+
+class EndpointStats:
+    __slots__ = ("latency", "requests", "failed", "checked")
+
+    def __init__(self, streaming):
+        self.latency = StreamingStats() if streaming else new_sample_buffer()
+        self.requests = 0
+        self.failed = 0
+        self.checked = 0
+
+    def __getstate__(self):
+        return {slot: getattr(self, slot) for slot in self.__slots__}
+
+    def __setstate__(self, state):
+        for slot, value in state.items():
+            setattr(self, slot, value)
+
+
+class EndpointTable:
+    """Agregat http_req_* per (metode, template URL, kelas status)."""
+
+    def __init__(self, streaming=False):
+        self.streaming = streaming
+        self.normalize = UrlNormalizer()
+        self.endpoints = {}
+
+    def __getstate__(self):
+        return {'streaming': self.streaming, 'endpoints': self.endpoints}
+
+    def __setstate__(self, state):
+        self.streaming = state['streaming']
+        self.endpoints = state['endpoints']
+        self.normalize = UrlNormalizer()
+
+    def _stats(self, tags):
+        key = (tags.get('method', ''), self.normalize(tags.get('name') or tags.get('url') or ''),
+               status_class(tags.get('status')))
+        stats = self.endpoints.get(key)
+        if stats is None:
+            stats = self.endpoints[key] = EndpointStats(self.streaming)
+        return stats
+
+    def add(self, metric_name, tags, value):
+        if not tags:
+            return
+        stats = self._stats(tags)
+        if metric_name == 'http_req_duration':
+            stats.latency.append(value)
+        elif metric_name == 'http_req_failed':
+            stats.failed += value
+            stats.checked += 1
+        elif metric_name == 'http_reqs':
+            stats.requests += value
+
+    def add_many(self, metric_name, tags, values):
+        if not tags:
+            return
+        stats = self._stats(tags)
+        if metric_name == 'http_req_duration':
+            if self.streaming:
+                stats.latency.extend(values)
+            else:
+                extend_sample_buffer(stats.latency, values)
+        elif metric_name == 'http_req_failed':
+            stats.failed += float(values.sum())
+            stats.checked += len(values)
+        elif metric_name == 'http_reqs':
+            stats.requests += float(values.sum())
+
+    def merge(self, other):
+        for key, theirs in other.endpoints.items():
+            own = self.endpoints.get(key)
+            if own is None:
+                self.endpoints[key] = theirs
+                continue
+            if self.streaming:
+                own.latency.merge(theirs.latency)
+            else:
+                own.latency.extend(theirs.latency)
+            own.requests += theirs.requests
+            own.failed += theirs.failed
+            own.checked += theirs.checked
+        return self
+
+
+def prepare_endpoint_table(endpoint_table, test_duration_mins, percentiles=(50, 95, 99)):
+    df = pd.DataFrame(columns=[
+        "Metode",
+        "Endpoint",
+        "Status",
+        "Permintaan",
+        "Rata-rata (ms)",
+    ] + percentile_columns(percentiles) + [
+        "Error (%)",
+        "Throughput (/min)",
+    ])
+
+    for (method, template, status), stats in sorted(endpoint_table.endpoints.items(), key=lambda item: (item[0][1], item[0][0], item[0][2])):
+        summary = summarize(stats.latency)
+        requests = stats.requests or len(stats.latency)
+        df.loc[len(df)] = [
+            method,
+            template,
+            status,
+            format_number_id(requests, 0),
+            format_number_id(summary[0] if summary else None),
+            *[format_number_id(value) for value in (percentiles_of(stats.latency, percentiles) if summary else [None] * len(percentiles))],
+            format_number_id(stats.failed / stats.checked * 100, 1) if stats.checked else "N/A",
+            format_number_id(requests / test_duration_mins if test_duration_mins > 0 else 0, 1),
+        ]
+
+    return df
+
+
+def save_endpoint_table(df, prefix=""):
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    endpoint_file = f"{prefix}endpoints_{timestamp}.csv"
+    df.to_csv(endpoint_file, index=False)
+    print(f"Latensi per endpoint disimpan ke {endpoint_file}")
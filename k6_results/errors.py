@@ -0,0 +1,165 @@
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+
+from .report import format_number_id
+from .timeline import stage_of
+
+ERROR_METRICS = frozenset(['http_req_failed', 'vus'])
+# Kelas error ditentukan tag status/error_code titik ini; vus tidak butuh tag
+TAGGED_ERROR_METRICS = frozenset(['http_req_failed'])
+ERROR_WINDOW_SECONDS = 10
+NO_ERROR_CODE = "-"
+
+
+class ErrorClass:
+    __slots__ = ("buckets", "first_seen")
+
+    def __init__(self):
+        self.buckets = {}
+        self.first_seen = None
+
+    def __getstate__(self):
+        return {slot: getattr(self, slot) for slot in self.__slots__}
+
+    def __setstate__(self, state):
+        for slot, value in state.items():
+            setattr(self, slot, value)
+
+    @property
+    def count(self):
+        return sum(self.buckets.values())
+
+
+class ErrorTaxonomy:
+    """Permintaan gagal per (langkah, status, error_code) dalam jendela waktu.
+
+    Dihitung dari titik ``http_req_failed`` bernilai 1, sehingga setiap
+    kegagalan tercatat sekali beserta tag status/error_code-nya; titik
+    ``vus`` dipakai untuk mencatat jumlah VU saat kelas error pertama muncul.
+    """
+
+    def __init__(self, window_seconds=ERROR_WINDOW_SECONDS):
+        self.window_seconds = window_seconds
+        self.classes = {}
+        self.vus = {}
+
+    def _class(self, step_name, tags):
+        key = (step_name, tags.get('status') or "0", tags.get('error_code') or NO_ERROR_CODE)
+        error_class = self.classes.get(key)
+        if error_class is None:
+            error_class = self.classes[key] = ErrorClass()
+        return error_class
+
+    def _observe_vus(self, window, value):
+        if value > self.vus.get(window, 0):
+            self.vus[window] = value
+
+    def add(self, step_name, metric_name, tags, timestamp, value):
+        window = int(timestamp // self.window_seconds)
+        if metric_name == 'vus':
+            self._observe_vus(window, value)
+            return
+        if not value:
+            return
+        error_class = self._class(step_name, tags or {})
+        error_class.buckets[window] = error_class.buckets.get(window, 0) + 1
+        if error_class.first_seen is None or timestamp < error_class.first_seen:
+            error_class.first_seen = timestamp
+
+    def add_many(self, step_name, metric_name, tags, times, values):
+        if metric_name == 'vus':
+            windows = np.floor(times / self.window_seconds).astype(np.int64)
+            for window, value in zip(windows.tolist(), values.astype(np.int64).tolist()):
+                self._observe_vus(window, value)
+            return
+        failed_times = times[values > 0]
+        if failed_times.size == 0:
+            return
+        error_class = self._class(step_name, tags or {})
+        windows, counts = np.unique(np.floor(failed_times / self.window_seconds).astype(np.int64), return_counts=True)
+        for window, count in zip(windows.tolist(), counts.tolist()):
+            error_class.buckets[window] = error_class.buckets.get(window, 0) + count
+        first = float(failed_times.min())
+        if error_class.first_seen is None or first < error_class.first_seen:
+            error_class.first_seen = first
+
+    def merge(self, other):
+        for key, theirs in other.classes.items():
+            own = self.classes.get(key)
+            if own is None:
+                self.classes[key] = theirs
+                continue
+            for window, count in theirs.buckets.items():
+                own.buckets[window] = own.buckets.get(window, 0) + count
+            if own.first_seen is None or (theirs.first_seen is not None and theirs.first_seen < own.first_seen):
+                own.first_seen = theirs.first_seen
+        for window, value in other.vus.items():
+            self._observe_vus(window, value)
+        return self
+
+    def vus_at(self, timestamp):
+        """VU terbanyak pada jendela waktu tersebut, atau jendela terdekat sebelumnya."""
+        window = int(timestamp // self.window_seconds)
+        earlier = [candidate for candidate in self.vus if candidate <= window]
+        return self.vus[max(earlier)] if earlier else None
+
+
+def prepare_error_table(errors, start_time, stages=()):
+    df = pd.DataFrame(columns=[
+        "Langkah",
+        "Status",
+        "Kode Error",
+        "Jumlah",
+        "Pertama Muncul (s)",
+        "VU saat Muncul",
+        "Tahap saat Muncul",
+        "Puncak (/s)",
+    ])
+
+    ordered = sorted(errors.classes.items(), key=lambda item: (item[1].first_seen, item[0]))
+    for (step_name, status, error_code), error_class in ordered:
+        offset = error_class.first_seen - start_time if start_time is not None else None
+        peak = max(error_class.buckets.values()) / errors.window_seconds
+        df.loc[len(df)] = [
+            step_name,
+            status,
+            error_code,
+            format_number_id(error_class.count, 0),
+            format_number_id(offset, 1),
+            format_number_id(errors.vus_at(error_class.first_seen), 0),
+            stage_of(offset, stages) if offset is not None else "N/A",
+            format_number_id(peak, 2),
+        ]
+
+    return df
+
+
+def prepare_error_timeline(errors, start_time):
+    first_window = int(start_time // errors.window_seconds) if start_time is not None else 0
+    records = []
+    for (step_name, status, error_code), error_class in errors.classes.items():
+        for window, count in error_class.buckets.items():
+            records.append([
+                (window - first_window) * errors.window_seconds,
+                step_name,
+                status,
+                error_code,
+                count,
+                errors.vus.get(window, 0),
+            ])
+    records.sort(key=lambda record: (record[0], record[1], record[2], record[3]))
+    return pd.DataFrame(records, columns=["Waktu (s)", "Langkah", "Status", "Kode Error", "Jumlah", "VU"])
+
+
+def save_errors(error_df, error_timeline_df, prefix=""):
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+
+    error_file = f"{prefix}errors_{timestamp}.csv"
+    error_df.to_csv(error_file, index=False)
+    print(f"Taksonomi error disimpan ke {error_file}")
+
+    timeline_file = f"{prefix}errors_timeline_{timestamp}.csv"
+    error_timeline_df.to_csv(timeline_file, index=False)
+    print(f"Error per jendela waktu disimpan ke {timeline_file}")
@@ -0,0 +1,48 @@
+import os
+
+from .parser import READ_BLOCK_SIZE
+
+
+class FileTail:
+    """Membaca baris-baris baru dari file NDJSON yang masih ditulis k6.
+
+    Baris terakhir yang belum diakhiri newline ditahan sampai lengkap. Jika
+    file belum ada, pembacaan menghasilkan daftar kosong; jika file menyusut
+    (k6 dijalankan ulang dengan path yang sama), pembacaan dimulai dari awal.
+    """
+
+    def __init__(self, path, block_size=READ_BLOCK_SIZE):
+        self.path = path
+        self.block_size = block_size
+        self.position = 0
+        self.pending = b''
+        self.restarted = False
+
+    def read_lines(self):
+        try:
+            size = os.path.getsize(self.path)
+        except OSError:
+            return []
+
+        if size < self.position:
+            self.position = 0
+            self.pending = b''
+            self.restarted = True
+        if size == self.position:
+            return []
+
+        with open(self.path, 'rb') as f:
+            f.seek(self.position)
+            data = f.read(min(size - self.position, self.block_size))
+        self.position += len(data)
+
+        lines = (self.pending + data).split(b'\n')
+        self.pending = lines.pop()
+        return lines
+
+    @property
+    def at_end(self):
+        try:
+            return os.path.getsize(self.path) == self.position
+        except OSError:
+            return True
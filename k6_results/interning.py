@@ -0,0 +1,54 @@
+import re
+
+STEP_PATTERN = re.compile(r'::Step \d+: (.+)')
+
+
+def step_name_of(group):
+    if group and '::Step ' in group:
+        step_match = STEP_PATTERN.search(group)
+        if step_match:
+            return step_match.group(1)
+    return None
+
+
+class KeyInterner:
+    """Cache group → nama langkah dan (grup, metrik) → id kunci.
+
+    Tag ``group`` hanya memiliki sedikit nilai berbeda, sehingga regex dan
+    pembentukan string kunci cukup dilakukan sekali per kombinasi; setiap
+    titik berikutnya hanya membutuhkan dua lookup dict. Entri berupa tuple
+    ``(id, kunci, nama_langkah, nama_metrik)``.
+    """
+
+    def __init__(self):
+        self.entries = []
+        self._by_key = {}
+        self._by_metric = {}
+        self._step_names = {}
+
+    def __len__(self):
+        return len(self.entries)
+
+    def step_name(self, group):
+        step_name = self._step_names.get(group, False)
+        if step_name is False:
+            step_name = self._step_names[group] = step_name_of(group)
+        return step_name
+
+    def lookup(self, group, metric_name):
+        groups = self._by_metric.get(metric_name)
+        if groups is None:
+            groups = self._by_metric[metric_name] = {}
+        entry = groups.get(group)
+        if entry is None:
+            step_name = self.step_name(group)
+            key = f"{step_name}_{metric_name}" if step_name else metric_name
+            entry = groups[group] = self.intern(key, step_name, metric_name)
+        return entry
+
+    def intern(self, key, step_name, metric_name):
+        entry = self._by_key.get(key)
+        if entry is None:
+            entry = self._by_key[key] = (len(self.entries), key, step_name, metric_name)
+            self.entries.append(entry)
+        return entry
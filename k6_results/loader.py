@@ -0,0 +1,34 @@
+from .cache import ColumnBuilder, load_cache, save_cache
+from .compression import detect_compression, open_results
+from .parser import ResultAggregator, new_timeline, parse_file, parse_parallel
+
+
+def build_columns(path):
+    with open_results(path) as f:
+        return ColumnBuilder().consume(f).to_columns()
+
+
+def load_results(path, selection, streaming=False, workers=1, timeline_window=None, use_cache=True):
+    compression = detect_compression(path)
+    if compression is not None:
+        print(f"File terkompresi {compression}, didekompresi di thread latar belakang")
+        if workers > 1:
+            # Aliran terkompresi tidak dapat dipotong per rentang byte.
+            print("File terkompresi dibaca berurutan; --workers diabaikan")
+            workers = 1
+
+    # Cache kolumnar menyimpan semua titik, sehingga hanya dipakai oleh mode
+    # persis; --workers selalu mengagregasi sebagian per rentang byte.
+    if workers > 1:
+        return parse_parallel(path, selection, workers, timeline_window=timeline_window)
+    if streaming or not use_cache:
+        return parse_file(path, selection, streaming, timeline_window)
+
+    columns = load_cache(path)
+    if columns is None:
+        print("Membangun cache kolumnar dari file NDJSON...")
+        columns = build_columns(path)
+        save_cache(path, columns)
+
+    aggregator = ResultAggregator(selection, streaming, new_timeline(timeline_window))
+    return columns.replay(aggregator)
@@ -0,0 +1,195 @@
+import argparse
+import heapq
+import os
+from datetime import datetime
+from itertools import islice
+from operator import itemgetter
+
+import pandas as pd
+
+from .accumulator import StreamingStats, percentiles_of, summarize
+from .compression import open_results
+from .decoder import PointFilter, iter_points
+from .interning import step_name_of
+from .parser import ResultAggregator, new_timeline
+from .report import format_change, format_number_id, percentile_columns
+from .timeline import ALL_STEPS, NO_STEP, parse_k6_time
+
+NODE_METRICS = frozenset(['http_req_duration', 'http_req_failed'])
+CLOCK_METRICS = frozenset(['vus', 'http_req_duration'])
+CLOCK_SAMPLE_POINTS = 1000
+RESULT_SUFFIXES = ('.gz', '.zst', '.xz', '.json', '.ndjson')
+
+
+def node_names(paths):
+    names = []
+    for path in paths:
+        name = os.path.basename(path)
+        while name.endswith(RESULT_SUFFIXES):
+            name = os.path.splitext(name)[0]
+        if name in names:
+            name = f"{name}#{len(names) + 1}"
+        names.append(name)
+    return names
+
+
+def estimate_start(path):
+    """Awal pengujian menurut jam node: waktu terkecil di antara titik awal file."""
+    with open_results(path) as f:
+        points = iter_points(f, PointFilter(CLOCK_METRICS.__contains__))
+        times = [parse_k6_time(point_data['time']) for _, point_data in islice(points, CLOCK_SAMPLE_POINTS)]
+    return min(times) if times else None
+
+
+def estimate_clock_offsets(paths):
+    """Koreksi jam per node terhadap node pertama.
+
+    Runner k6 terdistribusi dimulai bersamaan, sehingga selisih awal
+    pengujian antarfile dianggap sebagai selisih jam antarmesin.
+    """
+    starts = [estimate_start(path) for path in paths]
+    reference = starts[0]
+    return [reference - start if reference is not None and start is not None else 0.0 for start in starts]
+
+
+def parse_clock_offset(text):
+    node, separator, seconds = text.rpartition('=')
+    try:
+        if not separator or not node:
+            raise ValueError
+        return node, float(seconds)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"Koreksi jam harus berbentuk NODE=DETIK: {text}")
+
+
+def resolve_clock_offsets(paths, align_clocks=False, manual_offsets=()):
+    """Koreksi jam per file: estimasi (jika diminta), lalu ditimpa nilai manual per nama node."""
+    names = node_names(paths)
+    offsets = estimate_clock_offsets(paths) if align_clocks else [0.0] * len(paths)
+    manual = dict(manual_offsets)
+    unknown = set(manual) - set(names)
+    if unknown:
+        raise ValueError(f"Node tidak dikenal pada --clock-offset: {', '.join(sorted(unknown))} "
+                         f"(tersedia: {', '.join(names)})")
+    return [manual.get(name, offset) for name, offset in zip(names, offsets)]
+
+
+def iter_node_points(path, node, offset, point_filter):
+    with open_results(path) as f:
+        for metric_name, point_data in iter_points(f, point_filter):
+            yield parse_k6_time(point_data['time']) + offset, node, metric_name, point_data
+
+
+class NodeStats:
+    __slots__ = ("latency", "failed", "checked", "start", "end")
+
+    def __init__(self):
+        self.latency = StreamingStats()
+        self.failed = 0
+        self.checked = 0
+        self.start = None
+        self.end = None
+
+    def add(self, metric_name, timestamp, value):
+        if self.start is None or timestamp < self.start:
+            self.start = timestamp
+        if self.end is None or timestamp > self.end:
+            self.end = timestamp
+        if metric_name == 'http_req_duration':
+            self.latency.append(value)
+        else:
+            self.failed += value
+            self.checked += 1
+
+
+class NodeTable:
+    """Agregat http_req_duration/http_req_failed per (node, langkah k6)."""
+
+    def __init__(self, names, offsets):
+        self.names = list(names)
+        self.offsets = dict(zip(names, offsets))
+        self.stats = {}
+        self._step_names = {}
+
+    def add(self, node, metric_name, tags, timestamp, value):
+        group = tags.get('group', '') if tags else ''
+        step_name = self._step_names.get(group)
+        if step_name is None:
+            step_name = self._step_names[group] = step_name_of(group) or NO_STEP
+        for key in ((node, ALL_STEPS), (node, step_name)):
+            stats = self.stats.get(key)
+            if stats is None:
+                stats = self.stats[key] = NodeStats()
+            stats.add(metric_name, timestamp, value)
+
+
+def merge_results(paths, selection, streaming=False, timeline_window=None, offsets=None):
+    """Gabungkan beberapa file NDJSON sebagai satu pengujian.
+
+    Titik dari setiap file dibaca berurutan dan digabung per waktu
+    (sudah dikoreksi) dengan k-way merge, sehingga memori tidak bergantung
+    pada ukuran file. Output k6 hanya kira-kira berurutan waktu; agregat
+    tidak bergantung pada urutan titik.
+    """
+    names = node_names(paths)
+    offsets = offsets or [0.0] * len(paths)
+    aggregator = ResultAggregator(selection, streaming, new_timeline(timeline_window))
+    nodes = NodeTable(names, offsets)
+
+    def is_relevant(metric_name):
+        return aggregator.is_relevant(metric_name) or metric_name in NODE_METRICS
+
+    filters = [PointFilter(is_relevant) for _ in paths]
+    streams = [iter_node_points(path, node, offset, point_filter)
+               for path, node, offset, point_filter in zip(paths, names, offsets, filters)]
+
+    for timestamp, node, metric_name, point_data in heapq.merge(*streams, key=itemgetter(0)):
+        if metric_name in NODE_METRICS:
+            nodes.add(node, metric_name, point_data.get('tags'), timestamp, point_data['value'])
+        if aggregator.is_relevant(metric_name):
+            aggregator.add_point(metric_name, point_data, timestamp, node)
+
+    aggregator.lines = sum(point_filter.lines for point_filter in filters)
+    aggregator.decoded = sum(point_filter.decoded for point_filter in filters)
+    return aggregator, nodes
+
+
+def prepare_node_table(nodes, start_time, percentiles=(50, 95, 99)):
+    df = pd.DataFrame(columns=[
+        "Node",
+        "Langkah",
+        "Koreksi Jam (s)",
+        "Mulai (s)",
+        "Permintaan",
+        "Rata-rata (ms)",
+    ] + percentile_columns(percentiles) + [
+        "Error (%)",
+        "Throughput (/min)",
+    ])
+
+    order = {name: i for i, name in enumerate(nodes.names)}
+    for (node, step_name), stats in sorted(nodes.stats.items(),
+                                           key=lambda item: (order[item[0][0]], item[0][1] != ALL_STEPS, item[0][1])):
+        summary = summarize(stats.latency)
+        requests = stats.latency.count
+        duration_mins = (stats.end - stats.start) / 60 if stats.start is not None else 0
+        df.loc[len(df)] = [
+            node,
+            step_name,
+            format_change(nodes.offsets[node], 3, ""),
+            format_number_id(stats.start - start_time if start_time is not None else None, 1),
+            format_number_id(requests, 0),
+            format_number_id(summary[0] if summary else None),
+            *[format_number_id(value) for value in (percentiles_of(stats.latency, percentiles) if summary else [None] * len(percentiles))],
+            format_number_id(stats.failed / stats.checked * 100, 1) if stats.checked else "N/A",
+            format_number_id(requests / duration_mins if duration_mins > 0 else 0, 1),
+        ]
+
+    return df
+
+
+def save_node_table(df, prefix=""):
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    node_file = f"{prefix}nodes_{timestamp}.csv"
+    df.to_csv(node_file, index=False)
+    print(f"Ringkasan per node disimpan ke {node_file}")
@@ -0,0 +1,342 @@
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from .accumulator import StreamingStats, extend_sample_buffer, new_sample_buffer
+from .compression import open_results
+from .correlation import chunk_bytes_of, chunk_count_of, correlation_id
+from .endpoints import ENDPOINT_METRICS, EndpointTable
+from .errors import ERROR_METRICS, TAGGED_ERROR_METRICS, ErrorTaxonomy
+from .decoder import PointFilter, iter_points
+from .interning import KeyInterner
+from .timeline import NO_STEP, TIMELINE_METRICS, Timeline, parse_k6_time
+
+READ_BLOCK_SIZE = 16 * 1024 * 1024
+
+
+class MetricRule:
+    def __init__(self, names=(), suffixes=()):
+        self.names = frozenset(names)
+        self.suffixes = tuple(suffixes)
+
+    def matches(self, metric_name):
+        return metric_name in self.names or (bool(self.suffixes) and metric_name.endswith(self.suffixes))
+
+
+class MetricSelection:
+    """Aturan metrik yang dikumpulkan sebagai durasi, error, dan hitungan,
+    serta operasi bertahap (``Correlation``) yang digabung per id dan apakah
+    latensi per endpoint ikut dikumpulkan."""
+
+    def __init__(self, duration, failed, count, correlations=(), endpoints=False):
+        self.duration = duration
+        self.failed = failed
+        self.count = count
+        self.correlations = tuple(correlations)
+        self.endpoints = endpoints
+
+    def is_relevant(self, metric_name):
+        return (self.duration.matches(metric_name)
+                or self.failed.matches(metric_name)
+                or self.count.matches(metric_name))
+
+
+class ResultAggregator:
+    def __init__(self, selection, streaming=False, timeline=None):
+        self.selection = selection
+        self.streaming = streaming
+        self.timeline = timeline
+        self.keys = KeyInterner()
+        self._durations = {}
+        self._failures = {}
+        self._counts = {}
+        self._roles = {}
+        self.correlations = [correlation.collector(streaming) for correlation in selection.correlations]
+        self._correlated = {}
+        for collector in self.correlations:
+            for metric_name in collector.correlation.metrics:
+                self._correlated.setdefault(metric_name, []).append(collector)
+        self.endpoints = EndpointTable(streaming) if selection.endpoints else None
+        self.errors = ErrorTaxonomy()
+        self.start_time = None
+        self.end_time = None
+        self.lines = 0
+        self.decoded = 0
+
+    @property
+    def metrics(self):
+        return self._by_key(self._durations)
+
+    @property
+    def error_metrics(self):
+        return self._by_key(self._failures)
+
+    @property
+    def count_metrics(self):
+        return self._by_key(self._counts)
+
+    def _by_key(self, table):
+        entries = self.keys.entries
+        return {entries[key_id][1]: value for key_id, value in table.items()}
+
+    def iter_keys(self):
+        for key_id, key, step_name, metric_name in self.keys.entries:
+            yield (key, step_name, metric_name, self._durations.get(key_id),
+                   self._failures.get(key_id), self._counts.get(key_id))
+
+    def is_correlated(self, metric_name):
+        return metric_name in self._correlated
+
+    def _new_samples(self):
+        return StreamingStats() if self.streaming else new_sample_buffer()
+
+    def is_relevant(self, metric_name):
+        return (self.selection.is_relevant(metric_name)
+                or metric_name in ERROR_METRICS
+                or (self.timeline is not None and metric_name in TIMELINE_METRICS))
+
+    def roles_of(self, metric_name):
+        roles = self._roles.get(metric_name)
+        if roles is None:
+            selection = self.selection
+            roles = self._roles[metric_name] = (
+                selection.duration.matches(metric_name),
+                selection.failed.matches(metric_name),
+                selection.count.matches(metric_name),
+                self.timeline is not None and metric_name in TIMELINE_METRICS,
+                self.endpoints is not None and metric_name in ENDPOINT_METRICS,
+                metric_name in ERROR_METRICS,
+            )
+        return roles
+
+    def consume(self, lines):
+        point_filter = PointFilter(self.is_relevant)
+        for metric_name, point_data in iter_points(lines, point_filter):
+            self.add_point(metric_name, point_data)
+        self.lines += point_filter.lines
+        self.decoded += point_filter.decoded
+        return self
+
+    def _observe_time(self, first, last):
+        if self.start_time is None or first < self.start_time:
+            self.start_time = first
+        if self.end_time is None or last > self.end_time:
+            self.end_time = last
+
+    def _samples(self, table, key_id):
+        samples = table.get(key_id)
+        if samples is None:
+            samples = table[key_id] = self._new_samples()
+        return samples
+
+    def _extend(self, table, key_id, values):
+        samples = self._samples(table, key_id)
+        if self.streaming:
+            samples.extend(values)
+        else:
+            extend_sample_buffer(samples, values)
+
+    def add_point(self, metric_name, point_data, timestamp=None, node=None):
+        """``node`` membedakan id operasi (mis. ``VU:ITER``) yang sama dari
+        beberapa generator beban saat hasilnya digabung."""
+        if timestamp is None:
+            timestamp = parse_k6_time(point_data['time'])
+        if self.start_time is None or timestamp < self.start_time:
+            self.start_time = timestamp
+        if self.end_time is None or timestamp > self.end_time:
+            self.end_time = timestamp
+
+        value = point_data['value']
+        tags = point_data.get('tags')
+        key_id, _, step_name, _ = self.keys.lookup(tags.get('group', '') if tags else '', metric_name)
+        is_duration, is_failed, is_count, in_timeline, per_endpoint, in_errors = self.roles_of(metric_name)
+
+        if is_duration:
+            self._samples(self._durations, key_id).append(value)
+
+        if is_failed:
+            self._samples(self._failures, key_id).append(value)
+
+        if is_count:
+            self._counts[key_id] = self._counts.get(key_id, 0) + value
+
+        if in_timeline:
+            self.timeline.add(step_name or NO_STEP, metric_name, timestamp, value)
+
+        if per_endpoint:
+            self.endpoints.add(metric_name, tags, value)
+
+        if in_errors:
+            self.errors.add(step_name or NO_STEP, metric_name, tags, timestamp, value)
+
+        collectors = self._correlated.get(metric_name)
+        if collectors:
+            ref = correlation_id(point_data, tags)
+            if ref is not None:
+                if node is not None:
+                    ref = f"{node}/{ref}"
+                chunk_bytes = chunk_bytes_of(point_data, tags)
+                expected_chunks = chunk_count_of(point_data, tags)
+                for collector in collectors:
+                    collector.add(metric_name, ref, value, chunk_bytes, timestamp, expected_chunks)
+
+    def needs_tags(self, metric_name):
+        """Apakah titik metrik ini juga membutuhkan ``add_tagged_batch``."""
+        _, _, _, _, per_endpoint, in_errors = self.roles_of(metric_name)
+        return per_endpoint or (in_errors and metric_name in TAGGED_ERROR_METRICS)
+
+    def add_batch(self, metric_name, group, times, values, refs=None, chunk_bytes=None):
+        """Versi vektor dari ``add_point`` untuk titik bermetrik dan grup k6 sama,
+        tanpa konsumen yang membutuhkan tag lengkap (lihat ``add_tagged_batch``).
+        ``refs`` dan ``chunk_bytes`` berisi id korelasi dan ukuran chunk per titik
+        untuk metrik yang digabung."""
+        if not self.is_relevant(metric_name) or len(values) == 0:
+            return
+        self._observe_time(float(times.min()), float(times.max()))
+
+        key_id, _, step_name, _ = self.keys.lookup(group, metric_name)
+        is_duration, is_failed, is_count, in_timeline, per_endpoint, in_errors = self.roles_of(metric_name)
+
+        if is_duration:
+            self._extend(self._durations, key_id, values)
+
+        if is_failed:
+            self._extend(self._failures, key_id, values)
+
+        if is_count:
+            self._counts[key_id] = self._counts.get(key_id, 0) + float(values.sum())
+
+        if in_timeline:
+            self.timeline.add_many(step_name or NO_STEP, metric_name, times, values)
+
+        if in_errors and metric_name not in TAGGED_ERROR_METRICS:
+            self.errors.add_many(step_name or NO_STEP, metric_name, None, times, values)
+
+        if refs is not None:
+            for collector in self._correlated.get(metric_name, ()):
+                collector.add_many(metric_name, refs, values, chunk_bytes)
+
+    def add_tagged_batch(self, metric_name, tagsets, tagset_ids, times, values):
+        """Bagian ``add_batch`` yang membutuhkan tag lengkap setiap titik.
+
+        Titik dikelompokkan ulang per kumpulan tag: semuanya untuk tabel
+        endpoint, atau hanya titik gagal jika yang membutuhkan hanya
+        taksonomi error.
+        """
+        _, _, _, _, per_endpoint, in_errors = self.roles_of(metric_name)
+        in_errors = in_errors and metric_name in TAGGED_ERROR_METRICS
+        if not per_endpoint:
+            failed = values > 0
+            tagset_ids, times, values = tagset_ids[failed], times[failed], values[failed]
+        if len(values) == 0:
+            return
+
+        order = np.argsort(tagset_ids, kind='stable')
+        tagset_ids, times, values = tagset_ids[order], times[order], values[order]
+        unique_ids, starts = np.unique(tagset_ids, return_index=True)
+        ends = np.append(starts[1:], len(tagset_ids))
+        for tagset_id, start, end in zip(unique_ids.tolist(), starts.tolist(), ends.tolist()):
+            tags = tagsets[tagset_id]
+            if per_endpoint:
+                self.endpoints.add_many(metric_name, tags, values[start:end])
+            if in_errors:
+                step_name = self.keys.step_name(tags.get('group', ''))
+                self.errors.add_many(step_name or NO_STEP, metric_name, tags, times[start:end], values[start:end])
+
+    def merge(self, other):
+        remap = {entry[0]: self.keys.intern(*entry[1:])[0] for entry in other.keys.entries}
+
+        for own, theirs in ((self._durations, other._durations), (self._failures, other._failures)):
+            for other_id, samples in theirs.items():
+                key_id = remap[other_id]
+                if key_id not in own:
+                    own[key_id] = samples
+                elif self.streaming:
+                    own[key_id].merge(samples)
+                else:
+                    own[key_id].extend(samples)
+
+        for other_id, value in other._counts.items():
+            key_id = remap[other_id]
+            self._counts[key_id] = self._counts.get(key_id, 0) + value
+
+        if other.start_time is not None and (self.start_time is None or other.start_time < self.start_time):
+            self.start_time = other.start_time
+        if other.end_time is not None and (self.end_time is None or other.end_time > self.end_time):
+            self.end_time = other.end_time
+
+        if self.timeline is not None and other.timeline is not None:
+            self.timeline.merge(other.timeline)
+
+        for own, theirs in zip(self.correlations, other.correlations):
+            own.merge(theirs)
+
+        if self.endpoints is not None and other.endpoints is not None:
+            self.endpoints.merge(other.endpoints)
+
+        self.errors.merge(other.errors)
+
+        self.lines += other.lines
+        self.decoded += other.decoded
+        return self
+
+
+def split_line_ranges(path, parts):
+    size = os.path.getsize(path)
+    if parts <= 1 or size == 0:
+        return [(0, size)]
+
+    boundaries = [0]
+    with open(path, 'rb') as f:
+        for i in range(1, parts):
+            f.seek(max(size * i // parts, boundaries[-1]))
+            f.readline()
+            position = min(f.tell(), size)
+            if position > boundaries[-1]:
+                boundaries.append(position)
+    if boundaries[-1] != size:
+        boundaries.append(size)
+    return list(zip(boundaries[:-1], boundaries[1:]))
+
+
+def iter_range_lines(path, start, end, block_size=READ_BLOCK_SIZE):
+    with open(path, 'rb') as f:
+        f.seek(start)
+        remaining = end - start
+        pending = b''
+        while remaining > 0:
+            block = f.read(min(block_size, remaining))
+            if not block:
+                break
+            remaining -= len(block)
+            lines = (pending + block).split(b'\n')
+            pending = lines.pop()
+            yield from lines
+        if pending:
+            yield pending
+
+
+def new_timeline(timeline_window):
+    return Timeline(timeline_window) if timeline_window else None
+
+
+def _parse_range(path, start, end, selection, streaming, timeline_window):
+    aggregator = ResultAggregator(selection, streaming, new_timeline(timeline_window))
+    return aggregator.consume(iter_range_lines(path, start, end))
+
+
+def parse_file(path, selection, streaming=False, timeline_window=None):
+    with open_results(path) as f:
+        return ResultAggregator(selection, streaming, new_timeline(timeline_window)).consume(f)
+
+
+def parse_parallel(path, selection, workers, streaming=True, timeline_window=None):
+    ranges = split_line_ranges(path, workers)
+    aggregator = ResultAggregator(selection, streaming, new_timeline(timeline_window))
+    with ProcessPoolExecutor(max_workers=min(workers, len(ranges))) as executor:
+        futures = [executor.submit(_parse_range, path, start, end, selection, streaming, timeline_window)
+                   for start, end in ranges]
+        for future in futures:
+            aggregator.merge(future.result())
+    return aggregator
@@ -0,0 +1,90 @@
+from datetime import datetime
+
+import pandas as pd
+
+from .accumulator import combine_samples, percentiles_of, summarize
+from .report import format_number_id, percentile_columns
+from .timeline import ALL_STEPS, NO_STEP
+
+PHASE_METRICS = {
+    'http_req_blocked': "Blocked (antre + DNS + TCP + TLS)",
+    'http_req_connecting': "Connecting (TCP, bagian dari blocked)",
+    'http_req_tls_handshaking': "TLS Handshake (bagian dari blocked)",
+    'http_req_sending': "Sending",
+    'http_req_waiting': "Waiting (TTFB)",
+    'http_req_receiving': "Receiving",
+}
+# k6 sudah menghitung waktu connecting dan TLS di dalam http_req_blocked.
+BLOCKED_PHASE = 'http_req_blocked'
+CONNECTION_PHASES = ('http_req_connecting', 'http_req_tls_handshaking')
+
+
+def collect_phases(aggregator):
+    """Sampel fase per (langkah k6, metrik fase), ditambah gabungan semua langkah."""
+    phases = {}
+    for key, step_name, metric_name, durations, failures, count in aggregator.iter_keys():
+        if metric_name not in PHASE_METRICS or durations is None:
+            continue
+        for name in (step_name or NO_STEP, ALL_STEPS):
+            phases.setdefault(name, {}).setdefault(metric_name, []).append(durations)
+    return {name: {metric_name: combine_samples(parts) for metric_name, parts in step_phases.items()}
+            for name, step_phases in phases.items()}
+
+
+def prepare_phase_table(aggregator, percentiles=(50, 95, 99)):
+    """Rincian waktu permintaan HTTP per fase untuk setiap langkah k6.
+
+    Porsi dihitung dari jumlah rata-rata fase yang tidak tumpang tindih:
+    blocked (sudah termasuk connecting dan TLS), sending, waiting, dan
+    receiving. Sisa blocked di luar connecting/TLS ditampilkan sebagai antrean
+    koneksi (dan DNS). Porsi blocked yang besar menandakan koneksi tidak
+    dipakai ulang atau kehabisan slot, porsi waiting yang besar menandakan
+    waktu proses di server.
+    """
+    phases = collect_phases(aggregator)
+
+    df = pd.DataFrame(columns=[
+        "Langkah k6",
+        "Fase",
+        "Rata-rata (ms)",
+    ] + percentile_columns(percentiles) + [
+        "Maks (ms)",
+        "Porsi (%)",
+    ])
+
+    for name in sorted(phases, key=lambda name: (name == ALL_STEPS, name)):
+        step_phases = phases[name]
+        summaries = {metric_name: summarize(samples) for metric_name, samples in step_phases.items()}
+        averages = {metric_name: summary[0] for metric_name, summary in summaries.items() if summary is not None}
+        connection = sum(averages.get(metric_name, 0.0) for metric_name in CONNECTION_PHASES)
+        blocked = averages.get(BLOCKED_PHASE)
+        total = sum(avg for metric_name, avg in averages.items()
+                    if blocked is None or metric_name not in CONNECTION_PHASES)
+
+        for metric_name, label in PHASE_METRICS.items():
+            summary = summaries.get(metric_name)
+            if summary is None:
+                continue
+            avg, _, max_val, _ = summary
+            df.loc[len(df)] = [
+                name,
+                label,
+                format_number_id(avg),
+                *[format_number_id(value) for value in percentiles_of(step_phases[metric_name], percentiles)],
+                format_number_id(max_val),
+                format_number_id(avg / total * 100, 1) if total else "N/A",
+            ]
+
+        if total and blocked is not None:
+            queued = max(blocked - connection, 0.0)
+            df.loc[len(df)] = [name, "Antre/DNS (blocked - connecting - TLS)", format_number_id(queued)] + \
+                ["-"] * len(percentiles) + ["-", format_number_id(queued / total * 100, 1)]
+
+    return df
+
+
+def save_phase_table(df, prefix=""):
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    phase_file = f"{prefix}phases_{timestamp}.csv"
+    df.to_csv(phase_file, index=False)
+    print(f"Rincian fase HTTP disimpan ke {phase_file}")
@@ -0,0 +1,56 @@
+import argparse
+
+from .accumulator import DEFAULT_PERCENTILES
+
+
+def format_number_id(number, decimal_places=2):
+    if number is None:
+        return "N/A"
+        
+    if decimal_places == 0:
+        number_str = str(round(number))
+    else:
+        number_str = f"{number:.{decimal_places}f}"
+    
+    if '.' in number_str:
+        main_part, decimal_part = number_str.split('.')
+    else:
+        main_part, decimal_part = number_str, ""
+    
+    result = ""
+    for i, digit in enumerate(reversed(main_part)):
+        if i > 0 and i % 3 == 0:
+            result = '.' + result
+        result = digit + result
+    
+    if decimal_part:
+        result = result + ',' + decimal_part
+    
+    return result
+
+
+def parse_percentiles(text):
+    try:
+        percentiles = [float(part) for part in text.split(',') if part.strip()]
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"Daftar persentil tidak valid: {text}")
+    for p in percentiles:
+        if not 0 <= p <= 100:
+            raise argparse.ArgumentTypeError(f"Persentil harus di antara 0 dan 100: {p:g}")
+    return percentiles
+
+
+def percentile_columns(percentiles=DEFAULT_PERCENTILES):
+    return [f"P{p:g} (ms)".replace('.', ',') for p in percentiles]
+
+
+def add_percentile_argument(arg_parser):
+    arg_parser.add_argument("--percentiles", type=parse_percentiles, default=list(DEFAULT_PERCENTILES),
+                            help="persentil yang ditampilkan, dipisah koma (default: 50,90,95,99,99.9)")
+
+
+def format_change(number, decimal_places=1, unit="%"):
+    if number is None:
+        return "N/A"
+    sign = "+" if number >= 0 else "-"
+    return f"{sign}{format_number_id(abs(number), decimal_places)}{unit}"
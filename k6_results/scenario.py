@@ -0,0 +1,409 @@
+import re
+
+import pandas as pd
+
+from datetime import datetime
+
+from .accumulator import DEFAULT_PERCENTILES, combine_samples, percentiles_of, summarize, total_of
+from .correlation import Correlation
+from .parser import MetricRule, MetricSelection
+from .phases import PHASE_METRICS
+from .report import format_number_id, percentile_columns
+from .timeline import ALL_STEPS, NO_STEP, megabytes_per_second
+
+OVERALL_DURATION = 'http_req_duration'
+OVERALL_FAILED = 'http_req_failed'
+OVERALL_REQUESTS = 'http_reqs'
+TRANSFER_METRICS = ('data_sent', 'data_received')
+
+DURATION, FAILED, REQUESTS = 'duration', 'failed', 'requests'
+
+
+class Part:
+    """Satu jenis permintaan di dalam langkah komposit. ``carries_bytes``
+    menandai bagian yang titik durasinya membawa ``chunk_bytes``."""
+
+    def __init__(self, duration, failed=None, requests=None, carries_bytes=False):
+        self.metrics = {DURATION: duration, FAILED: failed, REQUESTS: requests}
+        self.carries_bytes = carries_bytes
+
+
+class Step:
+    """Satu baris laporan.
+
+    Dengan ``group``, metrik dicari hanya di dalam grup k6 ``Step N: <group>``
+    (default: metrik HTTP bawaan). Tanpa ``group``, metrik dicari berdasarkan
+    nama di grup mana pun. Langkah komposit didefinisikan dengan ``parts``;
+    titik-titiknya digabung per operasi (``upload_ref`` atau VU/iterasi)
+    sehingga latensinya adalah jumlah durasi semua bagian per operasi.
+    """
+
+    def __init__(self, label, group=None, duration=None, failed=None, requests=None, parts=None, optional=False):
+        self.label = label
+        self.group = group
+        if parts is None:
+            if group is not None:
+                duration = duration or OVERALL_DURATION
+                failed = failed or OVERALL_FAILED
+                requests = requests or OVERALL_REQUESTS
+            parts = [Part(duration, failed, requests)]
+        self.parts = parts
+        self.optional = optional
+
+    @property
+    def is_composite(self):
+        return len(self.parts) > 1
+
+    @property
+    def correlation(self):
+        if not self.is_composite:
+            return None
+        bytes_metric = next((part.metrics[DURATION] for part in self.parts if part.carries_bytes), None)
+        return Correlation(self.label, [part.metrics[DURATION] for part in self.parts], bytes_metric)
+
+
+class Scenario:
+    def __init__(self, name, title, steps, output_prefix="", separator_width=100, show_available_metrics=False):
+        self.name = name
+        self.title = title
+        self.steps = steps
+        self.output_prefix = output_prefix
+        self.separator_width = separator_width
+        self.show_available_metrics = show_available_metrics
+        self._index = None
+
+    @property
+    def key(self):
+        return re.sub(r'\W+', '_', self.name).strip('_')
+
+    def metric_names(self, role):
+        names = {part.metrics[role] for step in self.steps for part in step.parts if part.metrics[role]}
+        names.add({DURATION: OVERALL_DURATION, FAILED: OVERALL_FAILED, REQUESTS: OVERALL_REQUESTS}[role])
+        if role == REQUESTS:
+            names.update(TRANSFER_METRICS)
+        return names
+
+    def selection(self, phases=False, endpoints=False):
+        duration_names = self.metric_names(DURATION)
+        if phases:
+            duration_names |= set(PHASE_METRICS)
+        return MetricSelection(
+            duration=MetricRule(names=duration_names),
+            failed=MetricRule(names=self.metric_names(FAILED)),
+            count=MetricRule(names=self.metric_names(REQUESTS)),
+            correlations=[step.correlation for step in self.steps if step.is_composite],
+            endpoints=endpoints,
+        )
+
+    @property
+    def index(self):
+        if self._index is None:
+            self._index = ScenarioIndex(self)
+        return self._index
+
+
+class ScenarioIndex:
+    """Definisi skenario yang dikompilasi menjadi lookup langsung
+    (nama langkah k6, metrik) → daftar (langkah, bagian, peran)."""
+
+    def __init__(self, scenario):
+        self.by_group_metric = {}
+        self.by_metric = {}
+        for step_index, step in enumerate(scenario.steps):
+            for part_index, part in enumerate(step.parts):
+                for role, metric_name in part.metrics.items():
+                    if not metric_name:
+                        continue
+                    target = (step_index, part_index, role)
+                    if step.group is not None:
+                        self.by_group_metric.setdefault((step.group, metric_name), []).append(target)
+                    else:
+                        self.by_metric.setdefault(metric_name, []).append(target)
+
+    def targets(self, step_name, metric_name):
+        return self.by_group_metric.get((step_name, metric_name), []) + self.by_metric.get(metric_name, [])
+
+
+class StepData:
+    def __init__(self, part_count):
+        self.parts = [{DURATION: [], FAILED: [], REQUESTS: 0} for _ in range(part_count)]
+
+    def durations(self, part_index=0):
+        return combine_samples(self.parts[part_index][DURATION])
+
+    def failures(self, part_index=0):
+        return combine_samples(self.parts[part_index][FAILED])
+
+    def requests(self, part_index=0):
+        return self.parts[part_index][REQUESTS]
+
+
+def collect_step_data(scenario, aggregator):
+    index = scenario.index
+    step_data = [StepData(len(step.parts)) for step in scenario.steps]
+    overall = StepData(1)
+
+    for key, step_name, metric_name, durations, failures, count in aggregator.iter_keys():
+        values = {DURATION: durations, FAILED: failures, REQUESTS: count}
+        for step_index, part_index, role in index.targets(step_name, metric_name):
+            _add_value(step_data[step_index].parts[part_index], role, values[role])
+
+        if step_name is None:
+            for role, metric_name_for_role in ((DURATION, OVERALL_DURATION), (FAILED, OVERALL_FAILED),
+                                               (REQUESTS, OVERALL_REQUESTS)):
+                if metric_name == metric_name_for_role:
+                    _add_value(overall.parts[0], role, values[role])
+
+    return step_data, overall
+
+
+def _add_value(part_data, role, value):
+    if value is None:
+        return
+    if role == REQUESTS:
+        part_data[REQUESTS] += value
+    else:
+        part_data[role].append(value)
+
+
+class StepResult:
+    """Angka satu langkah sebelum diformat ke tabel.
+
+    ``durations`` berisi sampel (array atau ``StreamingStats``) untuk
+    persentil; None jika distribusi langkah tidak diketahui.
+    """
+
+    def __init__(self, avg, min_val, max_val, std_dev, durations=None, failed=0.0, attempts=0, throughput=None):
+        self.avg = avg
+        self.min = min_val
+        self.max = max_val
+        self.std_dev = std_dev
+        self.durations = durations
+        self.failed = failed
+        self.attempts = attempts
+        self.throughput = throughput
+
+    @property
+    def error_rate(self):
+        return self.failed / self.attempts * 100 if self.attempts else None
+
+
+def _throughput(requests, test_duration_mins):
+    if not requests:
+        return None
+    return requests / test_duration_mins if test_duration_mins > 0 else 0
+
+
+def _composite_result(step, data, collector, test_duration_mins):
+    first_durations = data.durations(0)
+    if first_durations is None or not len(first_durations):
+        return None
+
+    failed = requests = 0.0
+    for part_index in range(len(step.parts)):
+        failures = data.failures(part_index)
+        if failures is not None:
+            failed += total_of(failures)
+        requests += data.requests(part_index)
+
+    joined = collector.durations() if collector is not None else ()
+    if len(joined):
+        avg, min_val, max_val, std_dev = summarize(joined)
+        durations = joined
+    else:
+        # Tanpa id korelasi hanya rata-rata yang dapat disusun: rata-rata
+        # tiap bagian dikali jumlah permintaan teramati per operasi.
+        print(f"Tidak ada upload_ref atau VU/iterasi untuk {step.label}, hanya rata-rata yang diperkirakan")
+        operations = len(first_durations)
+        avg = 0.0
+        for part_index in range(len(step.parts)):
+            durations = data.durations(part_index)
+            if durations is not None and len(durations):
+                avg += summarize(durations)[0] * len(durations) / operations
+        min_val = max_val = std_dev = durations = None
+
+    # Error dihitung per permintaan di seluruh bagian; throughput mengikuti
+    # bagian pertama agar satu operasi dihitung sekali.
+    return StepResult(avg, min_val, max_val, std_dev, durations, failed, requests,
+                      _throughput(data.requests(0), test_duration_mins))
+
+
+def _simple_result(data, test_duration_mins):
+    durations = data.durations()
+    if durations is None:
+        return None
+    summary = summarize(durations)
+    if summary is None:
+        return None
+    failures = data.failures()
+    requests = data.requests()
+    # Rate bawaan k6 (http_req_failed) mencatat 0/1 untuk setiap permintaan,
+    # sedangkan Rate kustom di skrip hanya ditambah saat gagal; membagi
+    # jumlah kegagalan dengan nilai terbesar antara jumlah sampel dan
+    # jumlah permintaan benar untuk keduanya.
+    failed = total_of(failures) if failures is not None else 0.0
+    attempts = max(len(failures) if failures is not None else 0, requests)
+    return StepResult(*summary, durations, failed, attempts, _throughput(requests, test_duration_mins))
+
+
+def compute_step_results(scenario, aggregator, test_duration_mins):
+    """Pasangan (langkah, ``StepResult`` atau None) sesuai urutan skenario."""
+    step_data, overall = collect_step_data(scenario, aggregator)
+    collectors = {collector.correlation.label: collector for collector in aggregator.correlations}
+
+    for step, data in zip(scenario.steps, step_data):
+        if step.is_composite:
+            result = _composite_result(step, data, collectors.get(step.label), test_duration_mins)
+        else:
+            result = _simple_result(data, test_duration_mins)
+
+        if result is None and step.optional:
+            continue
+
+        if result is None and overall.durations() is not None:
+            print(f"Menggunakan metrik umum untuk {step.label}")
+            result = _simple_result(overall, test_duration_mins)
+            if result is not None:
+                result.throughput = _throughput(overall.requests() / len(scenario.steps), test_duration_mins)
+
+        if result is None:
+            print(f"Tidak menemukan data untuk {step.label}, menggunakan N/A")
+        yield step, result
+
+
+def prepare_data_table(scenario, aggregator, test_duration_mins, percentiles=DEFAULT_PERCENTILES):
+    df = pd.DataFrame(columns=[
+        "Label", 
+        "Rata-rata (ms)", 
+        "Min (ms)", 
+        "Max (ms)", 
+        "Standar Deviasi (ms)", 
+    ] + percentile_columns(percentiles) + [
+        "Error (%)", 
+        "Throughput (/min)"
+    ])
+
+    for step, result in compute_step_results(scenario, aggregator, test_duration_mins):
+        if result is None:
+            df.loc[len(df)] = [step.label] + ["N/A"] * (len(df.columns) - 1)
+            continue
+
+        if result.durations is not None:
+            percentile_values = percentiles_of(result.durations, percentiles)
+        else:
+            percentile_values = [None] * len(percentiles)
+        error_rate = result.error_rate
+
+        df.loc[len(df)] = [
+            step.label,
+            format_number_id(result.avg),
+            format_number_id(result.min),
+            format_number_id(result.max),
+            format_number_id(result.std_dev),
+            *[format_number_id(value) for value in percentile_values],
+            format_number_id(error_rate, 1) if error_rate is not None else "0,0",
+            format_number_id(result.throughput, 1),
+        ]
+
+    return df
+
+
+def prepare_transfer_table(aggregator, test_duration_mins):
+    """Byte terkirim/diterima (``data_sent``/``data_received``) per langkah k6
+    dibandingkan dengan jumlah permintaannya, rata-rata sepanjang pengujian."""
+    totals = {}
+    for key, step_name, metric_name, durations, failures, count in aggregator.iter_keys():
+        if count is None or metric_name not in TRANSFER_METRICS + (OVERALL_REQUESTS,):
+            continue
+        for name in (step_name or NO_STEP, ALL_STEPS):
+            step_totals = totals.setdefault(name, dict.fromkeys(TRANSFER_METRICS + (OVERALL_REQUESTS,), 0.0))
+            step_totals[metric_name] += count
+
+    seconds = test_duration_mins * 60
+    df = pd.DataFrame(columns=[
+        "Langkah k6",
+        "Permintaan/s",
+        "Kirim (MB)",
+        "Terima (MB)",
+        "Kirim (MB/s)",
+        "Terima (MB/s)",
+        "KB per Permintaan",
+    ])
+
+    for name in sorted(totals, key=lambda name: (name == ALL_STEPS, name)):
+        step_totals = totals[name]
+        sent, received, requests = (step_totals[metric_name] for metric_name in TRANSFER_METRICS + (OVERALL_REQUESTS,))
+        df.loc[len(df)] = [
+            name,
+            format_number_id(requests / seconds if seconds > 0 else 0, 1),
+            format_number_id(sent / 1e6, 1),
+            format_number_id(received / 1e6, 1),
+            format_number_id(megabytes_per_second(sent, seconds)),
+            format_number_id(megabytes_per_second(received, seconds)),
+            format_number_id((sent + received) / 1e3 / requests, 1) if requests else "N/A",
+        ]
+
+    return df
+
+
+def save_transfer_table(df, prefix=""):
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    transfer_file = f"{prefix}transfer_{timestamp}.csv"
+    df.to_csv(transfer_file, index=False)
+    print(f"Transfer data disimpan ke {transfer_file}")
+
+
+def prepare_correlation_table(aggregator):
+    df = pd.DataFrame(columns=[
+        "Label",
+        "Operasi Lengkap",
+        "Operasi Tidak Lengkap",
+        "Chunk per Operasi",
+        "Data Chunk (MB)",
+        "Rata-rata (MB/s)",
+        "P5 (MB/s)",
+        "P50 (MB/s)",
+        "P95 (MB/s)",
+    ])
+
+    for collector in aggregator.correlations:
+        rates = collector.transfer_rates
+        if len(rates):
+            average = total_of(rates) / len(rates)
+            p5, p50, p95 = percentiles_of(rates, (5, 50, 95))
+        else:
+            average = p5 = p50 = p95 = None
+        df.loc[len(df)] = [
+            collector.correlation.label,
+            format_number_id(collector.completed_count(), 0),
+            format_number_id(collector.incomplete_count(), 0),
+            format_number_id(collector.mean_chunks(), 1),
+            format_number_id(collector.transferred_bytes / 1e6, 1),
+            format_number_id(average),
+            format_number_id(p5),
+            format_number_id(p50),
+            format_number_id(p95),
+        ]
+
+    return df
+
+
+def save_correlation_table(df, prefix=""):
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    uploads_file = f"{prefix}uploads_{timestamp}.csv"
+    df.to_csv(uploads_file, index=False)
+    print(f"Ringkasan unggahan bertahap disimpan ke {uploads_file}")
+
+
+def print_available_metrics(aggregator):
+    print("\nMetrik durasi yang tersedia:")
+    for key, samples in sorted(aggregator.metrics.items()):
+        print(f"  - {key} ({len(samples)} nilai)")
+
+    print("\nMetrik error yang tersedia:")
+    for key, samples in sorted(aggregator.error_metrics.items()):
+        print(f"  - {key} ({len(samples)} nilai)")
+
+    print("\nMetrik count yang tersedia:")
+    for key, value in sorted(aggregator.count_metrics.items()):
+        print(f"  - {key}: {value}")
@@ -0,0 +1,117 @@
+import math
+
+import numpy as np
+
+
+class LogHistogram:
+    """Histogram dengan bucket logaritmik (gaya DDSketch).
+
+    Setiap kuantil yang dihasilkan memiliki galat relatif paling besar
+    ``relative_accuracy``, jumlah bucket dibatasi ``max_buckets`` sehingga
+    memori tetap konstan, dan dua histogram dengan akurasi yang sama dapat
+    digabung dengan menjumlahkan isi bucket-nya.
+    """
+
+    __slots__ = ("relative_accuracy", "gamma", "max_buckets", "min_value",
+                 "_log_gamma", "bins", "zero_count", "count")
+
+    def __init__(self, relative_accuracy=0.01, max_buckets=2048, min_value=1e-6):
+        self.relative_accuracy = relative_accuracy
+        self.gamma = (1 + relative_accuracy) / (1 - relative_accuracy)
+        self.max_buckets = max_buckets
+        self.min_value = min_value
+        self._log_gamma = math.log(self.gamma)
+        self.bins = {}
+        self.zero_count = 0
+        self.count = 0
+
+    def __getstate__(self):
+        return {slot: getattr(self, slot) for slot in self.__slots__}
+
+    def __setstate__(self, state):
+        for slot, value in state.items():
+            setattr(self, slot, value)
+
+    def to_dict(self):
+        return {
+            'relative_accuracy': self.relative_accuracy,
+            'max_buckets': self.max_buckets,
+            'min_value': self.min_value,
+            'zero_count': self.zero_count,
+            'bins': [[index, weight] for index, weight in sorted(self.bins.items())],
+        }
+
+    @classmethod
+    def from_dict(cls, data):
+        sketch = cls(data['relative_accuracy'], data['max_buckets'], data['min_value'])
+        sketch.bins = {index: weight for index, weight in data['bins']}
+        sketch.zero_count = data['zero_count']
+        sketch.count = sketch.zero_count + sum(sketch.bins.values())
+        return sketch
+
+    def add(self, value, weight=1):
+        self.count += weight
+        if value <= self.min_value:
+            self.zero_count += weight
+            return
+        index = math.ceil(math.log(value) / self._log_gamma)
+        bins = self.bins
+        bins[index] = bins.get(index, 0) + weight
+        if len(bins) > self.max_buckets:
+            self._collapse()
+
+    def add_many(self, values):
+        values = np.asarray(values, dtype=np.float64)
+        if values.size == 0:
+            return
+        self.count += int(values.size)
+        positive = values[values > self.min_value]
+        self.zero_count += int(values.size - positive.size)
+        if positive.size == 0:
+            return
+        indexes, weights = np.unique(np.ceil(np.log(positive) / self._log_gamma).astype(np.int64),
+                                     return_counts=True)
+        bins = self.bins
+        for index, weight in zip(indexes.tolist(), weights.tolist()):
+            bins[index] = bins.get(index, 0) + weight
+        if len(bins) > self.max_buckets:
+            self._collapse()
+
+    def _collapse(self):
+        # Bucket terkecil digabung ke tetangganya agar jumlah bucket tetap
+        # terbatas; galat hanya muncul di kuantil paling bawah.
+        ordered = sorted(self.bins)
+        excess = len(ordered) - self.max_buckets
+        target = ordered[excess]
+        moved = 0
+        for index in ordered[:excess]:
+            moved += self.bins.pop(index)
+        self.bins[target] += moved
+
+    def merge(self, other):
+        if other.gamma != self.gamma:
+            raise ValueError("Histogram dengan akurasi berbeda tidak dapat digabung")
+        bins = self.bins
+        for index, weight in other.bins.items():
+            bins[index] = bins.get(index, 0) + weight
+        self.zero_count += other.zero_count
+        self.count += other.count
+        if len(bins) > self.max_buckets:
+            self._collapse()
+        return self
+
+    def bucket_value(self, index):
+        return 2 * self.gamma ** index / (self.gamma + 1)
+
+    def quantile(self, q):
+        if self.count == 0:
+            return None
+        rank = q * (self.count - 1)
+        cumulative = self.zero_count
+        if rank < cumulative:
+            return 0.0
+        for index in sorted(self.bins):
+            cumulative += self.bins[index]
+            if rank < cumulative:
+                return self.bucket_value(index)
+        return self.bucket_value(max(self.bins))
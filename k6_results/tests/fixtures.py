@@ -0,0 +1,94 @@
+import json
+from datetime import datetime, timedelta, timezone
+
+from k6_results.endpoints import prepare_endpoint_table
+from k6_results.errors import prepare_error_table, prepare_error_timeline
+from k6_results.scenario import Part, Scenario, Step, prepare_correlation_table, prepare_data_table
+
+START = datetime(2025, 6, 1, 10, 0, 0, tzinfo=timezone(timedelta(hours=7)))
+
+
+def point(metric_name, value, seconds, step=None, vu=1, iteration=0, metadata=None, **tags):
+    """Satu baris Point k6 seperti keluaran ``--out json``."""
+    if step is not None:
+        tags['group'] = f"::Step {step}"
+    point_metadata = {'vu': str(vu), 'iter': str(iteration)}
+    point_metadata.update(metadata or {})
+    return {
+        'metric': metric_name,
+        'type': 'Point',
+        'data': {
+            'time': (START + timedelta(seconds=seconds)).isoformat(timespec='microseconds'),
+            'value': value,
+            'tags': tags,
+            'metadata': point_metadata,
+        },
+    }
+
+
+def request_points(step, duration, seconds, failed=0, vu=1, iteration=0, url="https://api.test/items"):
+    """Titik http_req_* untuk satu permintaan di dalam langkah ``step``."""
+    status = "502" if failed else "200"
+    tags = {'method': 'GET', 'url': url, 'name': url, 'status': status}
+    return [
+        point('http_req_duration', duration, seconds, step, vu, iteration, **tags),
+        point('http_req_failed', failed, seconds, step, vu, iteration, **tags),
+        point('http_reqs', 1, seconds, step, vu, iteration, **tags),
+    ]
+
+
+def upload_points(seconds, chunks=4, vu=1, iteration=0, chunk_bytes=1000000):
+    """Titik satu unggahan bertahap: init 100 ms, ``chunks`` x 200 ms, complete 50 ms."""
+    points = [point('large_file_upload_init_duration', 100, seconds, vu=vu, iteration=iteration)]
+    for chunk in range(chunks):
+        points.append(point('chunk_upload_duration', 200, seconds + 1 + chunk, vu=vu, iteration=iteration,
+                            metadata={'chunk_bytes': str(chunk_bytes)}))
+    points.append(point('complete_upload_duration', 50, seconds + chunks + 2, vu=vu, iteration=iteration,
+                        metadata={'chunk_count': str(chunks)}))
+    return points
+
+
+def write_results(path, points):
+    with open(path, 'w') as f:
+        for metric_name in sorted({p['metric'] for p in points}):
+            f.write(json.dumps({'type': 'Metric', 'data': {'name': metric_name}, 'metric': metric_name}) + '\n')
+        for p in points:
+            f.write(json.dumps(p) + '\n')
+    return str(path)
+
+
+SCENARIO = Scenario(name="uji", title="Tabel Uji", steps=[
+    Step("Detail", group="Get Detail"),
+    Step("Upload", parts=[
+        Part("large_file_upload_init_duration"),
+        Part("chunk_upload_duration", carries_bytes=True),
+        Part("complete_upload_duration"),
+    ]),
+])
+
+
+def results_points():
+    """Hasil campuran untuk ``SCENARIO``: 40 permintaan detail dan 40 unggahan tiga chunk."""
+    points = []
+    for i in range(40):
+        # url unik per permintaan: kumpulan tag berkardinalitas tinggi
+        points += request_points("1: Get Detail", 50 + i, i, failed=int(i % 7 == 0), vu=i % 4, iteration=i,
+                                 url=f"https://api.test/items/{1000 + i}")
+        points.append(point('vus', i % 4 + 1, i))
+        points.append(point('large_file_upload_init_duration', 20, i, vu=i % 4, iteration=i))
+        for chunk, size in enumerate((1000000, 1000000, 250000)):
+            points.append(point('chunk_upload_duration', 100 + chunk, i + 0.1 * (chunk + 1), vu=i % 4, iteration=i,
+                                chunk_bytes=str(size)))
+        points.append(point('complete_upload_duration', 10, i + 0.5, vu=i % 4, iteration=i))
+    return points
+
+
+def report_tables(aggregator):
+    """Tabel laporan ``SCENARIO`` yang harus sama apa pun jalur parsingnya."""
+    return [
+        prepare_data_table(SCENARIO, aggregator, 1.0, (50, 95)),
+        prepare_endpoint_table(aggregator.endpoints, 1.0),
+        prepare_error_table(aggregator.errors, aggregator.start_time, []),
+        prepare_error_timeline(aggregator.errors, aggregator.start_time),
+        prepare_correlation_table(aggregator),
+    ]
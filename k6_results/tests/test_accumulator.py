@@ -0,0 +1,129 @@
+import json
+import random
+
+import pytest
+
+from k6_results.accumulator import StreamingStats, summarize
+from k6_results.sketch import LogHistogram
+
+ACCURACY = 0.01
+QUANTILES = (0.5, 0.9, 0.95, 0.99, 0.999)
+
+
+def latencies(n=5000, seed=1):
+    """Sampel latensi berekor panjang (lognormal, dalam ms)."""
+    rng = random.Random(seed)
+    return [rng.lognormvariate(5, 0.8) for _ in range(n)]
+
+
+def streaming_stats(samples):
+    stats = StreamingStats(ACCURACY)
+    for value in samples:
+        stats.add(value)
+    return stats
+
+
+def assert_quantiles_close(stats, samples):
+    # Kuantil sketch mengikuti rank q * (n - 1) tanpa interpolasi; nilainya
+    # harus berada di antara dua sampel bertetangga setelah galat relatif
+    # sketch diperhitungkan.
+    ordered = sorted(samples)
+    for q in QUANTILES:
+        rank = q * (len(ordered) - 1)
+        low, high = ordered[int(rank)], ordered[min(int(rank) + 1, len(ordered) - 1)]
+        assert low * (1 - ACCURACY) <= stats.quantile(q) <= high * (1 + ACCURACY), q
+
+
+def test_streaming_stats_match_exact_summary():
+    samples = latencies()
+    stats = streaming_stats(samples)
+
+    assert len(stats) == len(samples)
+    assert summarize(stats) == pytest.approx(summarize(samples))
+    assert stats.total == pytest.approx(sum(samples))
+    assert_quantiles_close(stats, samples)
+
+
+def test_merged_streaming_stats_equal_a_single_pass():
+    samples = latencies()
+    single = streaming_stats(samples)
+
+    merged = StreamingStats(ACCURACY)
+    for start in range(0, len(samples), 700):
+        merged.merge(streaming_stats(samples[start:start + 700]))
+
+    assert merged.count == single.count
+    assert summarize(merged) == pytest.approx(summarize(single))
+    assert merged.sketch.bins == single.sketch.bins
+    assert [merged.quantile(q) for q in QUANTILES] == [single.quantile(q) for q in QUANTILES]
+
+
+def test_empty_streaming_stats_have_no_summary():
+    stats = StreamingStats()
+    stats.merge(StreamingStats())
+    assert summarize(stats) is None
+    assert summarize([]) is None
+    assert stats.quantile(0.5) is None
+
+
+def test_sketch_merge_keeps_every_bucket():
+    samples = latencies(3000, seed=3)
+    left, right, whole = LogHistogram(ACCURACY), LogHistogram(ACCURACY), LogHistogram(ACCURACY)
+    for value in samples[:1000]:
+        left.add(value)
+    for value in samples[1000:]:
+        right.add(value)
+    for value in samples:
+        whole.add(value)
+
+    left.merge(right)
+    assert left.bins == whole.bins
+    assert left.count == whole.count == len(samples)
+
+    with pytest.raises(ValueError):
+        left.merge(LogHistogram(0.05))
+
+
+def test_sketch_bucket_count_is_bounded():
+    sketch = LogHistogram(ACCURACY, max_buckets=64)
+    for i in range(10000):
+        sketch.add(1e-3 * 10 ** (9 * i / 9999))
+    assert len(sketch.bins) <= 64
+    assert sketch.count == 10000
+    # Bucket yang digabung hanya di ujung bawah; kuantil atas tetap akurat
+    assert sketch.quantile(1.0) == pytest.approx(1e6, rel=ACCURACY)
+
+
+def test_vectorised_extend_matches_adding_one_by_one():
+    samples = latencies()
+    stats = StreamingStats(ACCURACY)
+    stats.extend(samples[:1000])
+    for value in samples[1000:2000]:
+        stats.add(value)
+    stats.extend(samples[2000:])
+    stats.extend([])
+
+    single = streaming_stats(samples)
+    assert stats.count == single.count
+    assert summarize(stats) == pytest.approx(summarize(single))
+    assert stats.sketch.bins == single.sketch.bins
+
+
+def test_sketch_add_many_matches_add():
+    samples = latencies(3000, seed=5) + [0.0, 1e-9]
+    one_by_one, batched = LogHistogram(ACCURACY), LogHistogram(ACCURACY)
+    for value in samples:
+        one_by_one.add(value)
+    batched.add_many(samples)
+
+    assert batched.bins == one_by_one.bins
+    assert (batched.zero_count, batched.count) == (one_by_one.zero_count, one_by_one.count) == (2, len(samples))
+
+
+def test_streaming_stats_survive_a_dict_roundtrip():
+    stats = streaming_stats(latencies(2000, seed=6))
+    restored = StreamingStats.from_dict(json.loads(json.dumps(stats.to_dict())))
+
+    assert summarize(restored) == summarize(stats)
+    assert restored.sketch.bins == stats.sketch.bins
+    assert [restored.quantile(q) for q in QUANTILES] == [stats.quantile(q) for q in QUANTILES]
@@ -0,0 +1,52 @@
+import pytest
+
+from k6_results.cache import load_cache
+from k6_results import loader
+from k6_results.loader import load_results
+from k6_results.parser import parse_file
+
+from .fixtures import SCENARIO, report_tables, results_points, write_results
+
+
+@pytest.fixture
+def results_file(tmp_path):
+    return write_results(tmp_path / "results.json", results_points())
+
+
+def test_cache_replay_matches_parsing(results_file):
+    selection = SCENARIO.selection(phases=True, endpoints=True)
+    expected = report_tables(parse_file(results_file, selection, timeline_window=10))
+
+    built = load_results(results_file, selection, timeline_window=10)
+    assert load_cache(results_file) is not None
+    replayed = load_results(results_file, selection, timeline_window=10)
+
+    for aggregator in (built, replayed):
+        for table, expected_table in zip(report_tables(aggregator), expected):
+            assert table.equals(expected_table)
+
+
+def test_cache_is_invalidated_when_the_file_changes(results_file):
+    load_results(results_file, SCENARIO.selection())
+    assert load_cache(results_file) is not None
+
+    with open(results_file, 'a') as f:
+        f.write('\n')
+
+    assert load_cache(results_file) is None
+
+
+def test_workers_aggregate_ranges_without_building_the_cache(results_file, monkeypatch):
+    def build_columns(path):
+        raise AssertionError("--workers tidak boleh membangun cache kolumnar")
+
+    monkeypatch.setattr(loader, 'build_columns', build_columns)
+    selection = SCENARIO.selection(phases=True, endpoints=True)
+    expected = report_tables(parse_file(results_file, selection, streaming=True, timeline_window=10))
+
+    aggregator = load_results(results_file, selection, workers=2, timeline_window=10)
+
+    assert aggregator.streaming
+    assert load_cache(results_file) is None
+    for table, expected_table in zip(report_tables(aggregator), expected):
+        assert table.equals(expected_table)
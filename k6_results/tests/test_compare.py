@@ -0,0 +1,116 @@
+import numpy as np
+import pytest
+
+from k6_results.accumulator import StreamingStats
+from k6_results.compare import (RunSummary, StepSummary, compare_step, mann_whitney, prepare_comparison_table,
+                                two_proportion_test)
+from k6_results.sketch import LogHistogram
+
+
+def sketch_of(values):
+    sketch = LogHistogram()
+    sketch.add_many(values)
+    return sketch
+
+
+def step(samples, failed=0, attempts=None, label="Detail"):
+    latency = StreamingStats()
+    latency.extend(samples)
+    attempts = len(samples) if attempts is None else attempts
+    return StepSummary(label, latency.mean, latency, failed, attempts, attempts / 10)
+
+
+def latencies(scale=1.0, n=20000, seed=1):
+    return np.random.default_rng(seed).lognormal(mean=5, sigma=0.3, size=n) * scale
+
+
+def test_mann_whitney_matches_hand_computed_values():
+    # Tanpa seri: U = 9, z = 4,5 / sqrt(5,25)
+    assert mann_whitney(sketch_of([1, 2, 3]), sketch_of([4, 5, 6])) == pytest.approx((1.0, 0.049535), rel=1e-4)
+    # Seri di setiap nilai: U = 8,5, varians dengan koreksi seri 4,8
+    assert mann_whitney(sketch_of([1, 1, 2]), sketch_of([2, 3, 3])) == pytest.approx((8.5 / 9, 0.067889), rel=1e-4)
+
+
+def test_mann_whitney_on_identical_distributions():
+    samples = latencies()
+    slower, p_value = mann_whitney(sketch_of(samples), sketch_of(samples))
+
+    assert slower == pytest.approx(0.5)
+    assert p_value == pytest.approx(1.0)
+    assert mann_whitney(sketch_of(samples), sketch_of(latencies(seed=2)))[1] > 0.01
+
+
+def test_mann_whitney_detects_a_shift_in_either_direction():
+    baseline = sketch_of(latencies())
+    slower, p_value = mann_whitney(baseline, sketch_of(latencies(1.05, seed=2)))
+    assert slower > 0.5 and p_value < 1e-6
+
+    faster, p_value = mann_whitney(baseline, sketch_of(latencies(0.95, seed=2)))
+    assert faster < 0.5 and p_value < 1e-6
+
+
+def test_mann_whitney_without_samples():
+    assert mann_whitney(LogHistogram(), sketch_of([1, 2])) == (None, None)
+
+
+def test_two_proportion_test_known_values():
+    # 1% lawan 3% dari 1000 permintaan: z = 0,02 / sqrt(0,02 * 0,98 * 0,002)
+    assert two_proportion_test(10, 1000, 30, 1000) == pytest.approx(0.0014013, rel=1e-4)
+    assert two_proportion_test(10, 1000, 10, 1000) == pytest.approx(1.0)
+    assert two_proportion_test(0, 1000, 0, 500) == 1.0
+    assert two_proportion_test(1, 0, 1, 10) is None
+
+
+@pytest.mark.parametrize("scale, min_change, status", [
+    (1.03, 5.0, "Tidak signifikan"),
+    (1.03, 2.0, "REGRESI (latensi)"),
+    (1.10, 5.0, "REGRESI (latensi)"),
+    (0.90, 5.0, "Membaik (latensi)"),
+    (1.00, 5.0, "Tidak signifikan"),
+])
+def test_latency_status_needs_significance_and_min_change(scale, min_change, status):
+    baseline = step(latencies())
+    candidate = step(latencies(scale, seed=2))
+
+    changes, _, latency_p, _, result = compare_step(baseline, candidate, min_change=min_change)
+
+    assert result == status
+    # Kuantil sketch dapat bergeser satu bucket (lebar ~2%)
+    assert changes[50] == pytest.approx((scale - 1) * 100, abs=2.5)
+    if scale != 1.0:
+        # Pergeseran 3% tetap signifikan; yang menyaringnya adalah --min-change
+        assert latency_p < 0.01
+
+
+def test_error_status_needs_significance_and_one_point():
+    samples = latencies(n=2000)
+    baseline = step(samples, failed=20)
+
+    assert compare_step(baseline, step(samples, failed=60))[4] == "REGRESI (error)"
+    # +0,5 poin tidak dianggap regresi walau sampelnya besar
+    assert compare_step(step(samples, failed=2000, attempts=200000),
+                        step(samples, failed=3000, attempts=200000))[4] == "Tidak signifikan"
+    # +1,5 poin pada 200 permintaan tidak signifikan
+    assert compare_step(step(samples, failed=2, attempts=200), step(samples, failed=5, attempts=200))[4] == \
+        "Tidak signifikan"
+    assert compare_step(step(samples, failed=60), baseline)[4] == "Membaik (error)"
+
+
+def test_comparison_table_flags_each_run_against_the_baseline():
+    runs = [
+        RunSummary("baseline.json", 10, [step(latencies()), step(latencies(n=500), label="Cari")]),
+        RunSummary("release-1.json", 10, [step(latencies(1.2, seed=2))]),
+        RunSummary("release-2.json", 10, [step(latencies(seed=3)), step(latencies(n=500), label="Cari")]),
+    ]
+
+    df = prepare_comparison_table(runs)
+
+    assert list(zip(df["Langkah"], df["Run"], df["Status"])) == [
+        ("Detail", "baseline.json", "Baseline"),
+        ("Detail", "release-1.json", "REGRESI (latensi)"),
+        ("Detail", "release-2.json", "Tidak signifikan"),
+        ("Cari", "baseline.json", "Baseline"),
+        ("Cari", "release-1.json", "N/A"),
+        ("Cari", "release-2.json", "Tidak signifikan"),
+    ]
+    assert df.loc[1, "Δ P50"].startswith("+")
@@ -0,0 +1,92 @@
+import gzip
+import lzma
+
+import pytest
+
+from k6_results import compression
+from k6_results.compression import BackgroundLineReader, detect_compression, open_results
+from k6_results.parser import parse_file
+from k6_results.scenario import Scenario, Step, prepare_data_table
+
+from .fixtures import request_points, write_results
+
+SCENARIO = Scenario(name="uji", title="Tabel Uji", steps=[Step("Detail", group="Get Detail")])
+
+COMPRESSORS = {'gzip': gzip.compress, 'xz': lzma.compress}
+
+
+@pytest.fixture
+def results_file(tmp_path):
+    points = []
+    for i in range(60):
+        points += request_points("1: Get Detail", 50 + i, i, failed=int(i % 9 == 0), iteration=i)
+    return write_results(tmp_path / "results.json", points)
+
+
+def compressed_copy(path, name, target):
+    with open(path, 'rb') as f:
+        target.write_bytes(COMPRESSORS[name](f.read()))
+    return str(target)
+
+
+@pytest.mark.parametrize("name", sorted(COMPRESSORS))
+def test_compression_is_detected_by_magic_bytes_not_name(results_file, tmp_path, name):
+    # Nama file sengaja menyesatkan: .json untuk data terkompresi, .gz untuk xz
+    misleading = compressed_copy(results_file, name, tmp_path / ("hasil.json" if name == 'gzip' else "hasil.gz"))
+
+    assert detect_compression(misleading) == name
+    assert detect_compression(results_file) is None
+
+
+def test_zstd_is_detected_and_needs_zstandard(tmp_path, monkeypatch):
+    path = tmp_path / "results.json"
+    path.write_bytes(b'\x28\xb5\x2f\xfd' + b'\x00' * 16)
+    monkeypatch.setattr(compression, 'zstandard', None)
+
+    assert detect_compression(str(path)) == 'zstd'
+    with pytest.raises(RuntimeError, match="zstandard"):
+        with open_results(str(path)) as lines:
+            list(lines)
+
+
+@pytest.mark.parametrize("name", sorted(COMPRESSORS))
+def test_background_reader_yields_the_same_lines(results_file, tmp_path, name):
+    path = compressed_copy(results_file, name, tmp_path / f"results.{name}")
+    with open(results_file, 'rb') as f:
+        expected = f.read().split(b'\n')[:-1]
+
+    # Blok kecil memotong baris di tengah dan memenuhi antrean
+    with BackgroundLineReader(path, name, block_size=100) as lines:
+        assert list(lines) == expected
+
+
+def test_last_line_without_newline_is_kept(tmp_path):
+    path = tmp_path / "results.json.gz"
+    path.write_bytes(gzip.compress(b'a\nb\nc'))
+    with open_results(str(path)) as lines:
+        assert list(lines) == [b'a', b'b', b'c']
+
+
+def test_stopping_early_does_not_hang(results_file, tmp_path):
+    path = compressed_copy(results_file, 'gzip', tmp_path / "results.json.gz")
+    with BackgroundLineReader(path, 'gzip', block_size=16) as lines:
+        first = next(iter(lines))
+    assert first.startswith(b'{')
+
+
+def test_corrupt_archive_raises_while_iterating(tmp_path):
+    path = tmp_path / "results.json.gz"
+    path.write_bytes(gzip.compress(b'{"a":1}\n' * 1000)[:50])
+    with pytest.raises(EOFError):
+        with open_results(str(path)) as lines:
+            list(lines)
+
+
+@pytest.mark.parametrize("name", sorted(COMPRESSORS))
+def test_compressed_results_report_like_plain_ones(results_file, tmp_path, name):
+    path = compressed_copy(results_file, name, tmp_path / f"results.{name}")
+    expected = prepare_data_table(SCENARIO, parse_file(results_file, SCENARIO.selection()), 1.0, (50, 95))
+
+    aggregator = parse_file(path, SCENARIO.selection())
+
+    assert prepare_data_table(SCENARIO, aggregator, 1.0, (50, 95)).equals(expected)
@@ -0,0 +1,112 @@
+import pytest
+
+from k6_results.accumulator import summarize
+from k6_results.parser import parse_file, parse_parallel
+from k6_results.scenario import Part, Scenario, Step
+
+from .fixtures import upload_points, write_results
+
+SCENARIO = Scenario(name="uji", title="Tabel Uji", steps=[
+    Step("Large File Upload", parts=[
+        Part("large_file_upload_init_duration"),
+        Part("chunk_upload_duration", carries_bytes=True),
+        Part("complete_upload_duration"),
+    ]),
+])
+
+OPERATION_MS = 100 + 3 * 200 + 50
+
+
+@pytest.fixture
+def uploads_file(tmp_path):
+    points = []
+    for i in range(50):
+        # Unggahan dari 5 VU saling bertumpuk di file; iterasi terakhir tidak selesai.
+        points += upload_points(i * 2, chunks=3, vu=i % 5, iteration=i // 5)
+    points += upload_points(200, chunks=3, vu=0, iteration=99)[:-1]
+    return write_results(tmp_path / "results.json", sorted(points, key=lambda p: p['data']['time']))
+
+
+def test_completed_operations_are_folded_while_parsing(uploads_file):
+    aggregator = parse_file(uploads_file, SCENARIO.selection(), streaming=True)
+    collector, = aggregator.correlations
+
+    assert list(collector.operations) == ["0:99"]
+    assert collector.completed_count() == 50
+    assert collector.durations().mean == pytest.approx(OPERATION_MS)
+    assert collector.mean_chunks() == pytest.approx(3)
+    # chunk_bytes dari metadata titik, termasuk chunk unggahan yang belum selesai
+    assert collector.transferred_bytes == pytest.approx(51 * 3 * 1e6)
+
+
+def test_operations_split_across_byte_ranges_are_joined(uploads_file):
+    expected, = parse_file(uploads_file, SCENARIO.selection()).correlations
+    joined, = parse_parallel(uploads_file, SCENARIO.selection(), workers=4, streaming=False).correlations
+
+    assert joined.completed_count() == expected.completed_count() == 50
+    assert sorted(joined.durations()) == sorted(expected.durations())
+    assert joined.transferred_bytes == expected.transferred_bytes
+
+
+def late_chunk_points(seconds, iteration):
+    """Unggahan 3 chunk yang chunk terakhirnya ditulis k6 setelah titik complete."""
+    points = upload_points(seconds, chunks=3, iteration=iteration)
+    complete = points.pop()
+    last_chunk = points.pop()
+    return points + [complete, last_chunk]
+
+
+@pytest.mark.parametrize("streaming", [False, True])
+def test_chunk_written_after_complete_is_joined(tmp_path, streaming):
+    points = []
+    for i in range(20):
+        points += late_chunk_points(i * 10, i)
+    path = write_results(tmp_path / "results.json", points)
+
+    aggregator = parse_file(path, SCENARIO.selection(), streaming)
+    collector, = aggregator.correlations
+
+    assert not collector.operations
+    assert collector.completed_count() == 20
+    assert collector.incomplete_count() == 0
+    assert summarize(collector.durations())[:3] == pytest.approx([OPERATION_MS] * 3)
+    assert collector.mean_chunks() == pytest.approx(3)
+
+    joined, = parse_parallel(path, SCENARIO.selection(), workers=4, streaming=streaming).correlations
+    assert joined.completed_count() == 20
+    assert summarize(joined.durations())[:3] == pytest.approx([OPERATION_MS] * 3)
+
+
+def test_stale_uploads_are_evicted_and_counted_as_incomplete(tmp_path):
+    points = []
+    for i in range(150):
+        points += upload_points(i * 10, chunks=3, iteration=i)
+    # Unggahan yang gagal di chunk kedua tidak pernah mengirim complete.
+    for i in range(5):
+        points += upload_points(400 + i * 10, chunks=3, vu=2, iteration=i)[:3]
+    path = write_results(tmp_path / "results.json", sorted(points, key=lambda p: p['data']['time']))
+
+    collector, = parse_file(path, SCENARIO.selection(), streaming=True).correlations
+
+    assert collector.incomplete == 5
+    assert not collector.operations
+    assert collector.incomplete_count() == 5
+    assert collector.completed_count() == 150
+
+    replayed, = parse_file(path, SCENARIO.selection()).correlations
+    assert replayed.incomplete_count() == 5
+
+
+def test_uploads_without_chunk_count_are_folded_when_read(tmp_path):
+    points = []
+    for i in range(10):
+        upload = upload_points(i * 10, chunks=3, iteration=i)
+        del upload[-1]['data']['metadata']['chunk_count']
+        points += upload
+    path = write_results(tmp_path / "results.json", points)
+
+    collector, = parse_file(path, SCENARIO.selection(), streaming=True).correlations
+
+    assert len(collector.operations) == 10
+    assert collector.completed_count() == 10
+    assert collector.incomplete_count() == 0
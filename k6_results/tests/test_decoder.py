@@ -0,0 +1,93 @@
+import json
+
+import pytest
+
+from k6_results import decoder
+from k6_results.decoder import JSON_BACKENDS, PointFilter, iter_points, json_loader
+
+from .fixtures import point
+
+
+def k6_line(entry):
+    """Baris NDJSON ringkas seperti yang ditulis k6 (tanpa spasi)."""
+    return json.dumps(entry, separators=(',', ':')).encode()
+
+
+def declaration(metric_name):
+    return k6_line({'type': 'Metric', 'data': {'name': metric_name, 'type': 'trend'}, 'metric': metric_name})
+
+
+LINES = [
+    declaration('http_req_duration'),
+    declaration('vus'),
+    k6_line(point('http_req_duration', 120, 0, "1: Get Detail")),
+    k6_line(point('vus', 5, 0)),
+    k6_line(point('data_sent', 512, 1)),
+    k6_line(point('http_req_duration', 80, 1, "1: Get Detail")),
+    k6_line(point('vus', 6, 1)),
+]
+
+
+def is_duration(metric_name):
+    return metric_name == 'http_req_duration'
+
+
+@pytest.fixture
+def decoded_lines(monkeypatch):
+    lines = []
+
+    def loads(raw):
+        lines.append(raw)
+        return json.loads(raw)
+
+    monkeypatch.setattr(decoder, 'loads', loads)
+    return lines
+
+
+def test_filtered_out_metrics_are_never_decoded(decoded_lines):
+    point_filter = PointFilter(is_duration)
+
+    points = list(iter_points(LINES, point_filter))
+
+    assert [(name, data['value']) for name, data in points] == [('http_req_duration', 120), ('http_req_duration', 80)]
+    assert decoded_lines == [LINES[2], LINES[5]]
+    assert (point_filter.lines, point_filter.decoded) == (len(LINES), 2)
+
+
+def test_relevance_is_decided_once_per_metric_name():
+    names = []
+
+    def is_relevant(metric_name):
+        names.append(metric_name)
+        return is_duration(metric_name)
+
+    list(iter_points(LINES * 3, PointFilter(is_relevant)))
+
+    assert sorted(set(names)) == ['data_sent', 'http_req_duration', 'vus']
+    # Sekali per nama dari byte baris, ditambah sekali per titik yang di-decode
+    assert names.count('vus') == 1 and names.count('data_sent') == 1
+
+
+@pytest.mark.parametrize("line", [b'[]', b'1', b'"Point"', b'null', b'{"type":"Point"', b'\xff\xfe',
+                                  b'{"type":"Point","metric":"http_req_duration","data":[1]}'])
+def test_malformed_lines_are_skipped(line):
+    point_filter = PointFilter(is_duration)
+
+    points = list(iter_points([LINES[2], line, LINES[5]], point_filter))
+
+    assert [data['value'] for _, data in points] == [120, 80]
+    assert point_filter.lines == 3
+
+
+@pytest.mark.parametrize("backend", JSON_BACKENDS)
+def test_every_json_backend_yields_the_same_points(backend, monkeypatch):
+    try:
+        loads = json_loader(backend)
+    except ImportError:
+        pytest.skip(f"{backend} tidak terpasang")
+    expected = list(iter_points(LINES, PointFilter(is_duration)))
+
+    monkeypatch.setattr(decoder, 'loads', loads)
+    lines = LINES + [b'[]', b'1', b'{"type":']
+
+    assert list(iter_points(lines, PointFilter(is_duration))) == expected
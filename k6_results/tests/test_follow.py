@@ -0,0 +1,82 @@
+import math
+
+from k6_results.follow import FileTail
+from k6_results.parser import ResultAggregator, parse_file
+from k6_results.scenario import Scenario, Step, prepare_data_table
+
+from .fixtures import request_points, write_results
+
+SCENARIO = Scenario(name="uji", title="Tabel Uji", steps=[Step("Detail", group="Get Detail")])
+
+
+def test_missing_file_reads_nothing(tmp_path):
+    tail = FileTail(str(tmp_path / "belum-ada.json"))
+    assert tail.read_lines() == []
+    assert tail.at_end
+
+
+def test_partial_last_line_is_held_back(tmp_path):
+    path = tmp_path / "results.json"
+    path.write_bytes(b'{"a":1}\n{"b":')
+    tail = FileTail(str(path))
+
+    assert tail.read_lines() == [b'{"a":1}']
+    assert tail.at_end
+    assert tail.read_lines() == []
+
+    with open(path, 'ab') as f:
+        f.write(b'2}\n{"c":3}')
+    assert tail.read_lines() == [b'{"b":2}']
+    with open(path, 'ab') as f:
+        f.write(b'\n')
+    assert tail.read_lines() == [b'{"c":3}']
+
+
+def test_reads_are_limited_to_the_block_size(tmp_path):
+    path = tmp_path / "results.json"
+    lines = [f'{{"n":{i}}}'.encode() for i in range(50)]
+    path.write_bytes(b'\n'.join(lines) + b'\n')
+    tail = FileTail(str(path), block_size=64)
+
+    read, reads = [], 0
+    while not tail.at_end:
+        read += tail.read_lines()
+        reads += 1
+    assert read == lines
+    assert reads == math.ceil(path.stat().st_size / 64)
+
+
+def test_rewritten_file_is_read_from_the_start(tmp_path):
+    path = tmp_path / "results.json"
+    path.write_bytes(b'{"a":1}\n{"b":2}\n')
+    tail = FileTail(str(path))
+    tail.read_lines()
+
+    path.write_bytes(b'{"c":3}\n')
+    assert tail.read_lines() == [b'{"c":3}']
+    assert tail.restarted
+
+
+def test_following_a_growing_file_matches_parsing_it(tmp_path):
+    points = []
+    for i in range(40):
+        points += request_points("1: Get Detail", 50 + i, i, failed=int(i % 8 == 0), iteration=i)
+    source = write_results(tmp_path / "source.json", points)
+    with open(source, 'rb') as f:
+        content = f.read()
+
+    path = tmp_path / "results.json"
+    path.write_bytes(b'')
+    tail = FileTail(str(path))
+    aggregator = ResultAggregator(SCENARIO.selection(), streaming=True)
+    # k6 menulis per blok, sehingga batas tulis jatuh di tengah baris
+    for start in range(0, len(content), 777):
+        with open(path, 'ab') as f:
+            f.write(content[start:start + 777])
+        aggregator.consume(tail.read_lines())
+
+    expected = parse_file(source, SCENARIO.selection(), streaming=True)
+    assert aggregator.lines == expected.lines
+    assert prepare_data_table(SCENARIO, aggregator, 1.0, (50, 95)).equals(
+        prepare_data_table(SCENARIO, expected, 1.0, (50, 95)))
+
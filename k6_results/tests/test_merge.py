@@ -0,0 +1,69 @@
+import pytest
+
+from k6_results.merge import estimate_clock_offsets, merge_results, node_names, prepare_node_table
+from k6_results.scenario import Part, Scenario, Step, compute_step_results
+
+from .fixtures import request_points, upload_points, write_results
+
+UPLOAD = Step("Large File Upload", parts=[
+    Part("large_file_upload_init_duration"),
+    Part("chunk_upload_duration", carries_bytes=True),
+    Part("complete_upload_duration"),
+])
+SCENARIO = Scenario(name="uji", title="Tabel Uji", steps=[UPLOAD])
+
+CHUNKS = 4
+OPERATION_MS = 100 + CHUNKS * 200 + 50
+
+
+def node_points(shift, uploads=3):
+    """Unggahan per VU/iterasi yang sama di setiap node, dengan jam bergeser ``shift`` detik."""
+    points = []
+    for i in range(uploads):
+        start = shift + i * 10
+        points += upload_points(start, CHUNKS, iteration=i)
+        points += request_points("1: Upload", 100, start, iteration=i)
+    return points
+
+
+@pytest.fixture
+def node_files(tmp_path):
+    return [write_results(tmp_path / "runner-0.json", node_points(0)),
+            write_results(tmp_path / "runner-1.json", node_points(30))]
+
+
+def test_node_names_strip_extensions_and_stay_unique():
+    assert node_names(["a/runner-0.json.gz", "b/runner-0.json", "runner-1.ndjson"]) == \
+        ["runner-0", "runner-0#2", "runner-1"]
+
+
+def test_clock_offsets_align_node_starts(node_files):
+    assert estimate_clock_offsets(node_files) == pytest.approx([0.0, -30.0])
+
+
+@pytest.mark.parametrize("streaming", [False, True])
+def test_same_operation_ids_on_different_nodes_are_not_joined(node_files, streaming):
+    aggregator, _ = merge_results(node_files, SCENARIO.selection(), streaming, offsets=[0.0, -30.0])
+
+    (step, result), = compute_step_results(SCENARIO, aggregator, 1.0)
+    collector, = aggregator.correlations
+
+    assert result.avg == pytest.approx(OPERATION_MS)
+    assert result.max == pytest.approx(OPERATION_MS)
+    assert collector.completed_count() == 6
+    assert collector.mean_chunks() == pytest.approx(CHUNKS)
+
+
+def test_clock_offsets_are_applied_to_the_merged_run(node_files):
+    aligned, nodes = merge_results(node_files, SCENARIO.selection(), offsets=[0.0, -30.0])
+    skewed, _ = merge_results(node_files, SCENARIO.selection())
+
+    assert aligned.end_time - aligned.start_time == pytest.approx(26)
+    assert skewed.end_time - skewed.start_time == pytest.approx(56)
+
+    df = prepare_node_table(nodes, aligned.start_time, (50,))
+    totals = df[df["Langkah"] == "Semua Langkah"]
+    assert list(totals["Node"]) == ["runner-0", "runner-1"]
+    assert list(totals["Koreksi Jam (s)"]) == ["+0,000", "-30,000"]
+    assert list(totals["Mulai (s)"]) == ["0,0", "0,0"]
+    assert list(totals["Permintaan"]) == ["3", "3"]
@@ -0,0 +1,67 @@
+import pytest
+
+from k6_results.accumulator import summarize
+from k6_results.parser import iter_range_lines, parse_file, parse_parallel, split_line_ranges
+
+from .fixtures import SCENARIO, report_tables, results_points, write_results
+
+
+@pytest.fixture
+def results_file(tmp_path):
+    return write_results(tmp_path / "results.json", results_points())
+
+
+@pytest.mark.parametrize("parts", [1, 2, 3, 7, 64])
+def test_line_ranges_cover_the_file_on_line_boundaries(results_file, parts):
+    with open(results_file, 'rb') as f:
+        content = f.read()
+
+    ranges = split_line_ranges(results_file, parts)
+
+    assert 1 <= len(ranges) <= parts
+    assert ranges[0][0] == 0 and ranges[-1][1] == len(content)
+    assert all(end == start for (_, end), (start, _) in zip(ranges, ranges[1:]))
+    assert all(content[start - 1:start] == b'\n' for start, _ in ranges[1:])
+
+    lines = [line for start, end in ranges for line in iter_range_lines(results_file, start, end, block_size=97)]
+    assert [line for line in lines if line] == content.splitlines()
+
+
+def test_line_ranges_of_tiny_and_empty_files(tmp_path):
+    empty = tmp_path / "empty.json"
+    empty.write_bytes(b'')
+    assert split_line_ranges(str(empty), 4) == [(0, 0)]
+
+    single = tmp_path / "single.json"
+    single.write_bytes(b'{"type": "Metric"}')
+    assert split_line_ranges(str(single), 4) == [(0, 18)]
+    assert list(iter_range_lines(str(single), 0, 18)) == [b'{"type": "Metric"}']
+
+
+def summaries(table):
+    return {key: summarize(samples) for key, samples in table.items()}
+
+
+@pytest.mark.parametrize("streaming", [False, True])
+def test_parallel_parse_reports_like_sequential_parse(results_file, streaming):
+    selection = SCENARIO.selection(phases=True, endpoints=True)
+    expected = parse_file(results_file, selection, streaming, timeline_window=10)
+
+    aggregator = parse_parallel(results_file, selection, 3, streaming, timeline_window=10)
+
+    assert (aggregator.start_time, aggregator.end_time) == (expected.start_time, expected.end_time)
+    assert aggregator.count_metrics == expected.count_metrics
+    for table, expected_table in zip(report_tables(aggregator), report_tables(expected)):
+        assert table.equals(expected_table)
+
+
+def test_streaming_parse_matches_exact_parse(results_file):
+    exact = parse_file(results_file, SCENARIO.selection())
+    streamed = parse_file(results_file, SCENARIO.selection(), streaming=True)
+
+    assert streamed.count_metrics == exact.count_metrics
+    assert summaries(streamed.metrics).keys() == summaries(exact.metrics).keys()
+    for key, summary in summaries(streamed.metrics).items():
+        assert summary == pytest.approx(summaries(exact.metrics)[key]), key
+    for key, samples in streamed.error_metrics.items():
+        assert samples.total == sum(exact.error_metrics[key])
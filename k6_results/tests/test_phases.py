@@ -0,0 +1,32 @@
+from k6_results.parser import parse_file
+from k6_results.phases import prepare_phase_table
+from k6_results.scenario import Scenario, Step
+
+from .fixtures import point, write_results
+
+SCENARIO = Scenario(name="uji", title="Tabel Uji", steps=[Step("Detail", group="Get Detail")])
+
+# blocked sudah mencakup connecting dan TLS: 30 = 5 antre + 10 TCP + 15 TLS
+PHASES = {
+    'http_req_blocked': 30,
+    'http_req_connecting': 10,
+    'http_req_tls_handshaking': 15,
+    'http_req_sending': 5,
+    'http_req_waiting': 50,
+    'http_req_receiving': 15,
+}
+
+
+def test_connection_setup_is_not_counted_twice(tmp_path):
+    points = [point(metric_name, value, i, "1: Get Detail", iteration=i)
+              for i in range(3) for metric_name, value in PHASES.items()]
+    aggregator = parse_file(write_results(tmp_path / "results.json", points), SCENARIO.selection(phases=True))
+
+    df = prepare_phase_table(aggregator, (50,))
+    shares = dict(zip(df[df["Langkah k6"] == "Get Detail"]["Fase"], df["Porsi (%)"]))
+
+    assert shares["Blocked (antre + DNS + TCP + TLS)"] == "30,0"
+    assert shares["Connecting (TCP, bagian dari blocked)"] == "10,0"
+    assert shares["TLS Handshake (bagian dari blocked)"] == "15,0"
+    assert shares["Waiting (TTFB)"] == "50,0"
+    assert shares["Antre/DNS (blocked - connecting - TLS)"] == "5,0"
@@ -0,0 +1,61 @@
+import pytest
+
+from k6_results.compare import summarize_run
+from k6_results.parser import parse_file
+from k6_results.scenario import Scenario, Step, prepare_data_table
+
+from .fixtures import point, request_points, write_results
+
+SCENARIO = Scenario(
+    name="uji",
+    title="Tabel Uji",
+    steps=[
+        Step("Melihat Kategori", group="Get Categories"),
+        Step("Menambah View", group="Increment View Count"),
+    ],
+)
+
+
+@pytest.fixture
+def missing_step_file(tmp_path):
+    points = []
+    for i in range(20):
+        points += request_points("1: Get Categories", 100 + i, i, failed=int(i % 10 == 0), iteration=i)
+    return write_results(tmp_path / "results.json", points)
+
+
+@pytest.mark.parametrize("streaming", [False, True])
+def test_step_without_points_is_reported_as_na(missing_step_file, streaming):
+    aggregator = parse_file(missing_step_file, SCENARIO.selection(), streaming)
+
+    df = prepare_data_table(SCENARIO, aggregator, 1.0, (50, 95))
+
+    assert df.loc[0, "Label"] == "Melihat Kategori"
+    assert df.loc[0, "Error (%)"] == "10,0"
+    assert list(df.loc[1])[1:] == ["N/A"] * (len(df.columns) - 1)
+
+
+def test_step_without_points_is_skipped_in_comparison(missing_step_file):
+    aggregator = parse_file(missing_step_file, SCENARIO.selection())
+
+    run = summarize_run(SCENARIO, missing_step_file, aggregator, 1.0)
+
+    assert list(run.steps) == ["Melihat Kategori"]
+
+
+def test_error_rate_of_custom_rate_uses_request_count(tmp_path):
+    # Rate kustom hanya ditambah saat gagal: 2 kegagalan dari 10 permintaan.
+    points = []
+    for i in range(10):
+        points.append(point('login_duration', 200 + i, i, iteration=i))
+        points.append(point('login_requests', 1, i, iteration=i))
+        if i < 2:
+            points.append(point('login_failed', 1, i, iteration=i))
+    scenario = Scenario(name="uji", title="Tabel Uji", steps=[
+        Step("SSO Login", duration="login_duration", failed="login_failed", requests="login_requests"),
+    ])
+    aggregator = parse_file(write_results(tmp_path / "results.json", points), scenario.selection())
+
+    df = prepare_data_table(scenario, aggregator, 1.0, (50,))
+
+    assert df.loc[0, "Error (%)"] == "20,0"
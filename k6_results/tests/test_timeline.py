@@ -0,0 +1,83 @@
+import os
+
+import pytest
+
+from k6_results.parser import parse_file
+from k6_results.scenario import Scenario, Step
+from k6_results.timeline import (ALL_STEPS, load_stages, parse_stage_duration, prepare_stage_summary,
+                                 prepare_timeline_table, stage_of)
+
+from .fixtures import point, request_points, write_results
+
+SCENARIO = Scenario(name="uji", title="Tabel Uji", steps=[Step("Detail", group="Get Detail")])
+
+LOAD_TEST = """
+export const options = {
+  stages: [
+    { duration: "10s", target: 5 },
+    { duration: '20s', target: 10 },
+  ],
+  thresholds: { http_req_duration: ["p(95)<2000"] },
+};
+"""
+
+
+@pytest.fixture
+def load_test_file(tmp_path):
+    path = tmp_path / "load-test.js"
+    path.write_text(LOAD_TEST)
+    return str(path)
+
+
+@pytest.mark.parametrize("text, seconds", [("30s", 30), ("1m30s", 90), ("500ms", 0.5), ("1h2m", 3720)])
+def test_stage_durations(text, seconds):
+    assert parse_stage_duration(text) == pytest.approx(seconds)
+
+
+def test_stages_are_read_from_the_load_test(load_test_file):
+    assert load_stages(load_test_file) == [
+        {"label": "Tahap 1 (0→5 VU)", "start": 0.0, "end": 10.0},
+        {"label": "Tahap 2 (5→10 VU)", "start": 10.0, "end": 30.0},
+    ]
+    assert load_stages(load_test_file + ".hilang") == []
+
+
+def test_stages_of_the_reader_load_test():
+    load_test = os.path.join(os.path.dirname(__file__), "..", "..", "skenario-1-pembaca", "load-test.js")
+    stages = load_stages(load_test)
+
+    assert len(stages) == 8
+    assert stages[-1]["end"] == 600
+    assert stage_of(0, stages) == "Tahap 1 (0→200 VU)"
+    assert stage_of(60, stages) == "Tahap 2 (200→200 VU)"
+    assert stage_of(600, stages) == "Di luar tahapan"
+
+
+@pytest.fixture
+def results_file(tmp_path):
+    points = []
+    for second in range(30):
+        # Satu permintaan per detik; permintaan ke-3 setiap jendela gagal
+        points += request_points("1: Get Detail", 100 + second, second, failed=int(second % 10 == 2))
+        points.append(point('vus', 5 if second < 10 else 10, second))
+    return write_results(tmp_path / "results.json", points)
+
+
+@pytest.mark.parametrize("streaming", [False, True])
+def test_timeline_windows_are_mapped_to_stages(results_file, load_test_file, streaming):
+    aggregator = parse_file(results_file, SCENARIO.selection(), streaming, timeline_window=10)
+    stages = load_stages(load_test_file)
+
+    df = prepare_timeline_table(aggregator.timeline, stages, (50,))
+    totals = df[df["Langkah"] == ALL_STEPS]
+
+    assert list(totals["Waktu (s)"]) == ["0", "10", "20"]
+    assert list(totals["Tahap"]) == ["Tahap 1 (0→5 VU)", "Tahap 2 (5→10 VU)", "Tahap 2 (5→10 VU)"]
+    assert list(totals["VU"]) == ["5", "10", "10"]
+    assert list(totals["Permintaan/s"]) == ["1,0"] * 3
+    assert list(totals["Error (%)"]) == ["10,0"] * 3
+
+    summary = prepare_stage_summary(aggregator.timeline, stages, (50,))
+    assert list(summary["Tahap"]) == ["Tahap 1 (0→5 VU)", "Tahap 2 (5→10 VU)"]
+    assert list(summary["VU Maks"]) == ["5", "10"]
+    assert list(summary["Permintaan/s"]) == ["1,0", "1,0"]
@@ -0,0 +1,73 @@
+import pytest
+
+from k6_results.loader import load_results
+from k6_results.parser import parse_file
+from k6_results.scenario import Scenario, Step, prepare_transfer_table
+from k6_results.timeline import ALL_STEPS, prepare_timeline_table
+
+from .fixtures import point, request_points, write_results
+
+SCENARIO = Scenario(name="uji", title="Tabel Uji", steps=[
+    Step("Detail", group="Get Detail"),
+    Step("Upload", group="Upload File"),
+])
+DURATION_MINS = 100 / 60
+
+
+@pytest.fixture
+def results_file(tmp_path):
+    points = []
+    for second in range(100):
+        # Detail: 1 permintaan/s, 2 KB keluar dan 48 KB masuk per permintaan
+        points += request_points("1: Get Detail", 40, second)
+        points.append(point('data_sent', 2000, second, "1: Get Detail"))
+        points.append(point('data_received', 48000, second, "1: Get Detail"))
+        if second % 10 == 0:
+            # Upload: 1 permintaan per 10 s, 5 MB keluar
+            points += request_points("2: Upload File", 900, second)
+            points.append(point('data_sent', 5000000, second, "2: Upload File"))
+            points.append(point('data_received', 1000, second, "2: Upload File"))
+    # Setup di luar grup
+    points.append(point('data_received', 500000, 0))
+    return write_results(tmp_path / "results.json", points)
+
+
+def rows_by_step(df):
+    return {row["Langkah k6"]: row for _, row in df.iterrows()}
+
+
+@pytest.mark.parametrize("streaming", [False, True])
+def test_bytes_are_summed_per_group(results_file, streaming):
+    aggregator = parse_file(results_file, SCENARIO.selection(), streaming)
+
+    rows = rows_by_step(prepare_transfer_table(aggregator, DURATION_MINS))
+
+    assert list(rows) == ["Get Detail", "Tanpa Langkah", "Upload File", ALL_STEPS]
+    detail, upload, setup, total = (rows[name] for name in ("Get Detail", "Upload File", "Tanpa Langkah", ALL_STEPS))
+    assert [detail["Permintaan/s"], detail["Kirim (MB)"], detail["Terima (MB)"]] == ["1,0", "0,2", "4,8"]
+    assert [detail["Kirim (MB/s)"], detail["Terima (MB/s)"], detail["KB per Permintaan"]] == ["0,00", "0,05", "50,0"]
+    assert [upload["Permintaan/s"], upload["Kirim (MB)"], upload["Kirim (MB/s)"]] == ["0,1", "50,0", "0,50"]
+    assert [upload["KB per Permintaan"]] == ["5.001,0"]
+    assert [setup["Terima (MB)"], setup["KB per Permintaan"]] == ["0,5", "N/A"]
+    assert [total["Kirim (MB)"], total["Terima (MB)"], total["Kirim (MB/s)"]] == ["50,2", "5,3", "0,50"]
+
+
+def test_cache_replay_sums_the_same_bytes(results_file):
+    expected = prepare_transfer_table(parse_file(results_file, SCENARIO.selection()), DURATION_MINS)
+    load_results(results_file, SCENARIO.selection())
+
+    replayed = load_results(results_file, SCENARIO.selection())
+
+    assert prepare_transfer_table(replayed, DURATION_MINS).equals(expected)
+
+
+def test_timeline_reports_megabytes_per_second_per_window(results_file):
+    aggregator = parse_file(results_file, SCENARIO.selection(), timeline_window=10)
+
+    df = prepare_timeline_table(aggregator.timeline, [], (50,))
+    upload = df[df["Langkah"] == "Upload File"]
+    totals = df[df["Langkah"] == ALL_STEPS]
+
+    assert set(upload["Kirim (MB/s)"]) == {"0,50"}
+    # Jendela pertama juga berisi 0,5 MB dari setup
+    assert list(totals["Terima (MB/s)"])[:2] == ["0,10", "0,05"]
@@ -0,0 +1,308 @@
+import re
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+
+from .accumulator import StreamingStats
+from .report import format_number_id, percentile_columns
+
+TIMELINE_METRICS = frozenset(['http_req_duration', 'http_req_failed', 'http_reqs', 'vus', 'data_sent', 'data_received'])
+ALL_STEPS = "Semua Langkah"
+NO_STEP = "Tanpa Langkah"
+
+STAGE_PATTERN = re.compile(r'\{\s*duration:\s*["\']([^"\']+)["\']\s*,\s*target:\s*(\d+)\s*\}')
+DURATION_PART_PATTERN = re.compile(r'(\d+(?:\.\d+)?)(ms|h|m|s)')
+DURATION_UNITS = {'ms': 0.001, 's': 1, 'm': 60, 'h': 3600}
+
+
+class TimestampParser:
+    """Mengubah waktu RFC3339 k6 menjadi detik epoch.
+
+    Bagian detik utuh beserta zona waktu di-cache sehingga hanya pecahan
+    detik yang diurai ulang untuk setiap titik.
+    """
+
+    def __init__(self):
+        self._seconds = {}
+
+    def __call__(self, text):
+        if text.endswith('Z'):
+            zone_start = len(text) - 1
+        else:
+            zone_start = len(text) - 6
+        cache_key = (text[:19], text[zone_start:])
+        base = self._seconds.get(cache_key)
+        if base is None:
+            base = datetime.fromisoformat(text[:19] + text[zone_start:].replace('Z', '+00:00')).timestamp()
+            self._seconds[cache_key] = base
+        if zone_start > 20 and text[19] == '.':
+            return base + float('0' + text[19:zone_start])
+        return base
+
+
+parse_k6_time = TimestampParser()
+
+
+class WindowStats:
+    __slots__ = ("requests", "failed", "checked", "latency", "vus", "sent", "received")
+
+    def __init__(self):
+        self.requests = 0
+        self.failed = 0
+        self.checked = 0
+        self.latency = StreamingStats()
+        self.vus = 0
+        self.sent = 0
+        self.received = 0
+
+    def __getstate__(self):
+        return {slot: getattr(self, slot) for slot in self.__slots__}
+
+    def __setstate__(self, state):
+        for slot, value in state.items():
+            setattr(self, slot, value)
+
+    def merge(self, other):
+        self.requests += other.requests
+        self.failed += other.failed
+        self.checked += other.checked
+        self.latency.merge(other.latency)
+        self.vus = max(self.vus, other.vus)
+        self.sent += other.sent
+        self.received += other.received
+        return self
+
+
+class Timeline:
+    def __init__(self, window_seconds=10):
+        self.window_seconds = window_seconds
+        self.windows = {}
+        self.vus = {}
+        self.first_time = None
+
+    def add(self, step_name, metric_name, timestamp, value):
+        window = int(timestamp // self.window_seconds)
+        if self.first_time is None or timestamp < self.first_time:
+            self.first_time = timestamp
+
+        if metric_name == 'vus':
+            if value > self.vus.get(window, 0):
+                self.vus[window] = value
+            return
+
+        key = (step_name, window)
+        stats = self.windows.get(key)
+        if stats is None:
+            stats = self.windows[key] = WindowStats()
+
+        if metric_name == 'http_req_duration':
+            stats.latency.add(value)
+        elif metric_name == 'http_req_failed':
+            stats.failed += value
+            stats.checked += 1
+        elif metric_name == 'http_reqs':
+            stats.requests += value
+        elif metric_name == 'data_sent':
+            stats.sent += value
+        elif metric_name == 'data_received':
+            stats.received += value
+
+    def add_many(self, step_name, metric_name, times, values):
+        windows = np.floor(times / self.window_seconds).astype(np.int64)
+        first = float(times.min())
+        if self.first_time is None or first < self.first_time:
+            self.first_time = first
+
+        order = np.argsort(windows, kind='stable')
+        windows = windows[order]
+        values = values[order]
+        unique_windows, starts = np.unique(windows, return_index=True)
+        ends = list(starts[1:]) + [len(windows)]
+
+        for window, start, end in zip(unique_windows.tolist(), starts.tolist(), ends):
+            chunk = values[start:end]
+            if metric_name == 'vus':
+                peak = float(chunk.max())
+                if peak > self.vus.get(window, 0):
+                    self.vus[window] = peak
+                continue
+
+            key = (step_name, window)
+            stats = self.windows.get(key)
+            if stats is None:
+                stats = self.windows[key] = WindowStats()
+
+            if metric_name == 'http_req_duration':
+                stats.latency.extend(chunk)
+            elif metric_name == 'http_req_failed':
+                stats.failed += float(chunk.sum())
+                stats.checked += len(chunk)
+            elif metric_name == 'http_reqs':
+                stats.requests += float(chunk.sum())
+            elif metric_name == 'data_sent':
+                stats.sent += float(chunk.sum())
+            elif metric_name == 'data_received':
+                stats.received += float(chunk.sum())
+
+    def merge(self, other):
+        for key, stats in other.windows.items():
+            if key in self.windows:
+                self.windows[key].merge(stats)
+            else:
+                self.windows[key] = stats
+        for window, value in other.vus.items():
+            if value > self.vus.get(window, 0):
+                self.vus[window] = value
+        if other.first_time is not None and (self.first_time is None or other.first_time < self.first_time):
+            self.first_time = other.first_time
+        return self
+
+    def rows(self):
+        combined = {}
+        for (step_name, window), stats in self.windows.items():
+            combined.setdefault(window, WindowStats()).merge(stats)
+            yield step_name, window, stats
+        for window, stats in combined.items():
+            yield ALL_STEPS, window, stats
+
+
+def parse_stage_duration(text):
+    return sum(float(amount) * DURATION_UNITS[unit] for amount, unit in DURATION_PART_PATTERN.findall(text))
+
+
+def load_stages(load_test_file):
+    try:
+        with open(load_test_file, 'r') as f:
+            source = f.read()
+    except OSError as e:
+        print(f"Tidak dapat membaca tahapan dari {load_test_file}: {e}")
+        return []
+
+    stages = []
+    elapsed = 0.0
+    previous_target = 0
+    for duration, target in STAGE_PATTERN.findall(source):
+        seconds = parse_stage_duration(duration)
+        stages.append({
+            "label": f"Tahap {len(stages) + 1} ({previous_target}→{target} VU)",
+            "start": elapsed,
+            "end": elapsed + seconds,
+        })
+        elapsed += seconds
+        previous_target = int(target)
+    return stages
+
+
+def stage_of(offset_seconds, stages):
+    for stage in stages:
+        if stage["start"] <= offset_seconds < stage["end"]:
+            return stage["label"]
+    return "Di luar tahapan"
+
+
+def megabytes_per_second(byte_count, seconds):
+    return byte_count / 1e6 / seconds if seconds > 0 else 0
+
+
+WINDOW_COLUMNS = ["Permintaan/s", "Kirim (MB/s)", "Terima (MB/s)", "Error (%)"]
+
+
+def _window_record(stats, seconds, percentiles):
+    rps = stats.requests / seconds if seconds > 0 else 0
+    error_rate = stats.failed / stats.checked * 100 if stats.checked else 0
+    return [
+        format_number_id(rps, 1),
+        format_number_id(megabytes_per_second(stats.sent, seconds)),
+        format_number_id(megabytes_per_second(stats.received, seconds)),
+        format_number_id(error_rate, 1),
+    ] + [format_number_id(stats.latency.quantile(p / 100)) for p in percentiles]
+
+
+def prepare_timeline_table(timeline, stages, percentiles=(50, 95, 99)):
+    if timeline.first_time is None:
+        return pd.DataFrame()
+    first_window = int(timeline.first_time // timeline.window_seconds)
+
+    records = []
+    for step_name, window, stats in sorted(timeline.rows(), key=lambda row: (row[1], row[0] != ALL_STEPS, row[0])):
+        offset = (window - first_window) * timeline.window_seconds
+        records.append([format_number_id(offset, 0), stage_of(offset, stages), step_name, format_number_id(timeline.vus.get(window, 0), 0)]
+                       + _window_record(stats, timeline.window_seconds, percentiles))
+
+    return pd.DataFrame(records, columns=[
+        "Waktu (s)", "Tahap", "Langkah", "VU"
+    ] + WINDOW_COLUMNS + percentile_columns(percentiles))
+
+
+def prepare_stage_summary(timeline, stages, percentiles=(50, 95, 99)):
+    if timeline.first_time is None:
+        return pd.DataFrame()
+    first_window = int(timeline.first_time // timeline.window_seconds)
+
+    per_stage = {}
+    stage_seconds = {}
+    stage_vus = {}
+    for step_name, window, stats in timeline.rows():
+        if step_name != ALL_STEPS:
+            continue
+        label = stage_of((window - first_window) * timeline.window_seconds, stages)
+        per_stage.setdefault(label, WindowStats()).merge(stats)
+        stage_seconds[label] = stage_seconds.get(label, 0) + timeline.window_seconds
+        stage_vus[label] = max(stage_vus.get(label, 0), timeline.vus.get(window, 0))
+
+    order = [stage["label"] for stage in stages] + ["Di luar tahapan"]
+    records = []
+    for label in order:
+        if label not in per_stage:
+            continue
+        records.append([label, format_number_id(stage_vus[label], 0)]
+                       + _window_record(per_stage[label], stage_seconds[label], percentiles))
+
+    return pd.DataFrame(records, columns=[
+        "Tahap", "VU Maks"
+    ] + WINDOW_COLUMNS + percentile_columns(percentiles))
+
+
+def prepare_rolling_table(timeline, stages, rolling_seconds, percentiles=(50, 95, 99)):
+    """Ringkasan per langkah untuk jendela-jendela lengkap terakhir.
+
+    Jendela terbaru masih terisi sehingga diabaikan selama ada jendela lain;
+    rentang diukur dari waktu data, bukan waktu jam dinding.
+    """
+    if not timeline.windows:
+        return pd.DataFrame()
+    last_window = max(window for _, window in timeline.windows)
+    first_window = int(timeline.first_time // timeline.window_seconds)
+    span = max(1, int(round(rolling_seconds / timeline.window_seconds)))
+    end = last_window if last_window > first_window else last_window + 1
+    start = max(first_window, end - span)
+
+    per_step = {}
+    for step_name, window, stats in timeline.rows():
+        if start <= window < end:
+            per_step.setdefault(step_name, WindowStats()).merge(stats)
+    seconds = (end - start) * timeline.window_seconds
+    vus = max((timeline.vus.get(window, 0) for window in range(start, end)), default=0)
+    stage = stage_of((end - 1 - first_window) * timeline.window_seconds, stages)
+
+    records = []
+    for step_name in sorted(per_step, key=lambda name: (name != ALL_STEPS, name)):
+        records.append([stage, step_name, format_number_id(vus, 0)]
+                       + _window_record(per_step[step_name], seconds, percentiles))
+
+    return pd.DataFrame(records, columns=[
+        "Tahap", "Langkah", "VU"
+    ] + WINDOW_COLUMNS + percentile_columns(percentiles))
+
+
+def save_timeline(timeline_df, stage_df, prefix=""):
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+
+    timeline_file = f"{prefix}timeline_{timestamp}.csv"
+    timeline_df.to_csv(timeline_file, index=False)
+    print(f"Timeline disimpan ke {timeline_file}")
+
+    stage_file = f"{prefix}timeline_tahap_{timestamp}.csv"
+    stage_df.to_csv(stage_file, index=False)
+    print(f"Ringkasan per tahap disimpan ke {stage_file}")
@@ -1,23 +1,29 @@
-import uuid
+import argparse
 import json
-import random
-from datetime import datetime
+import os
+from concurrent.futures import ProcessPoolExecutor
 
-# Load the units data from the provided JSON
-with open('units.json', 'r') as f:
-    units_data = json.load(f)
+from seeding import add_seed_arguments, derive_rng, new_uuid, parse_base_time, resolve_seed, shard_path, shard_ranges
+from sql_output import OUTPUT_FORMATS, block_writer, format_insert
 
-# Filter out deleted units
-active_units = [unit for unit in units_data if unit["deleted_at"] is None]
-
-# Output file paths
-sql_file_path = 'insert_contributors.sql'
-delete_sql_file_path = 'delete_contributors.sql'
-json_file_path = 'contributor_logins.json'
+# Output file names, inside --output-dir
+sql_file_name = 'insert_contributors.sql'
+delete_sql_file_name = 'delete_contributors.sql'
+json_file_name = 'contributor_logins.json'
+json_index_file_name = 'contributor_logins_index.json'
 
 # Role ID for contributors is 3
 CONTRIBUTOR_ROLE = 3
 
+USER_COLUMNS = (
+    "id", "username", "full_name", "email", "role", "unit_id", "position",
+    "phone_number", "personal_email", "created_at", "updated_at", "deleted_at"
+)
+
+CREDENTIAL_COLUMNS = (
+    "id", "user_id", "hashed_password", "password_changed_at", "created_at", "updated_at", "deleted_at"
+)
+
 # List of common Indonesian university department/faculty names to use in usernames
 faculty_prefixes = [
     "fmipa", "fib", "fh", "fe", "ft", "fkg", "fk", "fisip", "fasilkom", "fik", 
@@ -35,145 +41,221 @@ last_names = [
     "Hidayat", "Nugraha", "Pratama", "Saputra", "Utama", "Nugroho", "Suryanto", "Irawan", "Gunawan", "Heriyanto"
 ]
 
-# List to store all user IDs for deletion later
-all_user_ids = []
+positions = ["Mahasiswa", "Dosen", "Asisten Dosen", "Peneliti", "Staff", "Koordinator Unit", "Kepala Program"]
 
-# List to store login information
-login_data = []
+def load_active_units():
+    # Load the units data from the provided JSON
+    with open('units.json', 'r') as f:
+        units_data = json.load(f)
 
-# Open file for writing SQL statements
-with open(sql_file_path, 'w') as sql_file:
-    # Write SQL header and transaction begin
-    sql_file.write("-- SQL script to insert 200 contributor users\n")
-    sql_file.write("BEGIN TRANSACTION;\n\n")
+    # Filter out deleted units
+    return [unit for unit in units_data if unit["deleted_at"] is None]
+
+def generate_contributor(rng, i, active_units, now):
+    # Generate a UUID for the user
+    user_id = new_uuid(rng)
+    credential_id = new_uuid(rng)
     
-    # Set to track used usernames
-    used_usernames = set()
+    # Assign a random unit
+    unit = rng.choice(active_units)
     
-    # Generate 200 users
-    for i in range(200):
-        # Generate a UUID for the user
-        user_id = uuid.uuid4()
-        credential_id = uuid.uuid4()
-        
-        # Store user ID for deletion script
-        all_user_ids.append(str(user_id))
-        
-        # Assign a random unit
-        unit = random.choice(active_units)
-        
-        # Generate username (faculty based + sequential ID to ensure uniqueness)
-        faculty_prefix = random.choice(faculty_prefixes)
-        
-        # Create username with dot format for SSO login
-        first = random.choice(first_names).lower()
-        last = random.choice(last_names).lower()
-        username = f"{first}.{last}{i+1000}"  # Start from 1000 to avoid conflicts
-        
-        # Just in case, verify it's unique
-        while username in used_usernames:
-            username = f"{first}.{last}{random.randint(1000, 9999)}"
-        
-        # Add to used usernames set
-        used_usernames.add(username)
-        
-        # Generate email with @ui.ac.id
-        email = f"{username}@ui.ac.id"
-        
-        # Generate full name by combining first and last names
-        full_name = f"{first.capitalize()} {last.capitalize()}"
-        
-        # Generate Indonesian phone number
-        phone_number = f"+62{random.randint(8, 9)}{random.randint(1, 9)}{random.randint(1000000, 99999999)}"
-        
-        # Generate personal email (not UI email)
-        personal_email = f"{username}_{random.randint(1, 999)}@gmail.com"
-        
-        # Generate position based on common academic positions
-        positions = ["Mahasiswa", "Dosen", "Asisten Dosen", "Peneliti", "Staff", "Koordinator Unit", "Kepala Program"]
-        position = random.choice(positions)
-        
-        # Current timestamp for PostgreSQL
-        now = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        
-        # SQL insert statement for users table
-        user_sql = f"""
-INSERT INTO users (
-    id, username, full_name, email, role, unit_id, position, 
-    phone_number, personal_email, created_at, updated_at, deleted_at
-) VALUES (
-    '{user_id}', 
-    '{username}', 
-    '{full_name}', 
-    '{email}', 
-    {CONTRIBUTOR_ROLE}, 
-    '{unit["id"]}', 
-    '{position}', 
-    '{phone_number}', 
-    '{personal_email}', 
-    '{now}', 
-    '{now}', 
-    NULL
-);
-"""
-        sql_file.write(user_sql)
-        
-        # SQL insert statement for user_credentials table
-        credential_sql = f"""
-INSERT INTO user_credentials (
-    id, user_id, hashed_password, password_changed_at, 
-    created_at, updated_at, deleted_at
-) VALUES (
-    '{credential_id}', 
-    '{user_id}', 
-    NULL, 
-    NULL, 
-    '{now}', 
-    '{now}', 
-    NULL
-);
-"""
-        sql_file.write(credential_sql)
-        sql_file.write("\n")
-        
-        # Create SSO login data in required format
-        npm = f"21{random.randint(10000000, 99999999)}"  # Random NPM number
-        kd_org = f"0{random.randint(1, 9)}.00.{random.randint(10, 20)}.0{random.randint(1, 9)}"  # Random organization code
-        
-        login_info = {
-            "user": username,
-            "ldap_cn": full_name,
-            "kd_org": kd_org,
-            "peran_user": position.lower(),
-            "npm": npm,
-            "nama": full_name
-        }
-        
-        login_data.append(login_info)
+    # Create username with dot format for SSO login; the sequential suffix
+    # (from 1000 to avoid conflicts) keeps it unique across shards
+    first = rng.choice(first_names).lower()
+    last = rng.choice(last_names).lower()
+    username = f"{first}.{last}{i+1000}"
     
-    # Write commit statement
-    sql_file.write("COMMIT;\n")
-
-# Write JSON file for logins
-with open(json_file_path, 'w') as json_file:
-    json.dump(login_data, json_file, indent=2)
-
-# Create delete SQL script
-with open(delete_sql_file_path, 'w') as delete_file:
-    delete_file.write("-- SQL script to delete the contributor users\n")
-    delete_file.write("BEGIN TRANSACTION;\n\n")
+    # Generate email with @ui.ac.id
+    email = f"{username}@ui.ac.id"
+    
+    # Generate full name by combining first and last names
+    full_name = f"{first.capitalize()} {last.capitalize()}"
+    
+    # Generate Indonesian phone number
+    phone_number = f"+62{rng.randint(8, 9)}{rng.randint(1, 9)}{rng.randint(1000000, 99999999)}"
     
-    # First delete user_credentials (due to foreign key constraint)
-    delete_file.write("-- Delete all user credentials\n")
-    user_ids_string = "', '".join(all_user_ids)
-    delete_file.write(f"DELETE FROM user_credentials WHERE user_id IN ('{user_ids_string}');\n\n")
+    # Generate personal email (not UI email)
+    personal_email = f"{username}_{rng.randint(1, 999)}@gmail.com"
     
-    # Then delete users
-    delete_file.write("-- Delete all users\n")
-    delete_file.write(f"DELETE FROM users WHERE id IN ('{user_ids_string}');\n\n")
+    # Generate position based on common academic positions
+    position = rng.choice(positions)
     
-    delete_file.write("COMMIT;\n")
+    user_row = (
+        user_id, username, full_name, email, CONTRIBUTOR_ROLE, unit["id"], position,
+        phone_number, personal_email, now, now, None
+    )
+    credential_row = (credential_id, user_id, None, None, now, now, None)
+    
+    # Create SSO login data in required format
+    npm = f"21{rng.randint(10000000, 99999999)}"  # Random NPM number
+    kd_org = f"0{rng.randint(1, 9)}.00.{rng.randint(10, 20)}.0{rng.randint(1, 9)}"  # Random organization code
+    
+    login_info = {
+        "user": username,
+        "ldap_cn": full_name,
+        "kd_org": kd_org,
+        "peran_user": position.lower(),
+        "npm": npm,
+        "nama": full_name
+    }
+    
+    return user_row, credential_row, login_info
+
+def write_statements(sql_file, start, end, seed, active_units, now, user_ids, login_data):
+    for i in range(start, end):
+        user_row, credential_row, login_info = generate_contributor(derive_rng(seed, i), i, active_units, now)
+        sql_file.write(format_insert("users", USER_COLUMNS, [user_row]))
+        sql_file.write(format_insert("user_credentials", CREDENTIAL_COLUMNS, [credential_row]))
+        sql_file.write("\n")
+        user_ids.append(str(user_row[0]))
+        login_data.append(login_info)
+
+def write_bulk(sql_file, output_format, start, end, batch_size, seed, active_units, now, user_ids, login_data):
+    # One multi-row INSERT or COPY block per table per batch of users
+    write_block = block_writer(sql_file, output_format, now)
+    for batch_start in range(start, end, batch_size):
+        batch_end = min(batch_start + batch_size, end)
+        users = []
+        credentials = []
+        for i in range(batch_start, batch_end):
+            user_row, credential_row, login_info = generate_contributor(derive_rng(seed, i), i, active_units, now)
+            users.append(user_row)
+            credentials.append(credential_row)
+            user_ids.append(str(user_row[0]))
+            login_data.append(login_info)
+
+        sql_file.write(f"-- Contributors {batch_start+1}-{batch_end}\n")
+        write_block("users", USER_COLUMNS, users)
+        write_block("user_credentials", CREDENTIAL_COLUMNS, credentials)
+
+def generate_shard(path, args, start, end, seed, active_units, now):
+    user_ids = []
+    login_data = []
+
+    # Open file for writing SQL statements
+    with open(path, 'w') as sql_file:
+        # Write SQL header and transaction begin
+        sql_file.write(f"-- SQL script to insert contributor users {start+1}-{end} (seed {seed})\n")
+        sql_file.write("BEGIN TRANSACTION;\n\n")
+
+        if args.format == "statements":
+            write_statements(sql_file, start, end, seed, active_units, now, user_ids, login_data)
+        else:
+            write_bulk(sql_file, args.format, start, end, args.batch_size, seed, active_units, now,
+                       user_ids, login_data)
+
+        # Write commit statement
+        sql_file.write("COMMIT;\n")
+
+    return path, user_ids, login_data
+
+def write_delete_script(path, user_ids, batch_size):
+    # Bounded batches, each in its own transaction, so cleanup holds its row
+    # locks only briefly and can be interrupted and rerun
+    with open(path, 'w') as delete_file:
+        delete_file.write(f"-- SQL script to delete the {len(user_ids)} contributor users, "
+                          f"in batches of {batch_size}\n\n")
+
+        for batch_start in range(0, len(user_ids), batch_size):
+            batch = user_ids[batch_start:batch_start + batch_size]
+            user_ids_string = "', '".join(batch)
+
+            delete_file.write(f"-- Batch {batch_start // batch_size + 1}\n")
+            delete_file.write("BEGIN TRANSACTION;\n")
+            # First delete user_credentials (due to foreign key constraint)
+            delete_file.write(f"DELETE FROM user_credentials WHERE user_id IN ('{user_ids_string}');\n")
+            # Then delete users
+            delete_file.write(f"DELETE FROM users WHERE id IN ('{user_ids_string}');\n")
+            delete_file.write("COMMIT;\n\n")
+
+def write_login_files(output_dir, login_data, shards):
+    # Compact JSON; with several shards, one disjoint file per k6 runner plus
+    # an index the load test reads to find its own slice (LOGIN_INDEX/LOGIN_SHARD)
+    if shards == 1:
+        path = os.path.join(output_dir, json_file_name)
+        with open(path, 'w') as json_file:
+            json.dump(login_data, json_file, separators=(",", ":"))
+        return [path]
+
+    index = {"total": len(login_data), "shards": []}
+    paths = []
+    for shard, (start, end) in enumerate(shard_ranges(len(login_data), shards)):
+        file_name = shard_path(json_file_name, f"{shard:03d}")
+        with open(os.path.join(output_dir, file_name), 'w') as json_file:
+            json.dump(login_data[start:end], json_file, separators=(",", ":"))
+        index["shards"].append({"file": file_name, "count": end - start})
+        paths.append(os.path.join(output_dir, file_name))
+
+    index_path = os.path.join(output_dir, json_index_file_name)
+    with open(index_path, 'w') as index_file:
+        json.dump(index, index_file, indent=2)
+    return [index_path] + paths
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Generate SQL and SSO logins for UI Heritage contributor users")
+    parser.add_argument("--count", type=int, default=200, help="Number of contributor users (default: 200)")
+    parser.add_argument("--output-dir", default=".", help="Directory for the generated files (default: .)")
+    parser.add_argument("--format", choices=OUTPUT_FORMATS, default="statements",
+                        help="statements: INSERTs per user; insert: multi-row INSERTs per table per batch; "
+                             "copy: COPY ... FROM STDIN blocks per table per batch, for psql (default: statements)")
+    parser.add_argument("--batch-size", type=int, default=1000,
+                        help="Users per multi-row INSERT/COPY batch (default: 1000)")
+    parser.add_argument("--delete-batch-size", type=int, default=1000,
+                        help="Users deleted per transaction in the delete script (default: 1000)")
+    parser.add_argument("--login-shards", type=int, default=1,
+                        help="Split the SSO logins into N disjoint files, one per k6 runner, "
+                             "plus contributor_logins_index.json (default: 1, a single file)")
+    add_seed_arguments(parser)
+    args = parser.parse_args()
+    if min(args.count, args.batch_size, args.delete_batch_size, args.workers, args.login_shards) < 1:
+        parser.error("--count, --batch-size, --delete-batch-size, --workers and --login-shards must be at least 1")
+    if args.login_shards > args.count:
+        parser.error("--login-shards must not exceed --count")
+    return args
+
+def main():
+    args = parse_args()
+    active_units = load_active_units()
+    seed = resolve_seed(args.seed)
+
+    # Current timestamp for PostgreSQL
+    now = parse_base_time(args.base_time).strftime("%Y-%m-%d %H:%M:%S")
+
+    os.makedirs(args.output_dir, exist_ok=True)
+    sql_file_path = os.path.join(args.output_dir, sql_file_name)
+    delete_sql_file_path = os.path.join(args.output_dir, delete_sql_file_name)
+
+    ranges = shard_ranges(args.count, args.workers)
+    if len(ranges) == 1:
+        shards = [generate_shard(sql_file_path, args, 0, args.count, seed, active_units, now)]
+    else:
+        # One insert script per shard; they share no rows and can be loaded concurrently
+        with ProcessPoolExecutor(max_workers=len(ranges)) as executor:
+            futures = [executor.submit(generate_shard, shard_path(sql_file_path, f"{shard:03d}"),
+                                       args, start, end, seed, active_units, now)
+                       for shard, (start, end) in enumerate(ranges)]
+            shards = [future.result() for future in futures]
+
+    # List to store all user IDs for deletion later
+    all_user_ids = [user_id for _, user_ids, _ in shards for user_id in user_ids]
+
+    # List to store login information
+    login_data = [login_info for _, _, shard_logins in shards for login_info in shard_logins]
+
+    # Write JSON file(s) for logins
+    login_paths = write_login_files(args.output_dir, login_data, args.login_shards)
+
+    # Create delete SQL script
+    write_delete_script(delete_sql_file_path, all_user_ids, args.delete_batch_size)
+
+    for path, _, _ in shards:
+        print(f"SQL insert script generated at: {path}")
+    print(f"SQL delete script generated at: {delete_sql_file_path}")
+    for path in login_paths:
+        print(f"Login JSON data generated at: {path}")
+    print(f"Seed: {seed} (rerun with --seed {seed} to reproduce)")
+    if args.format == "copy":
+        print("Load with psql (COPY ... FROM STDIN): psql -f <file>")
 
-print(f"SQL insert script generated at: {sql_file_path}")
-print(f"SQL delete script generated at: {delete_sql_file_path}")
-print(f"Login JSON data generated at: {json_file_path}")
\ No newline at end of file
+if __name__ == "__main__":
+    main()
@@ -1,10 +1,13 @@
-import uuid
-import random
+import argparse
+import bisect
+import itertools
 import json
-import os
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime, timedelta
-import string
-from typing import List, Dict, Any
+
+from seeding import (ZipfSampler, add_seed_arguments, derive_rng, new_uuid, parse_base_time, resolve_seed,
+                     shard_path, shard_ranges, zipf_cumulative)
+from sql_output import NOW, OUTPUT_FORMATS, block_writer, format_insert
 
 
 MEDIA_TYPE = {
@@ -21,6 +24,33 @@ CONTENT_DISTRIBUTION = {
 
 STATUS_DISETUJUI = 4
 
+CONTRIBUTOR_ID = "4eed0dc6-11e1-4d8b-a9fa-1163e4863441"
+
+TAG_COLUMNS = ("id", "name", "created_at", "updated_at")
+
+# Columns per table, in foreign-key order so each batch can be loaded as is
+TABLE_COLUMNS = {
+    "media_items": (
+        "id", "title", "description", "type", "contributor_id", "status", "category_id",
+        "event_date", "reference_code", "description_level", "media_extent",
+        "archival_history", "source", "language", "note", "created_at", "updated_at", "status_updated_at"
+    ),
+    "files": (
+        "id", "file_name", "file_path", "file_type", "file_size", "thumbnail_path", "created_at", "updated_at"
+    ),
+    "media_item_files": (
+        "media_item_id", "file_id", "caption", '"order"', "copyright", "created_at", "updated_at"
+    ),
+    "media_item_unit_approvals": ("media_item_id", "unit_id", "status", "created_at", "updated_at"),
+    "media_item_arsip_approvals": ("media_item_id", "status", "created_at", "updated_at"),
+    "media_item_tags": ("media_item_id", "tag_id", "created_at", "updated_at"),
+}
+
+# Negative indexes for RNG streams that do not belong to a single item
+TAGS_STREAM = -1
+RANKING_STREAM = -2
+POPULARITY_STREAM = -3
+
 def load_json_data():
     with open('units.json', 'r') as f:
         units = json.load(f)
@@ -30,7 +60,51 @@ def load_json_data():
 
     return units, categories
 
-def generate_predefined_tags():
+class GeneratorContext:
+    """Lookups built once from units.json/categories.json, so the per-item
+    work only touches the units that were selected."""
+
+    def __init__(self, units_data, categories_data, tags, base_datetime, skews, ranking_rng):
+        self.active_categories = [c for c in categories_data if c.get("is_active", True) and c.get("deleted_at") is None]
+        if not self.active_categories:
+            raise ValueError("No active categories found")
+
+        self.active_units = [u for u in units_data if u.get("is_active", True) and u.get("deleted_at") is None]
+        if not self.active_units:
+            raise ValueError("No active units found")
+        self.active_unit_ids = [unit["id"] for unit in self.active_units]
+
+        # id -> unit index, with the sort key and code fragment per unit index
+        self.unit_index = {unit["id"]: i for i, unit in enumerate(units_data)}
+        self.unit_orders = [unit["order"] for unit in units_data]
+        self.unit_codes = [unit["reference_code"] for unit in units_data]
+
+        self.media_types = list(CONTENT_DISTRIBUTION)
+        self.cumulative_weights = list(itertools.accumulate(CONTENT_DISTRIBUTION.values()))
+
+        # Category, unit and tag assignment; uniform unless a skew is given
+        self.categories = ZipfSampler(self.active_categories, skews["category"], ranking_rng)
+        self.units = ZipfSampler(self.active_unit_ids, skews["unit"], ranking_rng)
+        self.tags = ZipfSampler(tags, skews["tag"], ranking_rng)
+
+        self.base_datetime = base_datetime
+
+    def pick_media_type(self, rand_val):
+        position = bisect.bisect_left(self.cumulative_weights, rand_val)
+        if position == len(self.media_types):
+            return MEDIA_TYPE["ARTIKEL"]
+        return self.media_types[position]
+
+    def draw_type_and_id(self, rng):
+        # Always the first two draws of an item, so media_item_id() can recover
+        # the id without building the whole item
+        selected_type = self.pick_media_type(rng.random())
+        return selected_type, new_uuid(rng)
+
+    def media_item_id(self, seed, item_index):
+        return self.draw_type_and_id(derive_rng(seed, item_index))[1]
+
+def generate_predefined_tags(rng):
     single_word_tags = [
         "penelitian", "akademik", "pendidikan", "ilmiah", "studi", "kajian",
         "acara", "seminar", "workshop", "konferensi", "pertemuan", "kegiatan",
@@ -64,8 +138,8 @@ def generate_predefined_tags():
     all_tags = single_word_tags + two_word_tags
 
     while len(all_tags) < 100:
-        word1 = random.choice(single_word_tags)
-        word2 = random.choice(single_word_tags)
+        word1 = rng.choice(single_word_tags)
+        word2 = rng.choice(single_word_tags)
         if word1 != word2:
             new_tag = f"{word1} {word2}"
             if new_tag not in all_tags and f"{word2} {word1}" not in all_tags:
@@ -75,21 +149,20 @@ def generate_predefined_tags():
 
     tags = []
     for tag_name in all_tags:
-        tag_id = uuid.uuid4()
+        tag_id = new_uuid(rng)
         tags.append({"id": tag_id, "name": tag_name})
 
     return tags
 
-def generate_random_date():
-    end_date = datetime.now()
+def generate_random_date(rng, end_date):
     start_date = end_date - timedelta(days=365*10)
 
-    random_days = random.randint(0, (end_date - start_date).days)
+    random_days = rng.randint(0, (end_date - start_date).days)
     random_date = start_date + timedelta(days=random_days)
 
     return random_date
 
-def generate_title(media_type):
+def generate_title(rng, media_type):
     prefixes = [
         "Dokumentasi", "Sejarah", "Perkembangan", "Kegiatan", "Peristiwa",
         "Acara", "Pertemuan", "Seminar", "Workshop", "Riset", "Penelitian",
@@ -109,9 +182,9 @@ def generate_title(media_type):
         MEDIA_TYPE["GALERI"]: "Galeri"
     }
     
-    return f"{random.choice(prefixes)} {random.choice(subjects)} {type_names[media_type]} UI Heritage"
+    return f"{rng.choice(prefixes)} {rng.choice(subjects)} {type_names[media_type]} UI Heritage"
 
-def generate_description(num_paragraphs):
+def generate_description(rng, num_paragraphs):
     paragraphs = []
     topics = [
         "sejarah perkembangan universitas",
@@ -127,8 +200,8 @@ def generate_description(num_paragraphs):
     ]
     
     for _ in range(num_paragraphs):
-        topic = random.choice(topics)
-        sentences = random.randint(4, 8)
+        topic = rng.choice(topics)
+        sentences = rng.randint(4, 8)
         paragraph = f"Dokumentasi {topic} merupakan bagian penting dari arsip UI Heritage. "
         paragraph += f"Dalam konteks ini, terdapat berbagai aspek yang perlu diperhatikan terkait {topic}. "
         paragraph += f"Selain itu, perkembangan {topic} juga memberikan gambaran tentang perjalanan institusi. "
@@ -147,83 +220,81 @@ def generate_description(num_paragraphs):
     
     return "\n\n".join(paragraphs)
 
-def generate_files(media_type):
+def generate_files(rng, media_type):
     files = []
     
     if media_type == MEDIA_TYPE["ARTIKEL"]:
-        num_images = random.randint(1, 2)
+        num_images = rng.randint(1, 2)
         for i in range(num_images):
-            file_id = uuid.uuid4()
+            file_id = new_uuid(rng)
             files.append({
                 "id": file_id,
                 "file_name": f"artikel_image_{i+1}.jpg",
                 "file_path": f"images/artikel_image_{i+1}_{file_id}.jpg",
                 "file_type": "image/jpeg",
-                "file_size": random.randint(100000, 400000),
+                "file_size": rng.randint(100000, 400000),
                 "order": i,
                 "caption": f"Gambar dokumentasi {i+1}",
-                "copyright": f"© Universitas Indonesia {random.randint(2015, 2025)}"
+                "copyright": f"© Universitas Indonesia {rng.randint(2015, 2025)}"
             })
     
     elif media_type == MEDIA_TYPE["GALERI"]:
-        num_images = random.randint(3, 5)
+        num_images = rng.randint(3, 5)
         for i in range(num_images):
-            file_id = uuid.uuid4()
+            file_id = new_uuid(rng)
             files.append({
                 "id": file_id,
                 "file_name": f"galeri_image_{i+1}.jpg",
                 "file_path": f"images/galeri_image_{i+1}_{file_id}.jpg",
                 "file_type": "image/jpeg",
-                "file_size": random.randint(100000, 500000),
+                "file_size": rng.randint(100000, 500000),
                 "order": i,
                 "caption": f"Galeri foto {i+1}",
-                "copyright": f"© Universitas Indonesia {random.randint(2015, 2025)}"
+                "copyright": f"© Universitas Indonesia {rng.randint(2015, 2025)}"
             })
             
-        if random.random() < 0.5:
-            file_id = uuid.uuid4()
+        if rng.random() < 0.5:
+            file_id = new_uuid(rng)
             thumbnail_path = f"video/thumbnails/video_thumbnail_{file_id}.jpg"
             files.append({
                 "id": file_id,
                 "file_name": "galeri_video.mp4",
                 "file_path": f"videos/galeri_video_{file_id}.mp4",
                 "file_type": "video/mp4",
-                "file_size": random.randint(1000000, 10000000),
+                "file_size": rng.randint(1000000, 10000000),
                 "thumbnail_path": thumbnail_path,
                 "order": num_images,
                 "caption": "Video dokumentasi",
-                "copyright": f"© Universitas Indonesia {random.randint(2015, 2025)}"
+                "copyright": f"© Universitas Indonesia {rng.randint(2015, 2025)}"
             })
     
     elif media_type == MEDIA_TYPE["VIDEO"]:
-        file_id = uuid.uuid4()
+        file_id = new_uuid(rng)
         thumbnail_path = f"video/thumbnails/video_thumbnail_{file_id}.jpg"
         files.append({
             "id": file_id,
             "file_name": "video_konten.mp4",
             "file_path": f"videos/video_konten_{file_id}.mp4",
             "file_type": "video/mp4",
-            "file_size": random.randint(1000000, 10000000),
+            "file_size": rng.randint(1000000, 10000000),
             "thumbnail_path": thumbnail_path,
             "order": 0,
             "caption": "Video dokumentasi",
-            "copyright": f"© Universitas Indonesia {random.randint(2015, 2025)}"
+            "copyright": f"© Universitas Indonesia {rng.randint(2015, 2025)}"
         })
     
     return files
 
-def generate_reference_code(units_data, unit_ids, count):
+def generate_reference_code(context, unit_ids, count):
     country_code = "ID"
     university_code = "UI"
-    unit_codes = ""
     
-    unit_dict = {unit["id"]: unit for unit in units_data}
-    selected_units = [unit_dict[unit_id] for unit_id in unit_ids if unit_id in unit_dict]
+    unit_index = context.unit_index
+    selected = [unit_index[unit_id] for unit_id in unit_ids if unit_id in unit_index]
     
-    selected_units.sort(key=lambda x: x["order"])
+    selected.sort(key=context.unit_orders.__getitem__)
     
-    for unit in selected_units:
-        unit_codes += unit["reference_code"]
+    unit_codes = "".join(context.unit_codes[i] for i in selected)
     
     base_code = f"{country_code}-{university_code}-{unit_codes}"
     
@@ -238,51 +309,33 @@ def generate_reference_code(units_data, unit_ids, count):
     
     return f"{base_code}-{unique_id}"
 
-def generate_media_item_sql(item_index, units_data, categories_data, all_tags, base_datetime):
+def build_media_item_rows(rng, item_index, context):
+    base_datetime = context.base_datetime
+
     # Calculate statusUpdatedAt by adding item_index+1 seconds to the base time
     status_updated_at = base_datetime + timedelta(seconds=item_index+1)
     
-    rand_val = random.random()
-    cumulative = 0
-    selected_type = None
-
-    for media_type, probability in CONTENT_DISTRIBUTION.items():
-        cumulative += probability
-        if rand_val <= cumulative:
-            selected_type = media_type
-            break
-
-    if selected_type is None:
-        selected_type = MEDIA_TYPE["ARTIKEL"]
-
-    media_item_id = uuid.uuid4()
-    title = generate_title(selected_type)
-    event_date = generate_random_date()
+    selected_type, media_item_id = context.draw_type_and_id(rng)
+    title = generate_title(rng, selected_type)
+    event_date = generate_random_date(rng, base_datetime)
 
     if selected_type == MEDIA_TYPE["ARTIKEL"]:
-        paragraphs = random.randint(2, 5)
-        description = generate_description(paragraphs)
+        paragraphs = rng.randint(2, 5)
+        description = generate_description(rng, paragraphs)
     else:
         description = ""
 
-    active_categories = [c for c in categories_data if c.get("is_active", True) and c.get("deleted_at") is None]
-    if not active_categories:
-        raise ValueError("No active categories found")
-    category = random.choice(active_categories)
+    category = context.categories.choice(rng)
 
-    active_units = [u for u in units_data if u.get("is_active", True) and u.get("deleted_at") is None]
-    if not active_units:
-        raise ValueError("No active units found")
-    num_units = random.randint(1, min(5, len(active_units)))
-    selected_units = random.sample(active_units, num_units)
-    unit_ids = [unit["id"] for unit in selected_units]
+    num_units = rng.randint(1, min(5, len(context.active_unit_ids)))
+    unit_ids = context.units.sample(rng, num_units)
 
-    num_tags = random.randint(0, 5)
-    selected_tags = random.sample(all_tags, num_tags) if num_tags > 0 else []
+    num_tags = rng.randint(0, 5)
+    selected_tags = context.tags.sample(rng, num_tags) if num_tags > 0 else []
 
-    files = generate_files(selected_type)
+    files = generate_files(rng, selected_type)
 
-    reference_code = generate_reference_code(units_data, unit_ids, item_index + 1)
+    reference_code = generate_reference_code(context, unit_ids, item_index + 1)
 
     image_count = sum(1 for file in files if file["file_type"].startswith("image/"))
     video_count = sum(1 for file in files if file["file_type"].startswith("video/"))
@@ -299,138 +352,198 @@ def generate_media_item_sql(item_index, units_data, categories_data, all_tags, b
     else:
         media_extent = f"{len(files)} media"
 
-    # Generate SQL statements
-    sql = f"""
--- Insert media item
-INSERT INTO media_items (
-    id, title, description, type, contributor_id, status, category_id, 
-    event_date, reference_code, description_level, media_extent, 
-    archival_history, source, language, note, created_at, updated_at, status_updated_at
-) VALUES (
-    '{media_item_id}',
-    '{title.replace("'", "''")}',
-    '{description.replace("'", "''")}',
-    {selected_type},
-    '4eed0dc6-11e1-4d8b-a9fa-1163e4863441',
-    {STATUS_DISETUJUI},
-    '{category["id"]}',
-    '{event_date.strftime("%Y-%m-%d")}',
-    '{reference_code}',
-    'Item',
-    '{media_extent}',
-    'Arsip dikumpulkan dari dokumentasi kegiatan universitas',
-    'Dokumentasi internal Universitas Indonesia',
-    'Indonesia',
-    'Dokumen ini merupakan bagian dari koleksi UI Heritage',
-    NOW(),
-    NOW(),
-    '{status_updated_at.strftime("%Y-%m-%d %H:%M:%S")}'
-);
-"""
-
-    # Insert files
-    for file in files:
-        sql += f"""
--- Create file record
-INSERT INTO files (id, file_name, file_path, file_type, file_size, thumbnail_path, created_at, updated_at)
-VALUES (
-    '{file['id']}', 
-    '{file['file_name']}', 
-    '{file['file_path']}', 
-    '{file['file_type']}', 
-    {file['file_size']}, 
-    {("'" + file['thumbnail_path'] + "'") if 'thumbnail_path' in file else 'NULL'}, 
-    NOW(), 
-    NOW()
-);
-"""
-    
-    # Insert file associations
-    sql += f"""
--- Insert media item files associations
-INSERT INTO media_item_files (media_item_id, file_id, caption, "order", copyright, created_at, updated_at)
-VALUES
-"""
-    for i, file in enumerate(files):
-        sql += f"""('{media_item_id}', '{file["id"]}', '{file["caption"].replace("'", "''")}', {file["order"]}, '{file["copyright"].replace("'", "''")}', NOW(), NOW())"""
-        if i < len(files) - 1:
-            sql += ","
-        sql += "\n"
-    sql += ";\n"
-    
-    # Insert unit associations
-    sql += f"""
--- Insert media item unit associations
-INSERT INTO media_item_unit_approvals (media_item_id, unit_id, status, created_at, updated_at)
-VALUES
-"""
-    for i, unit_id in enumerate(unit_ids):
-        sql += f"""('{media_item_id}', '{unit_id}', {STATUS_DISETUJUI}, NOW(), NOW())"""
-        if i < len(unit_ids) - 1:
-            sql += ","
-        sql += "\n"
-    sql += ";\n"
-    
-    # Insert arsip approval
-    sql += f"""
--- Insert media item arsip approval
-INSERT INTO media_item_arsip_approvals (media_item_id, status, created_at, updated_at)
-VALUES ('{media_item_id}', {STATUS_DISETUJUI}, NOW(), NOW());
-"""
-    
-    # Insert tag associations
-    if selected_tags:
-        sql += f"""
--- Insert media item tag associations
-INSERT INTO media_item_tags (media_item_id, tag_id, created_at, updated_at)
-VALUES
-"""
-        for i, tag in enumerate(selected_tags):
-            sql += f"""('{media_item_id}', '{tag["id"]}', NOW(), NOW())"""
-            if i < len(selected_tags) - 1:
-                sql += ","
-            sql += "\n"
-        sql += ";\n"
-    
-    return sql
+    return {
+        "media_items": [(
+            media_item_id, title, description, selected_type, CONTRIBUTOR_ID, STATUS_DISETUJUI,
+            category["id"], event_date.strftime("%Y-%m-%d"), reference_code, "Item", media_extent,
+            "Arsip dikumpulkan dari dokumentasi kegiatan universitas",
+            "Dokumentasi internal Universitas Indonesia",
+            "Indonesia",
+            "Dokumen ini merupakan bagian dari koleksi UI Heritage",
+            NOW, NOW, status_updated_at.strftime("%Y-%m-%d %H:%M:%S")
+        )],
+        "files": [
+            (file["id"], file["file_name"], file["file_path"], file["file_type"], file["file_size"],
+             file.get("thumbnail_path"), NOW, NOW)
+            for file in files
+        ],
+        "media_item_files": [
+            (media_item_id, file["id"], file["caption"], file["order"], file["copyright"], NOW, NOW)
+            for file in files
+        ],
+        "media_item_unit_approvals": [
+            (media_item_id, unit_id, STATUS_DISETUJUI, NOW, NOW) for unit_id in unit_ids
+        ],
+        "media_item_arsip_approvals": [(media_item_id, STATUS_DISETUJUI, NOW, NOW)],
+        "media_item_tags": [(media_item_id, tag["id"], NOW, NOW) for tag in selected_tags],
+    }
+
+def generate_media_item_sql(rng, item_index, context):
+    rows = build_media_item_rows(rng, item_index, context)
+    return "".join(
+        f"\n-- Insert {table}\n" + format_insert(table, TABLE_COLUMNS[table], table_rows)
+        for table, table_rows in rows.items() if table_rows
+    )
+
+def write_tags(f, output_format, predefined_tags, now):
+    f.write("-- Creating 100 predefined tags\n")
+    tag_rows = [(tag["id"], tag["name"], NOW, NOW) for tag in predefined_tags]
+    if output_format == "statements":
+        for row in tag_rows:
+            f.write(format_insert("tags", TAG_COLUMNS, [row]))
+        f.write("\n")
+    else:
+        f.write("BEGIN;\n\n")
+        block_writer(f, output_format, now)("tags", TAG_COLUMNS, tag_rows)
+        f.write("COMMIT;\n\n")
+
+def write_statements(f, start, end, seed, context):
+    f.write(f"-- Now creating media items {start+1}-{end}\n\n")
+
+    for i in range(start, end):
+        f.write(f"-- Media Item {i+1}\n")
+        f.write(generate_media_item_sql(derive_rng(seed, i), i, context))
+        f.write("\n")
+
+def write_bulk(f, output_format, start, end, batch_size, seed, context, now):
+    # One multi-row INSERT or COPY block per table per batch of items, so
+    # memory stays bounded by the batch size and not by the item count.
+    write_block = block_writer(f, output_format, now)
+
+    f.write("BEGIN;\n\n")
+    for batch_start in range(start, end, batch_size):
+        batch_end = min(batch_start + batch_size, end)
+        batch = {table: [] for table in TABLE_COLUMNS}
+        for i in range(batch_start, batch_end):
+            item_rows = build_media_item_rows(derive_rng(seed, i), i, context)
+            for table, rows in item_rows.items():
+                batch[table].extend(rows)
+
+        f.write(f"-- Media items {batch_start+1}-{batch_end}\n")
+        for table, rows in batch.items():
+            if rows:
+                write_block(table, TABLE_COLUMNS[table], rows)
+
+    f.write("COMMIT;\n")
+
+def write_items(f, args, start, end, seed, context, now):
+    if args.format == "statements":
+        write_statements(f, start, end, seed, context)
+    else:
+        write_bulk(f, args.format, start, end, args.batch_size, seed, context, now)
+
+def generate_shard(path, args, start, end, seed, context, now):
+    with open(path, "w") as f:
+        f.write(f"-- Media items {start+1}-{end} for UI Heritage (seed {seed})\n\n")
+        write_items(f, args, start, end, seed, context, now)
+    return path
+
+def build_popularity_manifest(context, seed, count, exponent, hot_items):
+    # Item popularity follows Zipf(exponent) over a seeded random ranking of
+    # the items. Only the hottest ranks are listed; the remaining probability
+    # mass is the cold tail, which the load test draws from search results.
+    hot_items = min(hot_items, count)
+    ranked = derive_rng(seed, POPULARITY_STREAM).sample(range(count), hot_items)
+    cumulative = zipf_cumulative(count, exponent)
+    return {
+        "seed": seed,
+        "count": count,
+        "exponent": exponent,
+        "hot_share": round(cumulative[hot_items - 1], 9),
+        "hot_items": [{"id": str(context.media_item_id(seed, item_index)), "cumulative": round(weight, 9)}
+                      for item_index, weight in zip(ranked, cumulative)],
+        "categories": context.categories.manifest(lambda category: category["id"]),
+        "units": context.units.manifest(),
+    }
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Generate SQL seed data for UI Heritage media items")
+    parser.add_argument("--count", type=int, default=200, help="Number of media items to generate (default: 200)")
+    parser.add_argument("--format", choices=OUTPUT_FORMATS, default="statements",
+                        help="statements: INSERTs per item; insert: multi-row INSERTs per table per batch; "
+                             "copy: COPY ... FROM STDIN blocks per table per batch, for psql (default: statements)")
+    parser.add_argument("--batch-size", type=int, default=1000,
+                        help="Items per multi-row INSERT/COPY batch (default: 1000)")
+    parser.add_argument("--output", default="generate_media_items.sql", help="Output SQL file")
+    add_seed_arguments(parser)
+    parser.add_argument("--category-skew", type=float, default=0.0,
+                        help="Zipf exponent for assigning categories to items (default: 0, uniform)")
+    parser.add_argument("--unit-skew", type=float, default=0.0,
+                        help="Zipf exponent for assigning units to items (default: 0, uniform)")
+    parser.add_argument("--tag-skew", type=float, default=0.0,
+                        help="Zipf exponent for assigning tags to items (default: 0, uniform)")
+    parser.add_argument("--popularity-skew", type=float, default=1.0,
+                        help="Zipf exponent for item popularity in the manifest (default: 1.0)")
+    parser.add_argument("--hot-items", type=int, default=10000,
+                        help="Most popular items listed in the manifest (default: 10000)")
+    parser.add_argument("--manifest", default="popularity_manifest.json",
+                        help="Popularity manifest for the reader load test (POPULARITY_MANIFEST)")
+    args = parser.parse_args()
+    if args.count < 1 or args.batch_size < 1 or args.workers < 1 or args.hot_items < 1:
+        parser.error("--count, --batch-size, --workers and --hot-items must be at least 1")
+    if min(args.category_skew, args.unit_skew, args.tag_skew, args.popularity_skew) < 0:
+        parser.error("skew exponents must not be negative")
+    return args
 
 def main():
+    args = parse_args()
     try:
         units_data, categories_data = load_json_data()
 
-        predefined_tags = generate_predefined_tags()
+        seed = resolve_seed(args.seed)
+        # The tags get their own RNG stream, separate from every item index
+        predefined_tags = generate_predefined_tags(derive_rng(seed, TAGS_STREAM))
 
-        output_file = "generate_media_items.sql"
+        output_file = args.output
+        count = args.count
         
         # Base datetime to use for statusUpdatedAt incrementing
-        base_datetime = datetime.now()
-
-        with open(output_file, "w") as f:
-            f.write("-- SQL Script to generate 200 media items for UI Heritage\n")
-            f.write("-- Generated at: " + datetime.now().strftime("%Y-%m-%d %H:%M:%S") + "\n\n")
-            
-            f.write("-- Creating 100 predefined tags\n")
-            for tag in predefined_tags:
-                f.write(f"""INSERT INTO tags (id, name, created_at, updated_at) 
-VALUES ('{tag["id"]}', '{tag["name"].replace("'", "''")}', NOW(), NOW());\n""")
-            
-            f.write("\n-- Now creating 200 media items\n\n")
-
-            for i in range(200):
-                f.write(f"-- Media Item {i+1}\n")
-                sql = generate_media_item_sql(i, units_data, categories_data, predefined_tags, base_datetime)
-                f.write(sql)
-                f.write("\n")
-            
-        print(f"Successfully generated SQL script: {output_file}")
-        print(f"The script creates 100 predefined tags and 200 media items with the following distribution:")
-        print(f"- Articles: {int(CONTENT_DISTRIBUTION[MEDIA_TYPE['ARTIKEL']] * 200)} items")
-        print(f"- Galleries: {int(CONTENT_DISTRIBUTION[MEDIA_TYPE['GALERI']] * 200)} items")
-        print(f"- Videos: {int(CONTENT_DISTRIBUTION[MEDIA_TYPE['VIDEO']] * 200)} items")
+        base_datetime = parse_base_time(args.base_time)
+        now = base_datetime.strftime("%Y-%m-%d %H:%M:%S")
+        skews = {"category": args.category_skew, "unit": args.unit_skew, "tag": args.tag_skew}
+        context = GeneratorContext(units_data, categories_data, predefined_tags, base_datetime,
+                                   skews, derive_rng(seed, RANKING_STREAM))
+        ranges = shard_ranges(count, args.workers)
+
+        if len(ranges) == 1:
+            with open(output_file, "w") as f:
+                f.write(f"-- SQL Script to generate {count} media items for UI Heritage\n")
+                f.write("-- Generated at: " + datetime.now().strftime("%Y-%m-%d %H:%M:%S") + "\n\n")
+                write_tags(f, args.format, predefined_tags, now)
+                write_items(f, args, 0, count, seed, context, now)
+            outputs = [output_file]
+        else:
+            # Tags first, then the shards, which only reference tags and can be loaded concurrently
+            tags_file = shard_path(output_file, "tags")
+            with open(tags_file, "w") as f:
+                f.write(f"-- Predefined tags for UI Heritage media items (seed {seed})\n\n")
+                write_tags(f, args.format, predefined_tags, now)
+            with ProcessPoolExecutor(max_workers=len(ranges)) as executor:
+                futures = [executor.submit(generate_shard, shard_path(output_file, f"{shard:03d}"), args, start, end,
+                                           seed, context, now)
+                           for shard, (start, end) in enumerate(ranges)]
+                outputs = [tags_file] + [future.result() for future in futures]
+
+        with open(args.manifest, "w") as f:
+            json.dump(build_popularity_manifest(context, seed, count, args.popularity_skew, args.hot_items),
+                      f, separators=(",", ":"))
+
+        for path in outputs:
+            print(f"Successfully generated SQL script: {path}")
+        print(f"The script creates 100 predefined tags and {count} media items with the following distribution:")
+        print(f"- Articles: {int(CONTENT_DISTRIBUTION[MEDIA_TYPE['ARTIKEL']] * count)} items")
+        print(f"- Galleries: {int(CONTENT_DISTRIBUTION[MEDIA_TYPE['GALERI']] * count)} items")
+        print(f"- Videos: {int(CONTENT_DISTRIBUTION[MEDIA_TYPE['VIDEO']] * count)} items")
         print(f"Each item has statusUpdatedAt set with +1 second increments from the base time: {base_datetime}")
+        print(f"Seed: {seed} (rerun with --seed {seed} --base-time {base_datetime.isoformat()} to reproduce)")
+        print(f"Popularity manifest for the reader load test: {args.manifest}")
+        if len(outputs) > 1:
+            print(f"Load {outputs[0]} first; the {len(outputs) - 1} shard files can then be loaded concurrently")
+        if args.format == "copy":
+            print("Load with psql (COPY ... FROM STDIN): psql -f <file>")
 
     except Exception as e:
         print(f"Error: {str(e)}")
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
@@ -0,0 +1,145 @@
+import argparse
+import hashlib
+import json
+import mimetypes
+import mmap
+import os
+
+MB = 1024 * 1024
+
+# File sizes for --sweep, in MB
+DEFAULT_SWEEP_SIZES = (1, 5, 10, 25, 50, 100)
+
+MANIFEST_NAME = "manifest.json"
+
+SIZE_SUFFIXES = {"B": 1, "KB": 1024, "MB": MB, "GB": 1024 * MB}
+
+
+def parse_size(value):
+    # "1048576", "512KB", "5MB" -> bytes
+    text = value.strip().upper()
+    for suffix in sorted(SIZE_SUFFIXES, key=len, reverse=True):
+        if text.endswith(suffix) and text[:-len(suffix)].strip():
+            return int(float(text[:-len(suffix)]) * SIZE_SUFFIXES[suffix])
+    return int(text)
+
+def format_size(size):
+    if size % MB == 0:
+        return f"{size // MB}MB"
+    if size % 1024 == 0:
+        return f"{size // 1024}KB"
+    return f"{size}B"
+
+def split_file(input_path, chunk_size, output_dir, file_name=None):
+    """Split input_path into chunk_0, chunk_1, ... in output_dir and write a
+    manifest with the offset, size and SHA-256 of every chunk. Chunks are
+    written straight from a memory map, without copying the file."""
+    size = os.path.getsize(input_path)
+    if size == 0:
+        # mmap cannot map an empty file, and an upload needs at least one chunk
+        raise ValueError(f"{input_path} is empty")
+    os.makedirs(output_dir, exist_ok=True)
+    file_name = file_name or os.path.basename(input_path)
+    chunks = []
+    file_digest = hashlib.sha256()
+
+    with open(input_path, "rb") as source:
+        with mmap.mmap(source.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            view = memoryview(mapped)
+            try:
+                for index, offset in enumerate(range(0, size, chunk_size)):
+                    chunk = view[offset:offset + chunk_size]
+                    chunk_file = f"chunk_{index}"
+                    with open(os.path.join(output_dir, chunk_file), "wb") as target:
+                        target.write(chunk)
+                    file_digest.update(chunk)
+                    chunks.append({
+                        "index": index,
+                        "file": chunk_file,
+                        "offset": offset,
+                        "size": len(chunk),
+                        "sha256": hashlib.sha256(chunk).hexdigest(),
+                    })
+                    chunk.release()
+            finally:
+                view.release()
+
+    manifest = {
+        "file_name": file_name,
+        "file_type": mimetypes.guess_type(file_name)[0] or "application/octet-stream",
+        "size": size,
+        "chunk_size": chunk_size,
+        "sha256": file_digest.hexdigest(),
+        "chunks": chunks,
+    }
+    with open(os.path.join(output_dir, MANIFEST_NAME), "w") as f:
+        json.dump(manifest, f, indent=2)
+    return manifest
+
+def write_sized_copy(input_path, size, output_path):
+    # Repeat the input's bytes up to `size`, streaming from its memory map
+    if os.path.getsize(input_path) == 0:
+        raise ValueError(f"{input_path} is empty")
+    with open(input_path, "rb") as source, open(output_path, "wb") as target:
+        with mmap.mmap(source.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            view = memoryview(mapped)
+            try:
+                remaining = size
+                while remaining > 0:
+                    part = view[:min(remaining, len(view))]
+                    target.write(part)
+                    remaining -= len(part)
+                    part.release()
+            finally:
+                view.release()
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Split a media file into upload chunks with a manifest "
+                                                 "for the contributor load test")
+    parser.add_argument("input", help="Media file to split, e.g. ../skenario-2-kontributor/test_data/shot12.mp4")
+    parser.add_argument("--chunk-size", default="1MB",
+                        help="Chunk size(s), comma separated, e.g. 1MB or 1MB,5MB,10MB (default: 1MB)")
+    parser.add_argument("--output-dir", default="../skenario-2-kontributor/test_data/chunks",
+                        help="Output directory; with several chunk or file sizes, one subdirectory per combination")
+    parser.add_argument("--sweep", nargs="?", const=",".join(str(size) for size in DEFAULT_SWEEP_SIZES),
+                        help="Also build files of these sizes in MB from the input's bytes "
+                             f"(default: {','.join(str(size) for size in DEFAULT_SWEEP_SIZES)})")
+    args = parser.parse_args()
+    if not os.path.isfile(args.input) or os.path.getsize(args.input) == 0:
+        parser.error(f"{args.input} must be an existing, non-empty file")
+    args.chunk_sizes = [parse_size(value) for value in args.chunk_size.split(",")]
+    if min(args.chunk_sizes) < 1:
+        parser.error("--chunk-size must be positive")
+    args.sweep_sizes = [int(float(value) * MB) for value in args.sweep.split(",")] if args.sweep else []
+    if args.sweep_sizes and min(args.sweep_sizes) < 1:
+        parser.error("--sweep sizes must be positive")
+    return args
+
+def main():
+    args = parse_args()
+    stem, ext = os.path.splitext(os.path.basename(args.input))
+
+    # (source file, name sent to the server, directory label) per file size
+    sources = [] if args.sweep_sizes else [(args.input, os.path.basename(args.input), None)]
+    for size in args.sweep_sizes:
+        label = f"{stem}_{format_size(size)}"
+        os.makedirs(args.output_dir, exist_ok=True)
+        path = os.path.join(args.output_dir, label + ext)
+        write_sized_copy(args.input, size, path)
+        sources.append((path, label + ext, label))
+
+    single = len(sources) * len(args.chunk_sizes) == 1
+    for path, file_name, label in sources:
+        for chunk_size in args.chunk_sizes:
+            if single:
+                output_dir = args.output_dir
+            else:
+                output_dir = os.path.join(args.output_dir, f"{label or stem}_chunk{format_size(chunk_size)}")
+            manifest = split_file(path, chunk_size, output_dir, file_name)
+            print(f"{file_name}: {manifest['size']} bytes in {len(manifest['chunks'])} chunks of "
+                  f"{format_size(chunk_size)} -> {os.path.join(output_dir, MANIFEST_NAME)}")
+
+    print("Use a manifest in the contributor load test with -e CHUNK_MANIFEST=<path relative to load-test.js>")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,109 @@
+import bisect
+import hashlib
+import itertools
+import os
+import random
+import uuid
+from datetime import datetime
+
+
+def resolve_seed(seed):
+    # Without --seed, pick one at random and report it so the run can be repeated
+    return seed if seed is not None else random.SystemRandom().randrange(2 ** 32)
+
+def derive_rng(seed, index):
+    # Each row index (and each negative stream id) gets its own RNG derived from
+    # the run seed, so the output for a given seed is identical whatever the
+    # number of workers. Hashing the pair keeps every (seed, index) distinct:
+    # random.Random(n) seeds from abs(n), so arithmetic on the two would alias.
+    digest = hashlib.blake2b(f"{seed}:{index}".encode(), digest_size=16).digest()
+    return random.Random(int.from_bytes(digest, "big"))
+
+def new_uuid(rng):
+    return uuid.UUID(int=rng.getrandbits(128), version=4)
+
+def zipf_cumulative(n, exponent):
+    # Normalized cumulative Zipf weights for ranks 1..n (exponent 0 is uniform)
+    cumulative = list(itertools.accumulate(rank ** -exponent for rank in range(1, n + 1)))
+    total = cumulative[-1]
+    return [weight / total for weight in cumulative]
+
+class ZipfSampler:
+    """Picks from `items` with Zipf(exponent) popularity. Ranks are a seeded
+    shuffle of the items, so the hottest one is not simply the first listed.
+    With exponent 0 it draws exactly like rng.choice/rng.sample."""
+
+    def __init__(self, items, exponent, rng):
+        self.items = list(items)
+        self.exponent = exponent
+        if exponent:
+            rng.shuffle(self.items)
+        self.cumulative = zipf_cumulative(len(self.items), exponent)
+
+    def choice(self, rng):
+        if not self.exponent:
+            return rng.choice(self.items)
+        position = bisect.bisect_left(self.cumulative, rng.random())
+        return self.items[min(position, len(self.items) - 1)]
+
+    def sample(self, rng, k):
+        # Asking for more items than exist returns all of them
+        k = min(k, len(self.items))
+        if not self.exponent:
+            return rng.sample(self.items, k)
+        # Without replacement: each draw is scaled to the weight that is left
+        # and skips over the ranks already taken, so no draw is wasted on a
+        # duplicate however steep the skew is
+        cumulative = self.cumulative
+        last = len(cumulative) - 1
+        taken = []
+        chosen = []
+        remaining = 1.0
+        for _ in range(k):
+            target = rng.random() * remaining
+            for position in taken:
+                start = cumulative[position - 1] if position else 0.0
+                if target < start:
+                    break
+                target += cumulative[position] - start
+            position = min(bisect.bisect_right(cumulative, target), last)
+            # Float rounding can leave the target on the edge of a taken rank
+            while position in taken and position < last:
+                position += 1
+            while position in taken:
+                position -= 1
+            remaining -= cumulative[position] - (cumulative[position - 1] if position else 0.0)
+            bisect.insort(taken, position)
+            chosen.append(self.items[position])
+        return chosen
+
+    def manifest(self, key=lambda item: item):
+        return [{"id": key(item), "cumulative": round(weight, 9)}
+                for item, weight in zip(self.items, self.cumulative)]
+
+def parse_base_time(value):
+    return datetime.fromisoformat(value) if value else datetime.now().replace(microsecond=0)
+
+def shard_ranges(count, workers):
+    # Split [0, count) into at most `workers` contiguous index ranges
+    workers = max(1, min(workers, count))
+    size, extra = divmod(count, workers)
+    ranges = []
+    start = 0
+    for shard in range(workers):
+        end = start + size + (1 if shard < extra else 0)
+        ranges.append((start, end))
+        start = end
+    return ranges
+
+def shard_path(output_file, suffix):
+    stem, ext = os.path.splitext(output_file)
+    return f"{stem}_{suffix}{ext or '.sql'}"
+
+def add_seed_arguments(parser):
+    parser.add_argument("--seed", type=int, help="Seed for reproducible output (default: random, printed at the end)")
+    parser.add_argument("--workers", type=int, default=1,
+                        help="Generate in N processes, one output file per shard (default: 1)")
+    parser.add_argument("--base-time", help="Timestamp the generated dates are relative to, "
+                                            "e.g. 2025-06-01T00:00:00 (default: now); fix it together with --seed "
+                                            "to get byte-identical output")
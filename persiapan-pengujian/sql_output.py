@@ -0,0 +1,44 @@
+# Placeholder for the insertion timestamp: rendered as NOW() in INSERT
+# statements and as the generation time in COPY blocks.
+NOW = object()
+
+# statements: INSERTs per generated record; insert: multi-row INSERTs per
+# table per batch; copy: COPY ... FROM STDIN blocks per table per batch
+OUTPUT_FORMATS = ("statements", "insert", "copy")
+
+COPY_ESCAPES = (("\\", "\\\\"), ("\t", "\\t"), ("\n", "\\n"), ("\r", "\\r"))
+
+
+def sql_literal(value):
+    if value is None:
+        return "NULL"
+    if value is NOW:
+        return "NOW()"
+    if isinstance(value, (int, float)):
+        return str(value)
+    return "'" + str(value).replace("'", "''") + "'"
+
+def copy_field(value, now):
+    if value is None:
+        return "\\N"
+    if value is NOW:
+        return now
+    text = str(value)
+    # Most fields need no escaping; chained str.replace beats str.translate here
+    for char, escaped in COPY_ESCAPES:
+        if char in text:
+            text = text.replace(char, escaped)
+    return text
+
+def format_insert(table, columns, rows):
+    values = ",\n".join("(" + ", ".join(sql_literal(value) for value in row) + ")" for row in rows)
+    return f"INSERT INTO {table} ({', '.join(columns)})\nVALUES\n{values};\n"
+
+def format_copy(table, columns, rows, now):
+    lines = "".join("\t".join(copy_field(value, now) for value in row) + "\n" for row in rows)
+    return f"COPY {table} ({', '.join(columns)}) FROM STDIN;\n{lines}\\.\n"
+
+def block_writer(f, output_format, now):
+    if output_format == "copy":
+        return lambda table, columns, rows: f.write(format_copy(table, columns, rows, now) + "\n")
+    return lambda table, columns, rows: f.write(format_insert(table, columns, rows) + "\n")
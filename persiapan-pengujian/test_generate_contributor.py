@@ -0,0 +1,124 @@
+import glob
+import json
+import os
+import re
+import subprocess
+import sys
+
+import pytest
+
+from generate_contributor import write_delete_script, write_login_files
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+IN_LIST = re.compile(r"IN \((.*)\);$")
+
+
+def generate(output_dir, *args):
+    # units.json is read from the working directory
+    subprocess.run([sys.executable, "generate_contributor.py", "--seed", "3", "--base-time", "2025-06-01T00:00:00",
+                    "--output-dir", str(output_dir), *args], cwd=HERE, capture_output=True, check=True)
+
+
+def delete_batches(path):
+    # Each batch as (credential ids, user ids), between its BEGIN and COMMIT
+    batches, statements = [], None
+    with open(path) as f:
+        for line in f:
+            line = line.rstrip("\n")
+            if line == "BEGIN TRANSACTION;":
+                statements = []
+            elif line == "COMMIT;":
+                batches.append(tuple(statements))
+                statements = None
+            elif line.startswith("DELETE FROM"):
+                ids = IN_LIST.search(line).group(1)
+                statements.append((line.split()[2], [value.strip("'") for value in ids.split(", ")]))
+    return batches
+
+
+@pytest.mark.parametrize("count, batch_size, sizes", [(10, 4, [4, 4, 2]), (8, 4, [4, 4]), (3, 1000, [3])])
+def test_delete_script_is_batched(tmp_path, count, batch_size, sizes):
+    user_ids = [f"00000000-0000-4000-8000-{i:012d}" for i in range(count)]
+    path = tmp_path / "delete_contributors.sql"
+
+    write_delete_script(str(path), user_ids, batch_size)
+
+    batches = delete_batches(path)
+    assert [len(batch[0][1]) for batch in batches] == sizes
+    for credentials, users in batches:
+        # Credentials first, because of the foreign key to users
+        assert credentials[0] == "user_credentials" and users[0] == "users"
+        assert credentials[1] == users[1]
+    assert [user_id for batch in batches for user_id in batch[1][1]] == user_ids
+
+
+def test_empty_delete_script_has_no_batches(tmp_path):
+    path = tmp_path / "delete_contributors.sql"
+    write_delete_script(str(path), [], 10)
+    assert delete_batches(path) == []
+
+
+def test_delete_script_covers_every_sharded_insert(tmp_path):
+    generate(tmp_path, "--count", "25", "--workers", "3", "--format", "copy", "--delete-batch-size", "7")
+
+    inserted = []
+    for path in sorted(glob.glob(str(tmp_path / "insert_contributors_*.sql"))):
+        with open(path) as f:
+            in_users = False
+            for line in f:
+                if line.startswith("COPY "):
+                    in_users = line.startswith("COPY users ")
+                elif line.startswith("\\."):
+                    in_users = False
+                elif in_users:
+                    inserted.append(line.split("\t")[0])
+
+    batches = delete_batches(tmp_path / "delete_contributors.sql")
+    assert [len(batch[1][1]) for batch in batches] == [7, 7, 7, 4]
+    assert [user_id for batch in batches for user_id in batch[1][1]] == inserted
+    assert len(set(inserted)) == 25
+
+
+def read_login_shards(output_dir):
+    # As the load test does: shard files are named in the index, next to it
+    with open(os.path.join(output_dir, "contributor_logins_index.json")) as f:
+        index = json.load(f)
+    shards = []
+    for shard in index["shards"]:
+        with open(os.path.join(output_dir, shard["file"])) as f:
+            shards.append(json.load(f))
+        assert len(shards[-1]) == shard["count"]
+    return index["total"], shards
+
+
+@pytest.mark.parametrize("count, shards", [(10, 3), (7, 7), (1000, 6)])
+def test_login_shards_are_disjoint_and_cover_every_account(tmp_path, count, shards):
+    login_data = [{"user": f"budi.santoso{i + 1000}"} for i in range(count)]
+
+    paths = write_login_files(str(tmp_path), login_data, shards)
+
+    total, shard_logins = read_login_shards(tmp_path)
+    assert len(paths) == shards + 1 and total == count
+    users = [login["user"] for logins in shard_logins for login in logins]
+    assert users == [login["user"] for login in login_data]
+    sizes = [len(logins) for logins in shard_logins]
+    assert min(sizes) >= 1 and max(sizes) - min(sizes) <= 1
+
+
+def test_single_login_file_has_no_index(tmp_path):
+    paths = write_login_files(str(tmp_path), [{"user": "a"}, {"user": "b"}], 1)
+
+    assert [os.path.basename(path) for path in paths] == ["contributor_logins.json"]
+    assert not os.path.exists(tmp_path / "contributor_logins_index.json")
+
+
+def test_login_shards_do_not_depend_on_the_worker_count(tmp_path):
+    generate(tmp_path / "single", "--count", "20")
+    generate(tmp_path / "sharded", "--count", "20", "--workers", "3", "--login-shards", "4")
+
+    with open(tmp_path / "single" / "contributor_logins.json") as f:
+        expected = json.load(f)
+    total, shards = read_login_shards(tmp_path / "sharded")
+    assert total == 20 and len(shards) == 4
+    assert [login for logins in shards for login in logins] == expected
+    assert len({login["user"] for login in expected}) == 20
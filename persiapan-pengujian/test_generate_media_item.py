@@ -0,0 +1,75 @@
+import glob
+import os
+import subprocess
+import sys
+
+import pytest
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+SEED_ARGS = ["--seed", "7", "--base-time", "2025-06-01T00:00:00", "--count", "23", "--batch-size", "4",
+             "--unit-skew", "1.2", "--tag-skew", "0.8"]
+
+
+def generate(tmp_path, name, output_format, workers):
+    output = tmp_path / name / "media.sql"
+    output.parent.mkdir()
+    manifest = output.parent / "manifest.json"
+    # units.json/categories.json are read from the working directory
+    result = subprocess.run(
+        [sys.executable, "generate_media_item.py", *SEED_ARGS, "--format", output_format,
+         "--workers", str(workers), "--output", str(output), "--manifest", str(manifest)],
+        cwd=HERE, capture_output=True, text=True, check=True)
+    assert "Error:" not in result.stdout
+    return sorted(glob.glob(str(output.parent / "media*.sql"))), manifest.read_text()
+
+
+def copy_rows(paths):
+    # Data rows per table, in file order
+    rows = {}
+    for path in paths:
+        table = None
+        with open(path) as f:
+            for line in f:
+                line = line.rstrip("\n")
+                if line.startswith("COPY "):
+                    table = line.split()[1]
+                elif line == "\\.":
+                    table = None
+                elif table is not None:
+                    rows.setdefault(table, []).append(line)
+    return rows
+
+
+def item_statements(paths):
+    # The statements of each item, keyed by its "-- Media Item N" header
+    items = {}
+    for path in paths:
+        current = None
+        with open(path) as f:
+            for line in f:
+                if line.startswith("-- Media Item "):
+                    current = items.setdefault(line, [])
+                elif current is not None:
+                    current.append(line)
+    return items
+
+
+def test_copy_rows_do_not_depend_on_the_worker_count(tmp_path):
+    single, single_manifest = generate(tmp_path, "single", "copy", 1)
+    sharded, sharded_manifest = generate(tmp_path, "sharded", "copy", 3)
+
+    assert len(single) == 1 and len(sharded) == 4
+    expected = copy_rows(single)
+    assert len(expected["media_items"]) == 23 and len(expected["tags"]) == 100
+    assert copy_rows(sharded) == expected
+    assert sharded_manifest == single_manifest
+
+
+@pytest.mark.parametrize("workers", [2, 5])
+def test_statements_do_not_depend_on_the_worker_count(tmp_path, workers):
+    single, _ = generate(tmp_path, "single", "statements", 1)
+    sharded, _ = generate(tmp_path, "sharded", "statements", workers)
+
+    expected = item_statements(single)
+    assert len(expected) == 23
+    assert item_statements(sharded) == expected
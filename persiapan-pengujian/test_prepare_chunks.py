@@ -0,0 +1,71 @@
+import hashlib
+import json
+import os
+
+import pytest
+
+from prepare_chunks import MANIFEST_NAME, format_size, parse_size, split_file, write_sized_copy
+
+CONTENT = bytes(range(256)) * 40 + b"ekor"
+
+
+@pytest.fixture
+def media_file(tmp_path):
+    path = tmp_path / "shot12.mp4"
+    path.write_bytes(CONTENT)
+    return str(path)
+
+
+@pytest.mark.parametrize("chunk_size", [1000, 1024, len(CONTENT), len(CONTENT) + 1])
+def test_manifest_describes_every_chunk(media_file, tmp_path, chunk_size):
+    output_dir = tmp_path / "chunks"
+
+    manifest = split_file(media_file, chunk_size, str(output_dir))
+
+    with open(output_dir / MANIFEST_NAME) as f:
+        assert json.load(f) == manifest
+    assert manifest["file_name"] == "shot12.mp4" and manifest["file_type"] == "video/mp4"
+    assert manifest["size"] == len(CONTENT) and manifest["chunk_size"] == chunk_size
+    assert manifest["sha256"] == hashlib.sha256(CONTENT).hexdigest()
+
+    chunks = manifest["chunks"]
+    assert len(chunks) == -(-len(CONTENT) // chunk_size)
+    expected_offset = 0
+    for index, chunk in enumerate(chunks):
+        data = (output_dir / chunk["file"]).read_bytes()
+        assert chunk["index"] == index and chunk["offset"] == expected_offset
+        assert data == CONTENT[chunk["offset"]:chunk["offset"] + chunk["size"]]
+        assert chunk["sha256"] == hashlib.sha256(data).hexdigest()
+        expected_offset += chunk["size"]
+    assert expected_offset == len(CONTENT)
+    assert all(chunk["size"] == chunk_size for chunk in chunks[:-1])
+
+
+def test_file_name_overrides_the_input_name(media_file, tmp_path):
+    manifest = split_file(media_file, 4096, str(tmp_path / "chunks"), "shot12_1MB.mp4")
+    assert manifest["file_name"] == "shot12_1MB.mp4"
+
+
+def test_empty_input_is_rejected(tmp_path):
+    path = tmp_path / "kosong.mp4"
+    path.write_bytes(b"")
+
+    with pytest.raises(ValueError, match="empty"):
+        split_file(str(path), 1024, str(tmp_path / "chunks"))
+    with pytest.raises(ValueError, match="empty"):
+        write_sized_copy(str(path), 1024, str(tmp_path / "copy.mp4"))
+    assert not os.path.exists(tmp_path / "chunks")
+
+
+@pytest.mark.parametrize("size", [10, len(CONTENT), 3 * len(CONTENT) + 7])
+def test_sized_copy_repeats_the_input(media_file, tmp_path, size):
+    path = tmp_path / "copy.mp4"
+    write_sized_copy(media_file, size, str(path))
+    assert path.read_bytes() == (CONTENT * 4)[:size]
+
+
+@pytest.mark.parametrize("text, size", [("1048576", 1048576), ("512KB", 512 * 1024), ("5mb", 5 * 1024 * 1024),
+                                        ("1.5MB", 1572864), ("100B", 100)])
+def test_sizes_round_trip(text, size):
+    assert parse_size(text) == size
+    assert parse_size(format_size(size)) == size
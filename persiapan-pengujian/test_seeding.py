@@ -0,0 +1,80 @@
+import random
+
+import pytest
+
+from seeding import ZipfSampler, derive_rng, shard_ranges
+
+
+def draws(rng, n=5):
+    return [rng.random() for _ in range(n)]
+
+
+def test_derive_rng_is_reproducible():
+    assert draws(derive_rng(42, 7)) == draws(derive_rng(42, 7))
+
+
+@pytest.mark.parametrize("seed", [0, 1, 42])
+def test_stream_ids_do_not_alias_row_rngs(seed):
+    # Negative ids are the tag/ranking/popularity streams, non-negative ids are rows
+    sequences = [tuple(draws(derive_rng(seed, index))) for index in range(-3, 4)]
+    assert len(set(sequences)) == len(sequences)
+
+
+def test_negative_seeds_have_their_own_streams():
+    assert draws(derive_rng(-5, 3)) != draws(derive_rng(5, 3))
+    assert draws(derive_rng(1, 0)) != draws(derive_rng(0, 1))
+
+
+@pytest.mark.parametrize("count, workers", [(10, 3), (3, 8), (1000, 7), (5, 1)])
+def test_shard_ranges_cover_every_index_once(count, workers):
+    ranges = shard_ranges(count, workers)
+    assert len(ranges) == min(count, workers)
+    assert [index for start, end in ranges for index in range(start, end)] == list(range(count))
+    sizes = [end - start for start, end in ranges]
+    assert max(sizes) - min(sizes) <= 1
+
+
+def test_zipf_sampler_without_skew_matches_random():
+    items = list(range(20))
+    sampler = ZipfSampler(items, 0, random.Random(1))
+    assert [sampler.choice(random.Random(seed)) for seed in range(10)] == \
+        [random.Random(seed).choice(items) for seed in range(10)]
+
+
+def test_zipf_sampler_prefers_its_hottest_item():
+    sampler = ZipfSampler(range(100), 1.2, random.Random(1))
+    rng = random.Random(2)
+    picks = [sampler.choice(rng) for _ in range(2000)]
+    assert max(set(picks), key=picks.count) == sampler.items[0]
+    assert len(set(sampler.sample(rng, 10))) == 10
+
+
+@pytest.mark.parametrize("exponent", [0, 1.2])
+def test_zipf_sample_is_capped_at_the_population(exponent):
+    sampler = ZipfSampler(range(3), exponent, random.Random(1))
+    assert sorted(sampler.sample(random.Random(2), 5)) == [0, 1, 2]
+
+
+def test_zipf_sample_with_a_steep_skew_draws_distinct_items():
+    sampler = ZipfSampler(range(1000), 6, random.Random(1))
+    rng = random.Random(3)
+    for _ in range(200):
+        picks = sampler.sample(rng, 5)
+        assert len(set(picks)) == 5
+
+
+def test_zipf_sample_draws_without_replacement_in_proportion_to_weight():
+    sampler = ZipfSampler("abc", 1, random.Random(1))
+    weights = dict(zip(sampler.items, [1, 1 / 2, 1 / 3]))
+    total = sum(weights.values())
+    rng = random.Random(4)
+    draws = 30000
+    counts = {}
+    for _ in range(draws):
+        pair = tuple(sampler.sample(rng, 2))
+        counts[pair] = counts.get(pair, 0) + 1
+
+    for (first, second), count in counts.items():
+        expected = weights[first] / total * weights[second] / (total - weights[first])
+        assert count / draws == pytest.approx(expected, abs=0.01)
+    assert len(counts) == 6
@@ -0,0 +1,77 @@
+import io
+
+import pytest
+
+from sql_output import NOW, block_writer, copy_field, format_copy, format_insert, sql_literal
+
+COLUMNS = ["id", "title", "views", "deleted_at", "created_at"]
+ROWS = [
+    ["a1", "Gedung Rektorat", 3, None, NOW],
+    ["b2", "Kata 'kutip'\tdan\\garis\nbaru", 0.5, None, NOW],
+]
+GENERATED_AT = "2025-06-01 00:00:00"
+
+
+def unescape_copy(field):
+    if field == "\\N":
+        return None
+    escapes = {"\\\\": "\\", "\\t": "\t", "\\n": "\n", "\\r": "\r"}
+    out, i = [], 0
+    while i < len(field):
+        pair = field[i:i + 2]
+        if pair in escapes:
+            out.append(escapes[pair])
+            i += 2
+        else:
+            out.append(field[i])
+            i += 1
+    return "".join(out)
+
+
+@pytest.mark.parametrize("value, literal", [
+    (None, "NULL"), (NOW, "NOW()"), (7, "7"), (2.5, "2.5"), ("O'Brien", "'O''Brien'"), (True, "True"),
+])
+def test_sql_literals(value, literal):
+    assert sql_literal(value) == literal
+
+
+def test_multi_row_insert():
+    assert format_insert("media_items", COLUMNS, ROWS[:1] * 2) == (
+        "INSERT INTO media_items (id, title, views, deleted_at, created_at)\n"
+        "VALUES\n"
+        "('a1', 'Gedung Rektorat', 3, NULL, NOW()),\n"
+        "('a1', 'Gedung Rektorat', 3, NULL, NOW());\n"
+    )
+
+
+def test_copy_block():
+    assert format_copy("media_items", COLUMNS, ROWS[:1], GENERATED_AT) == (
+        "COPY media_items (id, title, views, deleted_at, created_at) FROM STDIN;\n"
+        "a1\tGedung Rektorat\t3\t\\N\t2025-06-01 00:00:00\n"
+        "\\.\n"
+    )
+
+
+def test_copy_fields_round_trip_through_escaping():
+    block = format_copy("media_items", COLUMNS, ROWS, GENERATED_AT)
+    lines = block.split("\n")[1:-1]
+
+    assert lines[-1] == "\\."
+    parsed = [[unescape_copy(field) for field in line.split("\t")] for line in lines[:-1]]
+    expected = [[None if value is None else GENERATED_AT if value is NOW else str(value) for value in row]
+                for row in ROWS]
+    assert parsed == expected
+    assert copy_field("tab\there", GENERATED_AT) == "tab\\there"
+
+
+@pytest.mark.parametrize("output_format, start", [("copy", "COPY units"), ("insert", "INSERT INTO units"),
+                                                  ("statements", "INSERT INTO units")])
+def test_block_writer_separates_blocks(output_format, start):
+    f = io.StringIO()
+    write = block_writer(f, output_format, GENERATED_AT)
+    write("units", ["id"], [[1]])
+    write("units", ["id"], [[2]])
+
+    blocks = f.getvalue().split("\n\n")
+    assert len(blocks) == 3 and blocks[-1] == ""
+    assert all(block.startswith(start) for block in blocks[:2])
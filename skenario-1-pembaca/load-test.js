@@ -2,6 +2,7 @@ import http from "k6/http";
 import { sleep, check, group } from "k6";
 import { randomItem, randomIntBetween } from "https://jslib.k6.io/k6-utils/1.2.0/index.js";
 import { Trend, Rate, Counter } from "k6/metrics";
+import { SharedArray } from "k6/data";
 
 export const options = {
   stages: [
@@ -44,6 +45,57 @@ const metrics = {
 
 const BASE_URL = "https://backend.ui-heritage.me/api/v1";
 
+// Optional popularity manifest from persiapan-pengujian/generate_media_item.py,
+// e.g. -e POPULARITY_MANIFEST=../persiapan-pengujian/popularity_manifest.json.
+// Without it, items, units and categories are picked uniformly.
+const POPULARITY_MANIFEST = __ENV.POPULARITY_MANIFEST;
+
+function loadPopularity(key) {
+  return new SharedArray(`popularity_${key}`, () => JSON.parse(open(POPULARITY_MANIFEST))[key]);
+}
+
+const hotItems = POPULARITY_MANIFEST ? loadPopularity("hot_items") : null;
+const popularUnits = POPULARITY_MANIFEST ? loadPopularity("units") : null;
+const popularCategories = POPULARITY_MANIFEST ? loadPopularity("categories") : null;
+const hotShare = hotItems && hotItems.length > 0 ? hotItems[hotItems.length - 1].cumulative : 0;
+
+// Entries are sorted by rank with cumulative probabilities; binary search for r
+function pickWeighted(entries, r) {
+  let low = 0;
+  let high = entries.length - 1;
+  while (low < high) {
+    const mid = (low + high) >> 1;
+    if (entries[mid].cumulative > r) {
+      high = mid;
+    } else {
+      low = mid + 1;
+    }
+  }
+  return entries[low].id;
+}
+
+function pickUnitId(availableUnits) {
+  return popularUnits && popularUnits.length > 0
+    ? pickWeighted(popularUnits, Math.random())
+    : randomItem(availableUnits).id;
+}
+
+function pickCategoryId(availableCategories) {
+  return popularCategories && popularCategories.length > 0
+    ? pickWeighted(popularCategories, Math.random())
+    : randomItem(availableCategories).id;
+}
+
+// Hot items come from the manifest in proportion to their popularity; the
+// cold tail falls back to a random item from the search results
+function pickMediaItemId(mediaItems) {
+  const r = Math.random();
+  if (hotItems && r < hotShare) {
+    return pickWeighted(hotItems, r);
+  }
+  return mediaItems && mediaItems.length > 0 ? randomItem(mediaItems).id : null;
+}
+
 let cachedUnits = [];
 let cachedCategories = [];
 
@@ -144,12 +196,12 @@ function buildSearchParams() {
       if (filterType < 0.33) {
         const availableUnits = fetchUnits(headers);
         if (availableUnits.length > 0) {
-          params.push(`unit=${randomItem(availableUnits).id}`);
+          params.push(`unit=${pickUnitId(availableUnits)}`);
         }
       } else if (filterType < 0.66) {
         const availableCategories = fetchCategories(headers);
         if (availableCategories.length > 0) {
-          params.push(`category=${randomItem(availableCategories).id}`);
+          params.push(`category=${pickCategoryId(availableCategories)}`);
         }
       } else {
         const startDate = randomDate();
@@ -162,12 +214,12 @@ function buildSearchParams() {
     } else {
       const availableUnits = fetchUnits(headers);
       if (availableUnits.length > 0) {
-        params.push(`unit=${randomItem(availableUnits).id}`);
+        params.push(`unit=${pickUnitId(availableUnits)}`);
       }
 
       const availableCategories = fetchCategories(headers);
       if (availableCategories.length > 0) {
-        params.push(`category=${randomItem(availableCategories).id}`);
+        params.push(`category=${pickCategoryId(availableCategories)}`);
 
         if (Math.random() < 0.5) {
           const startDate = randomDate();
@@ -262,10 +314,7 @@ export default function () {
     }
 
     try {
-      const mediaItems = JSON.parse(mediaItemsResponse.body).data;
-      if (mediaItems && mediaItems.length > 0) {
-        mediaItemId = randomItem(mediaItems).id;
-      }
+      mediaItemId = pickMediaItemId(JSON.parse(mediaItemsResponse.body).data);
     } catch (e) {
       console.log("Error parsing media items response:", e);
     }
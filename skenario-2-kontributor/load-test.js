@@ -3,6 +3,7 @@ import { sleep, check, group } from "k6";
 import { randomItem, randomIntBetween } from "https://jslib.k6.io/k6-utils/1.2.0/index.js";
 import { Trend, Rate, Counter } from "k6/metrics";
 import { SharedArray } from "k6/data";
+import exec from "k6/execution";
 
 export const options = {
   stages: [
@@ -143,16 +144,40 @@ function fetchUnits() {
   return activeUnits;
 }
 
+// Login accounts: by default the whole contributor_logins.json. For runs spread
+// over several load generators, set LOGIN_INDEX to the index written by
+// generate_contributor.py --login-shards and LOGIN_SHARD to this runner's shard
+// (from 0), so each runner loads only its own disjoint slice of accounts.
+const LOGIN_INDEX = __ENV.LOGIN_INDEX;
+const LOGIN_SHARD = parseInt(__ENV.LOGIN_SHARD || "0", 10);
+
+function loginShardPath() {
+  const index = JSON.parse(open(LOGIN_INDEX));
+  const shard = index.shards[LOGIN_SHARD];
+  if (!shard) {
+    throw new Error(`LOGIN_SHARD ${LOGIN_SHARD} not found in ${LOGIN_INDEX} (${index.shards.length} shards)`);
+  }
+  const directory = LOGIN_INDEX.slice(0, LOGIN_INDEX.lastIndexOf("/") + 1);
+  return directory + shard.file;
+}
+
 const contributors = new SharedArray("contributors", function () {
-  return JSON.parse(open("../contributor_logins.json"));
+  return JSON.parse(open(LOGIN_INDEX ? loginShardPath() : "../contributor_logins.json"));
 });
 
+const maxVUs = Math.max(...options.stages.map((stage) => stage.target));
+if (__VU === 0 && contributors.length < maxVUs) {
+  console.warn(`Only ${contributors.length} accounts for up to ${maxVUs} VUs; some accounts will be shared`);
+}
+
 const affPngContent = open("./test_data/AFF_PPT.png", "b");
-const shot12MP4Content = open("./test_data/shot12.mp4", "b");
-const chunk0Content = open("./test_data/chunks/chunk_0", "b");
-const chunk1Content = open("./test_data/chunks/chunk_1", "b");
-const chunk2Content = open("./test_data/chunks/chunk_2", "b");
-const chunk3Content = open("./test_data/chunks/chunk_3", "b");
+// Chunked upload payload, prepared by persiapan-pengujian/prepare_chunks.py.
+// Point CHUNK_MANIFEST at another manifest to test other file or chunk sizes.
+// Every VU holds all chunks in memory, so keep sweep files modest at high VU counts.
+const CHUNK_MANIFEST = __ENV.CHUNK_MANIFEST || "./test_data/chunks/manifest.json";
+const chunkManifest = JSON.parse(open(CHUNK_MANIFEST));
+const chunkDirectory = CHUNK_MANIFEST.slice(0, CHUNK_MANIFEST.lastIndexOf("/") + 1);
+const chunkContents = chunkManifest.chunks.map((chunk) => open(chunkDirectory + chunk.file, "b"));
 
 const MEDIA_TYPE = {
   ARTIKEL: 1,
@@ -324,7 +349,17 @@ function uploadSmallFile(token) {
   };
 }
 
-function initiateLargeFileUpload(token) {
+// Attach per-point values (upload_ref, chunk_bytes, chunk_count) as point metadata
+// rather than tags, so they do not create a new time series for every iteration
+function addWithMetadata(metric, value, metadata) {
+  Object.assign(exec.vu.metadata, metadata);
+  metric.add(value);
+  for (const key of Object.keys(metadata)) {
+    delete exec.vu.metadata[key];
+  }
+}
+
+function initiateLargeFileUpload(token, uploadRef) {
   metrics.large_file_upload_init_requests.add(1);
 
   const now = new Date();
@@ -332,18 +367,18 @@ function initiateLargeFileUpload(token) {
   const month = String(now.getMonth() + 1).padStart(2, "0");
   const day = String(now.getDate()).padStart(2, "0");
 
-  console.log(`Initiating large file upload with initialize=true for shot12.mp4`);
+  console.log(`Initiating large file upload with initialize=true for ${chunkManifest.file_name}`);
 
-  const fileSize = shot12MP4Content.byteLength;
+  const fileSize = chunkManifest.size;
   
   const dummyContent = new Uint8Array(1).buffer;
   
   const formData = {
     file: http.file(dummyContent, "dummy.txt", "text/plain"),
-    fileName: "shot 12.mp4",
+    fileName: chunkManifest.file_name,
     initialize: "true",
     fileSize: fileSize.toString(),
-    fileType: "video/mp4",
+    fileType: chunkManifest.file_type,
     eventYear: year,
     eventMonth: month,
     eventDay: day,
@@ -359,7 +394,7 @@ function initiateLargeFileUpload(token) {
   });
   const endTime = new Date();
 
-  metrics.large_file_upload_init_duration.add(endTime - startTime);
+  addWithMetadata(metrics.large_file_upload_init_duration, endTime - startTime, { upload_ref: uploadRef });
 
   console.log(`Large file init response status: ${uploadResponse.status}`);
   console.log(`Response body: ${uploadResponse.body}`);
@@ -384,6 +419,9 @@ function initiateLargeFileUpload(token) {
   }
 
   const responseBody = JSON.parse(uploadResponse.body);
+  if (responseBody.data.chunkSize && responseBody.data.chunkSize !== chunkManifest.chunk_size) {
+    console.log(`Server chunkSize ${responseBody.data.chunkSize} differs from manifest chunk_size ${chunkManifest.chunk_size}`);
+  }
   return {
     uploadId: responseBody.data.uploadId,
     chunkSize: responseBody.data.chunkSize,
@@ -391,20 +429,12 @@ function initiateLargeFileUpload(token) {
   };
 }
 
-function uploadChunk(token, uploadId, chunkNumber) {
+function uploadChunk(token, uploadId, chunkNumber, uploadRef) {
   metrics.chunk_upload_requests.add(1);
 
-  let chunkContent;
-  if (chunkNumber === 0) {
-    chunkContent = chunk0Content;
-  } else if (chunkNumber === 1) {
-    chunkContent = chunk1Content;
-  } else if (chunkNumber === 2) {
-    chunkContent = chunk2Content;
-  } else if (chunkNumber === 3) {
-    chunkContent = chunk3Content;
-  } else {
-    console.log(`Error: Chunk number ${chunkNumber} is out of range (0-3)`);
+  const chunkContent = chunkContents[chunkNumber];
+  if (!chunkContent) {
+    console.log(`Error: Chunk number ${chunkNumber} is out of range (0-${chunkContents.length - 1})`);
     metrics.chunk_upload_failed.add(1);
     return false;
   }
@@ -426,7 +456,10 @@ function uploadChunk(token, uploadId, chunkNumber) {
   });
   const endTime = new Date();
 
-  metrics.chunk_upload_duration.add(endTime - startTime);
+  addWithMetadata(metrics.chunk_upload_duration, endTime - startTime, {
+    upload_ref: uploadRef,
+    chunk_bytes: String(chunkContent.byteLength),
+  });
 
   console.log(`Chunk ${chunkNumber} upload response: ${chunkResponse.status}`);
   if (chunkResponse.status !== 200) {
@@ -446,7 +479,7 @@ function uploadChunk(token, uploadId, chunkNumber) {
   return true;
 }
 
-function completeUpload(token, uploadId) {
+function completeUpload(token, uploadId, uploadRef, totalChunks) {
   metrics.complete_upload_requests.add(1);
 
   const formData = {
@@ -462,7 +495,11 @@ function completeUpload(token, uploadId) {
   });
   const endTime = new Date();
 
-  metrics.complete_upload_duration.add(endTime - startTime);
+  // chunk_count lets the processor wait for chunk points written after this one
+  addWithMetadata(metrics.complete_upload_duration, endTime - startTime, {
+    upload_ref: uploadRef,
+    chunk_count: String(totalChunks),
+  });
 
   console.log(`Complete upload response: ${completeResponse.status}`);
   if (completeResponse.status !== 200) {
@@ -618,7 +655,8 @@ export default function () {
 
   const startIterationTime = new Date();
 
-  const contributor = randomItem(contributors);
+  // One account per VU, so no two VUs on this runner log in as the same user
+  const contributor = contributors[(__VU - 1) % contributors.length];
 
   group("Step 1: SSO Login", function () {
     const loginInfo = performLogin(contributor);
@@ -651,19 +689,20 @@ export default function () {
       } else if (mediaType === MEDIA_TYPE.VIDEO) {
         console.log("Uploading video file");
 
-        const initiateInfo = initiateLargeFileUpload(token);
+        const uploadRef = `${__VU}:${__ITER}`;
+        const initiateInfo = initiateLargeFileUpload(token, uploadRef);
 
         if (initiateInfo) {
           sleep(randomIntBetween(0.8, 1.5));
 
-          const totalChunks = 4;
+          const totalChunks = chunkContents.length;
 
           console.log(`Will upload ${totalChunks} chunks for video`);
 
           let allChunksSuccess = true;
           for (let i = 0; i < totalChunks; i++) {
             console.log(`Uploading chunk ${i} of ${totalChunks}`);
-            const chunkSuccess = uploadChunk(token, initiateInfo.uploadId, i);
+            const chunkSuccess = uploadChunk(token, initiateInfo.uploadId, i, uploadRef);
             if (!chunkSuccess) {
               allChunksSuccess = false;
               break;
@@ -675,7 +714,7 @@ export default function () {
             sleep(randomIntBetween(1, 2));
 
             console.log("Completing chunked upload");
-            const fileInfo = completeUpload(token, initiateInfo.uploadId);
+            const fileInfo = completeUpload(token, initiateInfo.uploadId, uploadRef, totalChunks);
             if (fileInfo) {
               files.push(fileInfo);
             }
@@ -698,17 +737,18 @@ export default function () {
 
           sleep(randomIntBetween(2, 4));
 
-          const initiateInfo = initiateLargeFileUpload(token);
+          const uploadRef = `${__VU}:${__ITER}`;
+          const initiateInfo = initiateLargeFileUpload(token, uploadRef);
 
           if (initiateInfo) {
             sleep(randomIntBetween(0.8, 1.5));
 
-            const totalChunks = 4;
+            const totalChunks = chunkContents.length;
 
             let allChunksSuccess = true;
             for (let i = 0; i < totalChunks; i++) {
               console.log(`Uploading chunk ${i} of ${totalChunks} for gallery video`);
-              const chunkSuccess = uploadChunk(token, initiateInfo.uploadId, i);
+              const chunkSuccess = uploadChunk(token, initiateInfo.uploadId, i, uploadRef);
               if (!chunkSuccess) {
                 allChunksSuccess = false;
                 break;
@@ -719,7 +759,7 @@ export default function () {
             if (allChunksSuccess) {
               sleep(randomIntBetween(1, 2));
               console.log("Completing gallery video upload");
-              const fileInfo = completeUpload(token, initiateInfo.uploadId);
+              const fileInfo = completeUpload(token, initiateInfo.uploadId, uploadRef, totalChunks);
               if (fileInfo) {
                 files.push(fileInfo);
               }